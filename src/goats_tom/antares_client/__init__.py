@@ -1,3 +1,3 @@
-from .client import get_by_id, search
+from .client import AntaresHTTPClient, get_by_id, http_client, search
 
-__all__ = ["search", "get_by_id"]
+__all__ = ["search", "get_by_id", "AntaresHTTPClient", "http_client"]
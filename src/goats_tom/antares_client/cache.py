@@ -0,0 +1,105 @@
+"""Cache of ANTARES API responses."""
+
+__all__ = [
+    "ANTARES_CACHE_ALIAS",
+    "CACHE_TIMEOUTS",
+    "build_cache_key",
+    "get_cached",
+    "set_cached",
+]
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+# Name of the dedicated cache in ``settings.CACHES``. A local-memory cache is used for
+# it because it evicts the least recently used entries once ``MAX_ENTRIES`` is reached.
+ANTARES_CACHE_ALIAS = "antares"
+# Seconds each kind of response is cached for. Listings change with every new alert,
+# while catalog matches of a locus rarely change.
+CACHE_TIMEOUTS = {
+    "listing": 60,
+    "alerts": 5 * 60,
+    "locus": 5 * 60,
+    "catalog_matches": 24 * 60 * 60,
+}
+# Larger responses are not cached so a few long lightcurves can't evict everything.
+# Together with ``MAX_ENTRIES`` of the cache, this bounds the memory used by each
+# process, about 50 MiB with 200 entries.
+MAX_CACHED_BYTES = 256 * 1024
+
+
+def _get_cache() -> BaseCache:
+    """Returns the ANTARES cache, falling back to the default cache if not configured.
+
+    Returns
+    -------
+    `BaseCache`
+        The cache to store responses in.
+    """
+    if ANTARES_CACHE_ALIAS in settings.CACHES:
+        return caches[ANTARES_CACHE_ALIAS]
+    return caches["default"]
+
+
+def build_cache_key(url: str, params: Optional[dict] = None) -> str:
+    """Builds the cache key of a request from its URL and parameters.
+
+    Parameters
+    ----------
+    url : `str`
+        The URL of the request.
+    params : `dict | None`, optional
+        The query parameters of the request, by default `None`.
+
+    Returns
+    -------
+    `str`
+        The cache key.
+    """
+    request = json.dumps([url, params or {}], sort_keys=True, default=str)
+    return f"antares:{hashlib.sha256(request.encode()).hexdigest()}"
+
+
+def get_cached(url: str, params: Optional[dict] = None) -> Optional[Any]:
+    """Gets the cached body of a request.
+
+    Parameters
+    ----------
+    url : `str`
+        The URL of the request.
+    params : `dict | None`, optional
+        The query parameters of the request, by default `None`.
+
+    Returns
+    -------
+    `Any | None`
+        The parsed body, or `None` if it is not cached.
+    """
+    return _get_cache().get(build_cache_key(url, params))
+
+
+def set_cached(
+    url: str, params: Optional[dict], body: Any, kind: str, size: int
+) -> None:
+    """Caches the body of a successful request for the timeout of its kind.
+
+    Parameters
+    ----------
+    url : `str`
+        The URL of the request.
+    params : `dict | None`
+        The query parameters of the request.
+    body : `Any`
+        The parsed body.
+    kind : `str`
+        The kind of response, one of the keys of `CACHE_TIMEOUTS`.
+    size : `int`
+        The size of the response in bytes.
+    """
+    if size > MAX_CACHED_BYTES:
+        return
+    _get_cache().set(build_cache_key(url, params), body, CACHE_TIMEOUTS[kind])
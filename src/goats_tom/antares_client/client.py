@@ -11,10 +11,16 @@ As soon as the client issues are resolved, we hope to remove this and rely on th
 client.
 """
 
-__all__ = ["search", "get_by_id"]
+__all__ = ["search", "get_by_id", "AntaresHTTPClient", "http_client"]
 
 import datetime
+import email.utils
 import json
+import logging
+import queue
+import random
+import threading
+import time
 from collections import defaultdict
 from io import StringIO
 from typing import Any, Dict, Iterator, List, Optional, Type
@@ -23,14 +29,20 @@ from urllib.parse import urljoin
 import astropy.time
 import astropy.timeseries
 import marshmallow
+import numpy as np
 import pandas as pd
 import requests
 from astropy.coordinates import SkyCoord
 from marshmallow import fields, post_load
 from marshmallow_jsonapi import Schema
 from marshmallow_jsonapi import fields as jfields
+from requests.adapters import HTTPAdapter
 from typing_extensions import TypedDict
 
+from .cache import get_cached, set_cached
+
+logger = logging.getLogger(__name__)
+
 
 def mjd_to_datetime(mjd):
     time = astropy.time.Time(mjd, format="mjd")
@@ -66,8 +78,196 @@ QueryParams = TypedDict(
 config = {
     "ANTARES_API_BASE_URL": "https://api.antares.noirlab.edu/v1/",
     "API_TIMEOUT": 60,
+    # Number of keep-alive connections kept open to the API.
+    "POOL_SIZE": 10,
+    # Number of times a failed request is retried.
+    "MAX_RETRIES": 3,
+    # Seconds to back off before the first retry, doubled on each retry.
+    "BACKOFF_FACTOR": 0.5,
+    # Longest wait in seconds before a retry, including those asked by the API.
+    "BACKOFF_MAX": 30,
+    # Number of result pages fetched ahead of the one being read.
+    "READ_AHEAD_PAGES": 1,
+}
+
+# Columns of lightcurves that are read, with their types. Declaring them skips type
+# inference, and other columns are not parsed at all.
+LIGHTCURVE_DTYPES = {
+    "alert_id": "str",
+    "ant_mjd": "float64",
+    "ant_survey": "Int64",
+    "ant_ra": "float64",
+    "ant_dec": "float64",
+    "ant_passband": "category",
+    "ant_mag": "float64",
+    "ant_magerr": "float64",
+    "ant_maglim": "float64",
+    "ant_mag_corrected": "float64",
+    "ant_magerr_corrected": "float64",
+    "ant_magulim": "float64",
+    "ant_magllim": "float64",
 }
 
+# Status codes of responses worth retrying.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AntaresHTTPClient:
+    """HTTP client for the ANTARES API sharing a pool of keep-alive connections.
+
+    Requests failing with a connection error or a retryable status code are retried
+    with exponential backoff and full jitter, waiting as long as the API asks with
+    "Retry-After" when it does. The number of requests, retries, errors, bytes
+    received and the time spent are counted.
+
+    Parameters
+    ----------
+    pool_size : `int | None`, optional
+        The number of connections kept open, by default from the config.
+    max_retries : `int | None`, optional
+        The number of retries per request, by default from the config.
+    backoff_factor : `float | None`, optional
+        The seconds to back off before the first retry, by default from the config.
+    backoff_max : `float | None`, optional
+        The longest wait before a retry, by default from the config.
+    """
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+    ) -> None:
+        self.pool_size = pool_size or config["POOL_SIZE"]
+        self.max_retries = config["MAX_RETRIES"] if max_retries is None else max_retries
+        self.backoff_factor = (
+            config["BACKOFF_FACTOR"] if backoff_factor is None else backoff_factor
+        )
+        self.backoff_max = config["BACKOFF_MAX"] if backoff_max is None else backoff_max
+        self._session = self._create_session()
+        self._lock = threading.Lock()
+        self._stats = self._empty_stats()
+
+    def _create_session(self) -> requests.Session:
+        """Creates a session pooling connections for concurrent requests."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, float]:
+        return {"requests": 0, "retries": 0, "errors": 0, "bytes": 0, "seconds": 0.0}
+
+    def close(self) -> None:
+        """Closes the connections of the session."""
+        self._session.close()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """A copy of the request counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """Resets the request counters."""
+        with self._lock:
+            self._stats = self._empty_stats()
+
+    def _count(self, **increments: float) -> None:
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """Sends a GET request, retrying transient failures.
+
+        Parameters
+        ----------
+        url : `str`
+            The URL to request.
+        params : `Dict | None`, optional
+            The query parameters, by default `None`.
+
+        Returns
+        -------
+        `requests.Response`
+            The response, which may be an error once the retries are exhausted.
+
+        Raises
+        ------
+        requests.RequestException
+            Raised if the request still fails to connect after the retries.
+        """
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self._session.get(
+                    url, params=params, timeout=config["API_TIMEOUT"]
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self._count(requests=1, errors=1, seconds=time.perf_counter() - start)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                self._count(
+                    requests=1,
+                    bytes=len(response.content),
+                    seconds=time.perf_counter() - start,
+                )
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                self._count(errors=1)
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                elif delay > self.backoff_max:
+                    # Don't hold the caller longer than allowed, give up instead.
+                    return response
+
+            attempt += 1
+            self._count(retries=1)
+            logger.debug("Retrying %s in %.2f seconds.", url, delay)
+            time.sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        """Computes the exponential backoff with full jitter before a retry."""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_factor * 2**attempt)
+        )
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Parses the seconds to wait from the "Retry-After" header, if any."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max((retry_at - now).total_seconds(), 0.0)
+
+
+# Shared by all requests of the process so connections are reused.
+http_client = AntaresHTTPClient()
+
 
 class AlertGravWaveEvent(TypedDict):
     gracedb_id: str
@@ -143,6 +343,8 @@ class Locus:
         A list of IDs corresponding to user-submitted regional watch list objects.
     grav_wave_events: Optional[List[str]]
         A list of gravitational wave event ids that are associated with this locus.
+    use_cache: bool
+        Whether the lazy-loaded attributes may be read from the response cache.
     Notes
     -----
     Instances of this class lazy-load a few of their attributes from the ANTARES API.
@@ -163,6 +365,7 @@ class Locus:
         watch_list_ids: Optional[List[str]] = None,
         watch_object_ids: Optional[List[str]] = None,
         grav_wave_events: Optional[List[str]] = None,
+        use_cache: bool = True,
         **_,
     ):
         self.locus_id = locus_id
@@ -187,12 +390,15 @@ class Locus:
         self._lightcurve = lightcurve
         self._timeseries = None
         self._coordinates = None
+        self.use_cache = use_cache
 
     def _fetch_alerts(self) -> List[Alert]:
         alerts = _list_resources(
             config["ANTARES_API_BASE_URL"]
             + "/".join(("loci", self.locus_id, "alerts")),
             _AlertSchema,
+            kind="alerts",
+            use_cache=self.use_cache,
         )
         return list(alerts)
 
@@ -200,6 +406,7 @@ class Locus:
         locus = _get_resource(
             config["ANTARES_API_BASE_URL"] + "/".join(("loci", self.locus_id)),
             _LocusSchema,
+            use_cache=self.use_cache,
         )
         return locus.lightcurve
 
@@ -208,6 +415,8 @@ class Locus:
             config["ANTARES_API_BASE_URL"]
             + "/".join(("loci", self.locus_id, "catalog-matches")),
             _CatalogEntrySchema,
+            kind="catalog_matches",
+            use_cache=self.use_cache,
         )
         catalog_matches = list(catalog_matches)
         catalog_objects = defaultdict(list)
@@ -223,9 +432,13 @@ class Locus:
         this object.
         """
         if self._timeseries is None:
+            # Convert all the dates at once rather than one alert at a time.
+            times = astropy.time.Time(
+                [alert.mjd for alert in self.alerts], format="mjd"
+            )
+            times.format = "datetime"
             self._timeseries = astropy.timeseries.TimeSeries(
-                data=[alert.properties for alert in self.alerts],
-                time=[mjd_to_datetime(alert.mjd) for alert in self.alerts],
+                data=[alert.properties for alert in self.alerts], time=times
             )
         return self._timeseries
 
@@ -277,6 +490,57 @@ class Locus:
     def lightcurve(self, value) -> None:
         self._lightcurve = value
 
+    def lightcurve_arrays(
+        self, columns: Optional[List[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        The lightcurve as NumPy arrays, ready for plotting without a data frame.
+        Parameters
+        ----------
+        columns: List[str], optional
+            Columns to return, by default all of them.
+        Returns
+        ----------
+        Dictionary of arrays by column name. Missing values of float columns are NaN.
+        """
+        lightcurve = self.lightcurve
+        if columns is not None:
+            lightcurve = lightcurve[columns]
+        arrays = {}
+        for column, values in lightcurve.items():
+            if pd.api.types.is_float_dtype(values.dtype):
+                arrays[column] = values.to_numpy(dtype=float, na_value=np.nan)
+            else:
+                arrays[column] = values.to_numpy()
+        return arrays
+
+    def lightcurve_arrow(self, columns: Optional[List[str]] = None):
+        """
+        The lightcurve as an Arrow table, for columnar ingestion.
+        Parameters
+        ----------
+        columns: List[str], optional
+            Columns to return, by default all of them.
+        Returns
+        ----------
+        pyarrow.Table
+        Raises
+        ----------
+        ImportError
+            If pyarrow is not installed.
+        """
+        try:
+            import pyarrow  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for Arrow lightcurves, install it with "
+                "'conda install pyarrow'."
+            ) from e
+        lightcurve = self.lightcurve
+        if columns is not None:
+            lightcurve = lightcurve[columns]
+        return pyarrow.Table.from_pandas(lightcurve, preserve_index=False)
+
     @property
     def coordinates(self) -> SkyCoord:
         """Centroid of the locus as an AstroPy SkyCoord object."""
@@ -325,41 +589,182 @@ class _Lightcurve(fields.Field):
     """Field that represents an ANTARES lightcurve as a pandas dataframe"""
 
     def _deserialize(self, value, attr, data, **kwargs):
-        return pd.read_csv(StringIO(value))
+        if not value:
+            return pd.DataFrame(
+                {
+                    column: pd.Series(dtype=dtype)
+                    for column, dtype in LIGHTCURVE_DTYPES.items()
+                }
+            )
+        return pd.read_csv(
+            StringIO(value),
+            usecols=lambda column: column in LIGHTCURVE_DTYPES,
+            dtype=LIGHTCURVE_DTYPES,
+        )
 
 
-def _list_all_resources(
-    url: str, schema_cls: Type[Schema], params: Optional[QueryParams] = None
-) -> Iterator[Any]:
-    while True:
-        response = requests.get(url, params=params, timeout=config["API_TIMEOUT"])
-        if response.status_code >= 400:
-            raise AntaresException(response.json())
-        yield from schema_cls(many=True, partial=True).load(response.json())
-        url = response.json().get("links", {}).get("next")
-        if url is None:
+def _set_use_cache(resource: Any, use_cache: bool) -> Any:
+    """Lets a loaded locus lazy-load its attributes with the same cache option."""
+    if isinstance(resource, Locus):
+        resource.use_cache = use_cache
+    return resource
+
+
+def _get_page(
+    url: str,
+    params: Optional[QueryParams] = None,
+    kind: str = "listing",
+    use_cache: bool = True,
+) -> Dict:
+    """Fetches a page of resources, parsing its body once.
+
+    Successful bodies are cached for the timeout of their kind. Without the cache,
+    the API is always asked and the cached body is refreshed.
+    """
+    if use_cache:
+        body = get_cached(url, params)
+        if body is not None:
+            return body
+    response = http_client.get(url, params=params)
+    body = response.json()
+    if response.status_code >= 400:
+        raise AntaresException(body)
+    set_cached(url, params, body, kind, len(response.content))
+    return body
+
+
+def _fetch_pages(
+    url: str, params: Optional[QueryParams], limit: Optional[int], use_cache: bool
+) -> Iterator[Dict]:
+    """Yields the bodies of successive pages, fetched when the previous one is read."""
+    count = 0
+    while url is not None:
+        body = _get_page(url, params, use_cache=use_cache)
+        yield body
+        count += len(body.get("data", []))
+        if limit is not None and count >= limit:
             break
+        url = body.get("links", {}).get("next")
         params = None
 
 
+# Marks the end of the pages put in the queue of a prefetcher.
+_NO_MORE_PAGES = object()
+
+
+def _prefetch_pages(
+    url: str,
+    params: Optional[QueryParams],
+    limit: Optional[int],
+    read_ahead: int,
+    use_cache: bool,
+) -> Iterator[Dict]:
+    """Yields the bodies of successive pages, fetched by a background thread.
+
+    At most ``read_ahead`` pages are fetched ahead of the one being read, so the next
+    page is downloaded while the current one is deserialized. No more pages are
+    requested once ``limit`` resources were fetched or the generator is closed.
+    """
+    pages: queue.Queue = queue.Queue()
+    slots = threading.Semaphore(read_ahead)
+    stop = threading.Event()
+
+    def wait_for_slot() -> bool:
+        while not stop.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def produce(url: Optional[str], params: Optional[QueryParams]) -> None:
+        count = 0
+        try:
+            while url is not None and wait_for_slot():
+                body = _get_page(url, params, use_cache=use_cache)
+                pages.put(body)
+                count += len(body.get("data", []))
+                if limit is not None and count >= limit:
+                    break
+                url = body.get("links", {}).get("next")
+                params = None
+        except Exception as e:
+            pages.put(e)
+        finally:
+            pages.put(_NO_MORE_PAGES)
+
+    thread = threading.Thread(target=produce, args=(url, params), daemon=True)
+    thread.start()
+    try:
+        while True:
+            page = pages.get()
+            if page is _NO_MORE_PAGES:
+                break
+            if isinstance(page, Exception):
+                raise page
+            # Let the next page be fetched while this one is read.
+            slots.release()
+            yield page
+    finally:
+        stop.set()
+
+
+def _list_all_resources(
+    url: str,
+    schema_cls: Type[Schema],
+    params: Optional[QueryParams] = None,
+    limit: Optional[int] = None,
+    use_cache: bool = True,
+) -> Iterator[Any]:
+    """Yields the resources of all pages, up to ``limit`` of them."""
+    read_ahead = config["READ_AHEAD_PAGES"]
+    if read_ahead > 0:
+        pages = _prefetch_pages(url, params, limit, read_ahead, use_cache)
+    else:
+        pages = _fetch_pages(url, params, limit, use_cache)
+
+    schema = schema_cls(many=True, partial=True)
+    count = 0
+    try:
+        for body in pages:
+            for resource in schema.load(body):
+                yield _set_use_cache(resource, use_cache)
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    finally:
+        # Stop prefetching when the caller stops reading.
+        pages.close()
+
+
 def _get_resource(
-    url: str, schema_cls: Type[Schema], params: Optional[QueryParams] = None
+    url: str,
+    schema_cls: Type[Schema],
+    params: Optional[QueryParams] = None,
+    kind: str = "locus",
+    use_cache: bool = True,
 ) -> Optional[Any]:
-    response = requests.get(url, params=params, timeout=config["API_TIMEOUT"])
+    schema = schema_cls(partial=True)
+    body = get_cached(url, params) if use_cache else None
+    if body is not None:
+        return _set_use_cache(schema.load(body), use_cache)
+    response = http_client.get(url, params=params)
     if response.status_code == 404:
         return None
+    body = response.json()
     if response.status_code >= 400:
-        raise AntaresException(response.json())
-    return schema_cls(partial=True).load(response.json())
+        raise AntaresException(body)
+    set_cached(url, params, body, kind, len(response.content))
+    return _set_use_cache(schema.load(body), use_cache)
 
 
 def _list_resources(
-    url: str, schema_cls: Type[Schema], params: Optional[QueryParams] = None
+    url: str,
+    schema_cls: Type[Schema],
+    params: Optional[QueryParams] = None,
+    kind: str = "listing",
+    use_cache: bool = True,
 ) -> Iterator[Any]:
-    response = requests.get(url, params=params, timeout=config["API_TIMEOUT"])
-    if response.status_code >= 400:
-        raise AntaresException(response.json())
-    yield from schema_cls(many=True, partial=True).load(response.json())
+    body = _get_page(url, params, kind=kind, use_cache=use_cache)
+    yield from schema_cls(many=True, partial=True).load(body)
 
 
 class _LocusListingSchema(Schema):
@@ -408,16 +813,31 @@ class _LocusSchema(Schema):
         return Locus(**data)
 
 
-def search(query: Dict) -> Iterator[Locus]:
+def search(
+    query: Dict,
+    limit: Optional[int] = None,
+    use_cache: bool = True,
+    sort: str = "-properties.newest_alert_observation_time",
+) -> Iterator[Locus]:
     """
     Searches the ANTARES database for loci that meet certain criteria. Results are
     returned with the most recently updated objects first (sorted on the
     `properties.newest_alert_observation_time` field in descending order).
+    The next page of results is fetched while the current one is read.
     Parameters
     ----------
     query: dict
         An ElasticSearch query. Must contain a top-level "query" key and only that
         top-level key. Other ES search arguments (e.g. "aggregations") are not allowed.
+    limit: int, optional
+        Maximum number of loci to return. No further pages are requested once it is
+        reached.
+    use_cache: bool, optional
+        Whether responses may be read from the cache, for the search and the
+        lazy-loaded attributes of the loci. By default `True`.
+    sort: str, optional
+        Field to sort the results on, prefixed with "-" for descending order. By
+        default the most recently updated objects come first.
     Returns
     ----------
     Iterator over Locus objects
@@ -426,18 +846,23 @@ def search(query: Dict) -> Iterator[Locus]:
         urljoin(config["ANTARES_API_BASE_URL"], "loci"),
         _LocusListingSchema,
         params={
-            "sort": "-properties.newest_alert_observation_time",
+            "sort": sort,
             "elasticsearch_query[locus_listing]": json.dumps(query),
         },
+        limit=limit,
+        use_cache=use_cache,
     )
 
 
-def get_by_id(locus_id: str) -> Optional[Locus]:
+def get_by_id(locus_id: str, use_cache: bool = True) -> Optional[Locus]:
     """
     Gets an ANTARES locus by its ANTARES ID.
     Parameters
     ----------
     locus_id: str
+    use_cache: bool, optional
+        Whether responses may be read from the cache, for the locus and its
+        lazy-loaded attributes. By default `True`.
     Returns
     ----------
     Locus or None
@@ -445,4 +870,5 @@ def get_by_id(locus_id: str) -> Optional[Locus]:
     return _get_resource(
         urljoin(config["ANTARES_API_BASE_URL"], f"loci/{locus_id}"),
         _LocusSchema,
+        use_cache=use_cache,
     )
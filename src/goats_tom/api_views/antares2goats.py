@@ -7,6 +7,7 @@ from datetime import datetime
 from django.db import IntegrityError
 from rest_framework import mixins, status
 from rest_framework.authentication import TokenAuthentication
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -14,7 +15,12 @@ from rest_framework.viewsets import GenericViewSet
 from tom_alerts.alerts import get_service_class as tom_alerts_get_service_class
 from tom_alerts.models import BrokerQuery
 
-from goats_tom.serializers import Antares2GoatsSerializer
+from goats_tom.serializers import Antares2GoatsBulkSerializer, Antares2GoatsSerializer
+from goats_tom.tasks import import_antares_loci
+from goats_tom.tasks.import_antares_loci import import_loci
+
+# Imports of up to this many loci are done within the request.
+MAX_SYNC_IMPORT_LOCI = 10
 
 
 class Antares2GoatsViewSet(GenericViewSet, mixins.CreateModelMixin):
@@ -25,6 +31,11 @@ class Antares2GoatsViewSet(GenericViewSet, mixins.CreateModelMixin):
     permission_classes = [IsAuthenticated]
     serializer_class = Antares2GoatsSerializer
 
+    def get_serializer_class(self):
+        if self.action == "bulk":
+            return Antares2GoatsBulkSerializer
+        return super().get_serializer_class()
+
     def create(self, request: Request, *args, **kwargs) -> Response:
         """Create a target or query based on the provided data.
 
@@ -87,3 +98,40 @@ class Antares2GoatsViewSet(GenericViewSet, mixins.CreateModelMixin):
             )
             # Save the new BrokerQuery instance to the database.
             broker_query.save()
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request, *args, **kwargs) -> Response:
+        """Imports many loci, or the results of a saved query, as targets.
+
+        Small lists of loci are imported within the request. Larger ones and saved
+        queries are imported in the background, reporting the progress to the user.
+
+        Parameters
+        ----------
+        request : `Request`
+            The request with the locus IDs or the saved query.
+
+        Returns
+        -------
+        `Response`
+            The number of targets created, duplicates and failures, or the number of
+            loci queued for import.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        locus_ids = serializer.validated_data.get("locusids")
+
+        if locus_ids is not None and len(locus_ids) <= MAX_SYNC_IMPORT_LOCI:
+            counts = import_loci(locus_ids)
+            return Response(counts, status=status.HTTP_201_CREATED)
+
+        query = serializer.validated_data.get("query")
+        import_antares_loci.send(
+            locus_ids, query.pk if query is not None else None, request.user.id
+        )
+        message = (
+            f"Importing {len(locus_ids)} loci."
+            if locus_ids is not None
+            else f"Importing the results of {query.name}."
+        )
+        return Response({"message": message}, status=status.HTTP_202_ACCEPTED)
@@ -10,16 +10,18 @@ __all__ = ["DataProductsViewSet"]
 from django.conf import settings
 from guardian.shortcuts import assign_perm
 from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.mixins import CreateModelMixin
 from rest_framework.parsers import JSONParser
 from rest_framework.response import Response
 from tom_common.hooks import run_hook
 from tom_dataproducts.api_views import DataProductViewSet as BaseDataProductViewSet
-from tom_dataproducts.data_processor import run_data_processor
 from tom_dataproducts.models import DataProduct, ReducedDatum
 
 from goats_tom.models import DataProductMetadata
-from goats_tom.serializers import DataProductSerializer
+from goats_tom.processors import run_data_processor
+from goats_tom.serializers import DataProductSerializer, DataProductsPublishSerializer
+from goats_tom.tasks import publish_dataproducts
 
 
 class DataProductsViewSet(BaseDataProductViewSet):
@@ -30,6 +32,8 @@ class DataProductsViewSet(BaseDataProductViewSet):
     def get_serializer_class(self):
         if self.action == "create":
             return DataProductSerializer
+        if self.action == "publish":
+            return DataProductsPublishSerializer
         return super().get_serializer_class()
 
     def create(self, request, *args, **kwargs):
@@ -68,3 +72,36 @@ class DataProductsViewSet(BaseDataProductViewSet):
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
         return response
+
+    @action(detail=False, methods=["post"])
+    def publish(self, request, *args, **kwargs):
+        """Publishes many output files of a DRAGONS run in the background.
+
+        The status of each file is sent to the websocket group of the run.
+
+        Parameters
+        ----------
+        request : `Request`
+            The request with the run, the files and optionally the data product type
+            and groups.
+
+        Returns
+        -------
+        `Response`
+            The number of files queued for publishing.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        files = serializer.validated_data["files"]
+
+        publish_dataproducts.send(
+            serializer.validated_data["dragons_run"].pk,
+            files,
+            serializer.validated_data["data_product_type"],
+            [group.pk for group in serializer.validated_data.get("groups", [])],
+            request.user.id,
+        )
+        return Response(
+            {"message": f"Publishing {len(files)} files.", "count": len(files)},
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -2,9 +2,16 @@
 
 __all__ = ["DRAGONSDataViewSet"]
 
+from collections.abc import Iterator
+
+from django.core.cache import cache
+from django.db.models import Count, F
+from django.db.models.functions import JSONObject
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import mixins
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from goats_tom.models import DRAGONSFile, DRAGONSRecipe, DRAGONSRun
@@ -13,6 +20,28 @@ from goats_tom.serializers import (
     DRAGONSRecipeSerializer,
     DRAGONSRunSerializer,
 )
+from goats_tom.utils import (
+    JSONArrayAgg,
+    RawJSON,
+    iter_json,
+    supports_json_aggregation,
+)
+
+# The cache key includes the data version of the run, so entries never go stale and
+# only need to expire to free space.
+DATA_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Fields of each file, matching `DRAGONSFileSerializer`.
+FILE_FIELDS = {
+    "id": F("id"),
+    "dragons_run": F("dragons_run_id"),
+    "product_id": F("product_id"),
+    "url": F("url"),
+    "observation_id": F("data_product__observation_record__observation_id"),
+    "observation_type": F("observation_type"),
+    "object_name": F("object_name"),
+    "observation_class": F("observation_class"),
+}
 
 
 class DRAGONSDataViewSet(mixins.RetrieveModelMixin, GenericViewSet):
@@ -25,6 +54,9 @@ class DRAGONSDataViewSet(mixins.RetrieveModelMixin, GenericViewSet):
         Retrieve a `DRAGONSRun` instance along with grouped data of related recipes
         and files.
 
+        The payload is cached under the data version of the run, which also serves as
+        its entity tag, so unchanged data is answered with 304 Not Modified.
+
         Parameters
         ----------
         request : `HttpRequest`
@@ -32,61 +64,117 @@ class DRAGONSDataViewSet(mixins.RetrieveModelMixin, GenericViewSet):
 
         Returns
         -------
-        `Response`
-            The response object containing grouped recipes and files.
+        `HttpResponseBase`
+            The JSON response containing grouped recipes and files, or a 304 response
+            if the client already has the current version.
         """
-        data = {}
-
         instance = self.get_object()
-        # Get the groups that users can group by.
-        data["groups"] = instance.list_groups()
+        etag = instance.get_data_etag()
+        last_modified = int(instance.data_modified.timestamp())
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            cache_key = f"dragons_data:{instance.pk}:{instance.data_version}"
+            content = cache.get(cache_key)
+            if content is None:
+                # The payload is cached in full, so it is encoded at once rather than
+                # streamed; the files of each group are already JSON from the database.
+                content = "".join(iter_json(self._build_data(instance)))
+                cache.set(cache_key, content, DATA_CACHE_TIMEOUT)
+            response = HttpResponse(content, content_type="application/json")
 
-        # Fetching recipes and files and serializing them.
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def _build_data(self, instance: DRAGONSRun) -> dict:
+        """Builds the grouped recipes and files of a run.
+
+        Parameters
+        ----------
+        instance : `DRAGONSRun`
+            The run to build the data for.
+
+        Returns
+        -------
+        `dict`
+            The groups users can group by and the recipes and files grouped by
+            observation type, class, and object.
+        """
+        # Fetching recipes and serializing them.
         recipes = DRAGONSRecipe.objects.filter(dragons_run=instance).select_related(
             "recipe"
         )
-        files = DRAGONSFile.objects.filter(dragons_run=instance).select_related(
-            "data_product"
-        )
-
         recipes_data = DRAGONSRecipeSerializer(recipes, many=True).data
-        files_data = DRAGONSFileSerializer(files, many=True).data
 
         # Combining and grouping recipe and file data by observation type, class, and
         # object.
-        recipes_and_files_data = {"observation_type": {}}
-        all_data = recipes_data + files_data
-        for item in all_data:
-            obs_type = item["observation_type"]
-            obs_class = item["observation_class"]
-            obj_name = item["object_name"]
-            entry_type = "recipes" if "recipes_module_name" in item else "files"
-
-            if obs_type not in recipes_and_files_data["observation_type"]:
-                recipes_and_files_data["observation_type"][obs_type] = {}
-            if obs_class not in recipes_and_files_data["observation_type"][obs_type]:
-                recipes_and_files_data["observation_type"][obs_type][obs_class] = {}
-            if (
-                obj_name
-                not in recipes_and_files_data["observation_type"][obs_type][obs_class]
-            ):
-                recipes_and_files_data["observation_type"][obs_type][obs_class][
-                    obj_name
-                ] = {"recipes": [], "files": {"All": {"count": 0, "files": []}}}
-
-            if entry_type == "files":
-                # Append the file and update the count.
-                recipes_and_files_data["observation_type"][obs_type][obs_class][
-                    obj_name
-                ]["files"]["All"]["files"].append(item)
-                recipes_and_files_data["observation_type"][obs_type][obs_class][
-                    obj_name
-                ]["files"]["All"]["count"] += 1
-            else:
-                # Append the recipe.
-                recipes_and_files_data["observation_type"][obs_type][obs_class][
-                    obj_name
-                ][entry_type].append(item)
-
-        data["recipes_and_files"] = recipes_and_files_data
-        return Response(data)
+        observation_types = {}
+
+        def get_node(obs_type: str, obs_class: str, obj_name: str | None) -> dict:
+            return (
+                observation_types.setdefault(obs_type, {})
+                .setdefault(obs_class, {})
+                .setdefault(
+                    obj_name,
+                    {"recipes": [], "files": {"All": {"count": 0, "files": []}}},
+                )
+            )
+
+        for item in recipes_data:
+            get_node(
+                item["observation_type"],
+                item["observation_class"],
+                item["object_name"],
+            )["recipes"].append(item)
+
+        for (obs_type, obs_class, obj_name), files in self._iter_file_groups(instance):
+            get_node(obs_type, obs_class, obj_name)["files"]["All"] = files
+
+        return {
+            # Get the groups that users can group by.
+            "groups": instance.list_groups(),
+            "recipes_and_files": {"observation_type": observation_types},
+        }
+
+    def _iter_file_groups(
+        self, instance: DRAGONSRun
+    ) -> Iterator[tuple[tuple[str, str, str | None], dict]]:
+        """Yields the files of a run grouped by observation type, class, and object.
+
+        Grouping and counting run in the database, which also builds each group's
+        files as JSON text when the backend supports it.
+
+        Parameters
+        ----------
+        instance : `DRAGONSRun`
+            The run to get the files of.
+
+        Yields
+        ------
+        `tuple[tuple[str, str, str | None], dict]`
+            The observation type, class, and object of each group, with its count and
+            files.
+        """
+        files = DRAGONSFile.objects.filter(dragons_run=instance)
+        group_fields = ("observation_type", "observation_class", "object_name")
+
+        if not supports_json_aggregation():
+            files = files.select_related("data_product__observation_record")
+            groups = {}
+            for item in DRAGONSFileSerializer(files, many=True).data:
+                group_key = tuple(item[field] for field in group_fields)
+                groups.setdefault(group_key, []).append(item)
+            for group_key, items in groups.items():
+                yield group_key, {"count": len(items), "files": items}
+            return
+
+        groups = files.values(*group_fields).annotate(
+            count=Count("id"), files=JSONArrayAgg(JSONObject(**FILE_FIELDS))
+        )
+        for group in groups.iterator():
+            group_key = tuple(group[field] for field in group_fields)
+            files_json = RawJSON(group["files"] or "[]")
+            yield group_key, {"count": group["count"], "files": files_json}
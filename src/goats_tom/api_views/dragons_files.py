@@ -1,10 +1,17 @@
 """Module that handles the DRAGONS files API."""
 
-from django.db.models import CharField, F, QuerySet, Value
+from collections.abc import Iterator
+from itertools import groupby
+from operator import itemgetter
+from typing import Any
+
+from django.conf import settings
+from django.db.models import CharField, Count, F, QuerySet, Value
 from django.db.models.fields.json import KeyTransform
-from django.db.models.functions import Concat
-from django.http import HttpRequest
+from django.db.models.functions import Concat, JSONObject
+from django.http import HttpRequest, StreamingHttpResponse
 from rest_framework import mixins
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
@@ -15,6 +22,24 @@ from goats_tom.serializers import (
     DRAGONSFileFilterSerializer,
     DRAGONSFileSerializer,
 )
+from goats_tom.utils import (
+    JSONArrayAgg,
+    RawJSON,
+    evaluate_first,
+    iter_json_object,
+    streaming_json_response,
+    supports_json_aggregation,
+)
+
+# Fields of each file returned when grouping files.
+FILE_FIELDS = {
+    "id": F("id"),
+    "product_id": F("product_id"),
+    "url": F("url"),
+    "object_name": F("object_name"),
+    "observation_type": F("observation_type"),
+    "observation_class": F("observation_class"),
+}
 
 
 class DRAGONSFilesViewSet(
@@ -61,7 +86,9 @@ class DRAGONSFilesViewSet(
 
         return queryset
 
-    def list(self, request: HttpRequest, *args, **kwargs) -> Response:
+    def list(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> Response | StreamingHttpResponse:
         """List or group DRAGONS file records based on the provided query parameters.
 
         Parameters
@@ -71,8 +98,17 @@ class DRAGONSFilesViewSet(
 
         Returns
         -------
-        `Response`
-            The paginated list of DRAGONS file records, optionally grouped by file type.
+        `Response | StreamingHttpResponse`
+            The paginated list of DRAGONS file records, a streamed JSON response of
+            the records grouped by the requested descriptors, or the explanation of
+            the filter expression if requested.
+
+        Raises
+        ------
+        PermissionDenied
+            If the explanation of the filter expression is requested by a user that
+            is not staff while not in debug mode, as it exposes the SQL and the
+            query plan.
 
         """
         # Validates the provided query parameters.
@@ -85,6 +121,16 @@ class DRAGONSFilesViewSet(
             "filter_expression", ""
         )
         filter_strict = filter_serializer.validated_data.get("filter_strict", False)
+        if filter_serializer.validated_data.get("filter_explain", False):
+            if not (settings.DEBUG or request.user.is_staff):
+                raise PermissionDenied("Only staff users can explain filters.")
+            return Response(
+                AstrodataFilter.explain(
+                    filter_expression,
+                    self.filter_queryset(self.get_queryset()),
+                    strict=filter_strict,
+                )
+            )
         query_filter = AstrodataFilter.parse(filter_expression, strict=filter_strict)
         if query_filter is None:
             return Response({"Invalid Filter": {"count": 0, "files": []}})
@@ -98,19 +144,11 @@ class DRAGONSFilesViewSet(
         # Group by dynamic fields if specified.
         if group_by:
             if "all" in group_by:
-                # Return all files under the "All" key with a count
-                files_data = list(
-                    queryset.values(
-                        "id",
-                        "product_id",
-                        "url",
-                        "observation_type",
-                        "object_name",
-                        "observation_class",
-                    )
+                # Return all files under the "All" key with a count.
+                return streaming_json_response(
+                    request,
+                    iter_json_object(evaluate_first(self._iter_all_group(queryset))),
                 )
-                grouped_data = {"All": {"count": len(files_data), "files": files_data}}
-                return Response(grouped_data)
 
             annotations = {
                 f"group_value_{i}": KeyTransform(key, "astrodata_descriptors")
@@ -132,43 +170,12 @@ class DRAGONSFilesViewSet(
             else:
                 group_field = "group_value_0"
 
-            # Fetch and group data based on the composite or single group key.
-            queryset = queryset.values(
-                "id",
-                "object_name",
-                "observation_type",
-                "observation_class",
-                "product_id",
-                "url",
-                group_field,
-            ).order_by(group_field)
-
-            # Manually aggregate grouped data.
-            grouped_data = {}
-            for item in queryset:
-                group_key = item[group_field]
-                if group_key not in grouped_data:
-                    grouped_data[group_key] = {
-                        "count": 0,  # Initialize count
-                        "files": [],
-                    }
-                grouped_data[group_key]["files"].append(
-                    {
-                        "id": item["id"],
-                        "product_id": item["product_id"],
-                        "url": item["url"],
-                        "object_name": item["object_name"],
-                        "observation_type": item["observation_type"],
-                        "observation_class": item["observation_class"],
-                    }
-                )
-                grouped_data[group_key]["count"] += 1
-
-            # Ensure response consistency by checking if grouped_data is empty.
-            if not grouped_data:
-                grouped_data = {"N/A": {"count": 0, "files": []}}
-
-            return Response(grouped_data)
+            return streaming_json_response(
+                request,
+                iter_json_object(
+                    evaluate_first(self._iter_groups(queryset, group_field))
+                ),
+            )
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -179,6 +186,77 @@ class DRAGONSFilesViewSet(
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
+    def _iter_all_group(self, queryset: QuerySet) -> Iterator[tuple[str, dict]]:
+        """Yields every file of the queryset under a single "All" group.
+
+        Parameters
+        ----------
+        queryset : `QuerySet`
+            The filtered files.
+
+        Yields
+        ------
+        `tuple[str, dict]`
+            The "All" group key and its count and files.
+        """
+        if supports_json_aggregation():
+            result = queryset.aggregate(
+                count=Count("id"), files=JSONArrayAgg(JSONObject(**FILE_FIELDS))
+            )
+            files = RawJSON(result["files"] or "[]")
+            yield "All", {"count": result["count"], "files": files}
+            return
+
+        files = list(queryset.values(*FILE_FIELDS))
+        yield "All", {"count": len(files), "files": files}
+
+    def _iter_groups(
+        self, queryset: QuerySet, group_field: str
+    ) -> Iterator[tuple[Any, dict]]:
+        """Yields the files of the queryset grouped by the value of a field.
+
+        Grouping and counting run in the database, which also builds each group's
+        files as JSON text when the backend supports it.
+
+        Parameters
+        ----------
+        queryset : `QuerySet`
+            The filtered files, annotated with the field to group by.
+        group_field : `str`
+            The annotated field to group by.
+
+        Yields
+        ------
+        `tuple[Any, dict]`
+            Each group key and its count and files, ordered by group key. A single
+            empty "N/A" group is yielded if there are no files.
+        """
+        empty = True
+        if supports_json_aggregation():
+            groups = (
+                queryset.values(group_field)
+                .annotate(
+                    count=Count("id"), files=JSONArrayAgg(JSONObject(**FILE_FIELDS))
+                )
+                .order_by(group_field)
+            )
+            for group in groups.iterator():
+                empty = False
+                files = RawJSON(group["files"] or "[]")
+                yield group[group_field], {"count": group["count"], "files": files}
+        else:
+            rows = queryset.values(group_field, *FILE_FIELDS).order_by(group_field)
+            for group_key, items in groupby(
+                rows.iterator(), key=itemgetter(group_field)
+            ):
+                empty = False
+                files = [{k: item[k] for k in FILE_FIELDS} for item in items]
+                yield group_key, {"count": len(files), "files": files}
+
+        # Ensure response consistency by checking if there were no groups.
+        if empty:
+            yield "N/A", {"count": 0, "files": []}
+
     def retrieve(self, request: HttpRequest, *args, **kwargs) -> Response:
         """Retrieve a DRAGONS file instance along with optional included data based on
         query parameters.
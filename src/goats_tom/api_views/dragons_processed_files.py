@@ -2,11 +2,8 @@
 
 __all__ = ["DRAGONSProcessedFilesViewSet"]
 
-import datetime
 from pathlib import Path
 
-import astrodata
-from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from rest_framework import mixins, permissions, status
@@ -17,8 +14,16 @@ from rest_framework.viewsets import GenericViewSet
 from tom_dataproducts.models import DataProduct
 
 from goats_tom.models import DRAGONSRun
-from goats_tom.serializers import DRAGONSProcessedFilesSerializer, HeaderSerializer
-from goats_tom.utils import delete_associated_data_products
+from goats_tom.serializers import (
+    DRAGONSProcessedFilesSerializer,
+    HeaderSerializer,
+    HeadersSerializer,
+)
+from goats_tom.utils import (
+    delete_associated_data_products,
+    get_astrodata_descriptors,
+    resolve_media_path,
+)
 
 
 class DRAGONSProcessedFilesViewSet(
@@ -86,35 +91,72 @@ class DRAGONSProcessedFilesViewSet(
         serializer.is_valid(raise_exception=True)
 
         filepath = serializer.validated_data["filepath"]
-        full_path = Path(settings.MEDIA_ROOT) / filepath
+        full_path = resolve_media_path(filepath)
         filename = full_path.name
 
         try:
-            ad = astrodata.open(str(full_path))
+            astrodata_descriptors = get_astrodata_descriptors(full_path)
         except Exception as e:
             return Response(
                 {"error": f"Failed to open FITS file: {str(e)}"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        descriptors = ad.descriptors
-        # Build the astrodata descriptors to save.
-        astrodata_descriptors = {}
-        for descriptor in descriptors:
-            if hasattr(ad, descriptor):
-                try:
-                    value = getattr(ad, descriptor)()
-                    # Check for unsupported types and convert them.
-                    if isinstance(value, (datetime.date, datetime.datetime)):
-                        # Convert datetime or date to ISO formatted string.
-                        value = value.isoformat()
-                    elif not isinstance(value, (str, int, float, bool, type(None))):
-                        # Convert any other unsupported types to string.
-                        value = str(value)
-                    astrodata_descriptors[descriptor] = value
-                except Exception:
-                    pass
 
         return Response(
             {"filename": filename, "astrodata_descriptors": astrodata_descriptors},
             status=status.HTTP_200_OK,
         )
+
+    @action(detail=False, methods=["post"], url_path="headers")
+    def headers(self, request: Request, *args, **kwargs) -> Response:
+        """Retrieve the header information of many FITS files in one call.
+
+        Parameters
+        ----------
+        request : `Request`
+            The incoming HTTP request containing the file paths.
+
+        Returns
+        -------
+        `Response`
+            A response containing, in request order, the filename and astrodata
+            descriptors of each file, or an error message for files that could not be
+            read or are outside of the media root.
+        """
+        serializer = HeadersSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = [
+            self._read_header(filepath)
+            for filepath in serializer.validated_data["filepaths"]
+        ]
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _read_header(filepath: str) -> dict:
+        """Reads the astrodata descriptors of a file for the batch header action.
+
+        Parameters
+        ----------
+        filepath : `str`
+            The path to the file relative to the media root.
+
+        Returns
+        -------
+        `dict`
+            The file path and name, with the astrodata descriptors or an error.
+        """
+        result = {"filepath": filepath, "filename": Path(filepath).name}
+        try:
+            full_path = resolve_media_path(filepath)
+        except ValueError as e:
+            result["error"] = str(e)
+            return result
+        if not full_path.exists():
+            result["error"] = "The specified file does not exist."
+            return result
+        try:
+            result["astrodata_descriptors"] = get_astrodata_descriptors(full_path)
+        except Exception as e:
+            result["error"] = f"Failed to open FITS file: {str(e)}"
+        return result
@@ -71,7 +71,7 @@ class DRAGONSReduceViewSet(
         reduce = serializer.save()
         reduce.mark_queued()
         DRAGONSProgress.create_and_send(reduce)
-        task_id = run_dragons_reduce.send(reduce.id, file_ids)
+        task_id = run_dragons_reduce.send(reduce.id, file_ids, self.request.user.id)
         reduce.task_id = task_id.message_id
         reduce.save()
 
@@ -93,4 +93,5 @@ class DRAGONSReduceViewSet(
                 label=reduce.get_label(),
                 color="warning",
                 message="Background task canceled.",
+                user_id=self.request.user.id,
             )
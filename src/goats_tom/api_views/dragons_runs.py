@@ -7,6 +7,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest
 from recipe_system import cal_service
 from rest_framework import mixins, permissions
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 from tom_dataproducts.models import DataProduct
@@ -16,9 +17,14 @@ from goats_tom.models import (
     DRAGONSFile,
     DRAGONSRecipe,
     DRAGONSRun,
+    PrimitivesCatalog,
     RecipesModule,
 )
-from goats_tom.serializers import DRAGONSRunFilterSerializer, DRAGONSRunSerializer
+from goats_tom.serializers import (
+    DRAGONSRunFilterSerializer,
+    DRAGONSRunLogSerializer,
+    DRAGONSRunSerializer,
+)
 from goats_tom.utils import get_recipes_and_primitives
 
 
@@ -116,6 +122,9 @@ class DRAGONSRunsViewSet(
             observation_record=dragons_run.observation_record,
         )
 
+        # Primitives catalogs found or built for this run, keyed by the tags hash.
+        primitives_catalogs = {}
+
         for data_product in data_products:
             # Get the tags and instrument.
             ad = astrodata.open(data_product.data.path)
@@ -187,11 +196,29 @@ class DRAGONSRunsViewSet(
                     except Exception as e:
                         print(f"Error accessing descriptor {descriptor}: {str(e)}")
 
+            # Build the primitives help once per set of tags, so opening the recipe
+            # editor does not have to.
+            tags_hash = PrimitivesCatalog.hash_tags(tags)
+            if tags_hash not in primitives_catalogs:
+                primitives_catalog = PrimitivesCatalog.lookup(
+                    instrument, dragons_run.version, tags
+                )
+                if primitives_catalog is None:
+                    try:
+                        primitives_catalog = PrimitivesCatalog.build(
+                            data_product.data.path, instrument, dragons_run.version
+                        )
+                    except Exception as e:
+                        # The catalog is built on first use instead.
+                        print(f"Error building primitives catalog: {str(e)}")
+                primitives_catalogs[tags_hash] = primitives_catalog
+
             # Create a file for this run using the recipes module last retrieved.
             DRAGONSFile.objects.create(
                 dragons_run=dragons_run,
                 data_product=data_product,
                 recipes_module=recipes_module,
+                primitives_catalog=primitives_catalogs[tags_hash],
                 observation_type=observation_type,
                 object_name=object_name,
                 observation_class=observation_class,
@@ -230,6 +257,35 @@ class DRAGONSRunsViewSet(
 
         return Response(data)
 
+    @action(detail=True, methods=["get"])
+    def log(self, request: HttpRequest, *args, **kwargs) -> Response:
+        """Reads the log file of a run from a byte offset, or its last lines.
+
+        Clients keep up with the log by passing back the returned "next_offset".
+
+        Parameters
+        ----------
+        request : `HttpRequest`
+            The HTTP request object, containing the offset and maximum bytes to read.
+
+        Returns
+        -------
+        `Response`
+            The offset the content starts at, the offset to continue from, the size of
+            the log file, and the content read.
+
+        """
+        instance = self.get_object()
+        log_serializer = DRAGONSRunLogSerializer(data=request.query_params)
+        log_serializer.is_valid(raise_exception=True)
+
+        return Response(
+            instance.read_log(
+                offset=log_serializer.validated_data.get("offset"),
+                max_bytes=log_serializer.validated_data["max_bytes"],
+            )
+        )
+
     def perform_destroy(self, instance: DRAGONSRun) -> None:
         """Handle the deletion of a DRAGONS run instance and its associated output
         directory.
@@ -1,9 +1,95 @@
-"""Module overriding the `filterset_class` to allow us to filter results."""
+"""Module overriding the `filterset_class` to allow us to filter results, and adding
+downsampled series of reduced data for plotting.
+"""
 
+import json
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from rest_framework.decorators import action
+from rest_framework.request import Request
 from tom_dataproducts.api_views import ReducedDatumViewSet as BaseReducedDatumViewSet
+from tom_dataproducts.models import ReducedDatum
 
 from goats_tom.filters import ReducedDatumFilter
+from goats_tom.serializers import ReducedDatumSeriesSerializer
+from goats_tom.utils import build_series, encode_series_binary, encode_series_json
+
+# Series only change when reduced data are added or removed, which changes the key.
+SERIES_CACHE_TIMEOUT = 60 * 60 * 24
 
 
 class ReducedDatumViewSet(BaseReducedDatumViewSet):
     filterset_class = ReducedDatumFilter
+
+    @action(detail=False, methods=["get"])
+    def series(self, request: Request, *args, **kwargs) -> HttpResponse:
+        """Returns the reduced data of a data product as series downsampled to the
+        width of a plot.
+
+        The series are encoded as columnar JSON, or as a JSON header followed by
+        little-endian float arrays when ``encoding=binary``. Encoded series are
+        cached per data product.
+
+        Parameters
+        ----------
+        request : `Request`
+            The request with the data product, data type, and optionally the width,
+            downsampling method and encoding.
+
+        Returns
+        -------
+        `HttpResponse`
+            The encoded series.
+        """
+        serializer = ReducedDatumSeriesSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        data_product = params["data_product"]
+        data_type = params["data_type"]
+
+        queryset = self.get_queryset().filter(
+            data_product=data_product, data_type=data_type
+        )
+        # Key the cache on the reduced data so it changes when they are reprocessed.
+        stats = queryset.aggregate(count=Count("pk"), last=Max("pk"))
+        key = (
+            f"reduceddatum_series:{data_product.pk}:{data_type}:{stats['count']}:"
+            f"{stats['last']}:{params['width']}:{params['method']}:"
+            f"{params['encoding']}"
+        )
+        # Only share the series with users that can view all of the reduced data.
+        shared = (
+            stats["count"]
+            == ReducedDatum.objects.filter(
+                data_product=data_product, data_type=data_type
+            ).count()
+        )
+        body = cache.get(key) if shared else None
+
+        if body is None:
+            series = build_series(
+                queryset, data_type, params["width"], params["method"]
+            )
+            meta = {
+                "data_product": data_product.pk,
+                "data_type": data_type,
+                "width": params["width"],
+                "method": params["method"],
+            }
+            if params["encoding"] == "binary":
+                body = encode_series_binary(meta, series)
+            else:
+                body = json.dumps(
+                    {**meta, "series": encode_series_json(series)}
+                ).encode()
+            if shared:
+                cache.set(key, body, SERIES_CACHE_TIMEOUT)
+
+        content_type = (
+            "application/octet-stream"
+            if params["encoding"] == "binary"
+            else "application/json"
+        )
+        return HttpResponse(body, content_type=content_type)
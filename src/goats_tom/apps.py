@@ -11,10 +11,17 @@ class GOATSTomConfig(AppConfig):
         from dramatiq import get_broker  # noqa: PLC0415
         from dramatiq_abort import Abortable, backends  # noqa: PLC0415
 
+        import goats_tom.signals  # noqa: F401, PLC0415
+
         event_backend = backends.RedisBackend.from_url(settings.DRAMATIQ_REDIS_URL)
         abortable = Abortable(backend=event_backend)
         get_broker().add_middleware(abortable)
 
+        # Schedule periodic actors, such as polling saved broker queries.
+        from goats_tom.tasks import PeriodicActors  # noqa: PLC0415
+
+        get_broker().add_middleware(PeriodicActors())
+
         # Monkey-patch tom-tns so it prefers per-request creds over global ones.
         # We keep a reference to the original helper so we can delegate to it when
         # the credentials have not been set for the context or other uncaught issues
@@ -12,6 +12,9 @@ class Conf(_config.ConfigNamespace):
     GOA_CHUNK_SIZE = _config.ConfigItem(
         20 * 1024 * 1024, "Chunk size to read/download files."
     )
+    GOA_PROGRESS_INTERVAL = _config.ConfigItem(
+        0.25, "Minimum seconds between download progress updates."
+    )
 
 
 conf = Conf()
@@ -716,7 +716,7 @@ class ObservationsClass(QueryWithLogin):
             of files omitted, a human-readable message, and boolean success.
 
         """
-        last_update_time = time.time()
+        last_update_time = time.monotonic()
         # Convert destination folder.
         dest_folder = Path(dest_folder).expanduser()
         url = self.url_helper.get_tar_file_url(*query_args, **query_kwargs)
@@ -754,10 +754,12 @@ class ObservationsClass(QueryWithLogin):
                     f.write(chunk)
                     downloaded_bytes += len(chunk)
 
-                    # Check if enough time passed to update.
+                    # Check if enough time passed to update. Sending does not block
+                    # the download, and pending updates are coalesced.
                     if download_state is not None:
-                        current_time = time.time()
-                        if current_time - last_update_time > 1:
+                        current_time = time.monotonic()
+                        elapsed = current_time - last_update_time
+                        if elapsed > conf.GOA_PROGRESS_INTERVAL:
                             download_state.update_and_send(
                                 downloaded_bytes=downloaded_bytes,
                             )
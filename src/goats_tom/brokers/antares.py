@@ -1,19 +1,34 @@
 __all__ = ["ANTARESBrokerForm", "ANTARESBroker"]
 
-from typing import Any, Iterator
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Iterable, Iterator
 
 import marshmallow
 from astropy.time import Time, TimezoneInfo
 from crispy_forms.layout import HTML, Div, Fieldset, Layout
 from django import forms
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.forms.widgets import Textarea
 from django.templatetags.static import static
 from tom_alerts.alerts import GenericAlert, GenericBroker, GenericQueryForm
-from tom_targets.models import BaseTarget, Target, TargetName
+from tom_targets.models import BaseTarget, Target, TargetExtra, TargetName
 
 from ..antares_client import get_by_id, search
 
+logger = logging.getLogger(__name__)
+
 ANTARES_BASE_URL = "https://antares.noirlab.edu"
+# Maximum number of loci returned by a query.
+MAX_ALERTS = 40
+# Number of loci whose alerts are fetched at the same time.
+MAX_WORKERS = 8
+# Seconds a query may spend fetching loci and their alerts.
+FETCH_TIME_BUDGET = 30
+# Number of targets created per query.
+TARGET_BATCH_SIZE = 100
 
 
 class ANTARESBrokerForm(GenericQueryForm):
@@ -184,10 +199,15 @@ class ANTARESBroker(GenericBroker):
     def fetch_alerts(self, parameters: dict[str, Any]) -> Iterator[dict[str, Any]]:
         """Fetches alerts based on user input.
 
+        For a query, the alerts of each locus are fetched by a bounded pool of threads
+        while the next loci are paged in. Loci whose alerts are not fetched within
+        the time budget are left out.
+
         Parameters
         ----------
         parameters : `dict[str, Any]`
-            Query parameters containing either a query string or a locus ID.
+            Query parameters containing either a query string or a locus ID, and
+            optionally the field to "sort" the query results on.
 
         Returns
         -------
@@ -196,29 +216,195 @@ class ANTARESBroker(GenericBroker):
         """
         query = parameters.get("query")
         locusid = parameters.get("locusid")
-        max_alerts = 40
         alerts = []
 
         if locusid:
             # Fetch alert by locus ID.
             locus = get_by_id(locusid)
-            alerts.append(self.alert_to_dict(locus))
+            if locus is not None:
+                alerts.append(self.alert_to_dict(locus))
 
         elif query:
-            # Set query parameter.
-            # Initiate search with the given query.
-            loci = search(query)
+            search_options = {"limit": MAX_ALERTS}
+            if parameters.get("sort"):
+                search_options["sort"] = parameters["sort"]
+            alerts = self.hydrate_loci(search(query, **search_options))
+
+        return iter(alerts)
+
+    def hydrate_loci(self, loci: Iterable) -> list[dict[str, Any]]:
+        """Serializes loci from a search, fetching their alerts concurrently.
+
+        At most `MAX_ALERTS` loci are serialized. Loci whose alerts fail to be fetched
+        or are not fetched within the time budget are left out.
+
+        Parameters
+        ----------
+        loci : `Iterable[Locus]`
+            The loci returned by the search.
 
-            while len(alerts) < max_alerts:
+        Returns
+        -------
+        `list[dict[str, Any]]`
+            The alert dictionaries fetched within the time budget, in search order.
+        """
+        loci = iter(loci)
+        deadline = time.monotonic() + FETCH_TIME_BUDGET
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        futures = []
+        try:
+            while len(futures) < MAX_ALERTS and time.monotonic() < deadline:
                 try:
                     locus = next(loci)
                 except (marshmallow.exceptions.ValidationError, StopIteration):
-                    # Break the loop if there is a validation error or no more items in
-                    # the iterator.
+                    # Break the loop if there is a validation error or no more items
+                    # in the iterator.
                     break
-                alerts.append(self.alert_to_dict(locus))
+                futures.append(executor.submit(self.alert_to_dict, locus))
 
-        return iter(alerts)
+            done, not_done = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+        finally:
+            # Don't wait for slow requests past the budget.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not_done:
+            logger.warning(
+                "Fetching alerts of %d ANTARES loci exceeded %s seconds, skipping.",
+                len(not_done),
+                FETCH_TIME_BUDGET,
+            )
+
+        alerts = []
+        for future in futures:
+            if future not in done:
+                continue
+            try:
+                alerts.append(future.result())
+            except Exception:
+                logger.exception("Failed to fetch alerts of an ANTARES locus.")
+        return alerts
+
+    def create_targets(
+        self, alerts: list[dict[str, Any]]
+    ) -> tuple[list[BaseTarget], int]:
+        """Creates a target for each alert whose names are not similar to the name or
+        an alias of an existing target.
+
+        Targets, their locus ID aliases and default extras are created in batches. If
+        a batch conflicts with targets created meanwhile, its targets are created one
+        at a time so only the conflicting ones are skipped.
+
+        Parameters
+        ----------
+        alerts : `list[dict[str, Any]]`
+            The alerts of the loci.
+
+        Returns
+        -------
+        `tuple[list[BaseTarget], int]`
+            The created targets and the number of alerts skipped as duplicates.
+        """
+        # Aliases are bulk created without `TargetName.full_clean`, so they are
+        # validated here the same way: no name or alias of a new target may be
+        # similar to a name or alias of another target.
+        simplify_name = Target.matches.simplify_name
+        known = self._get_known_names()
+
+        num_duplicates = 0
+        new_targets = []
+        for alert in alerts:
+            target, extras, aliases = self.to_generic_alert(alert).to_target()
+            target_name = simplify_name(target.name)
+            alias_names = {}
+            for alias in [*aliases, alert["locus_id"]]:
+                # Aliases similar to the name of their own target are rejected too.
+                alias_names.setdefault(simplify_name(alias), alias)
+            alias_names.pop(target_name, None)
+            names = {target_name, *alias_names}
+            if known & names:
+                num_duplicates += 1
+                continue
+            known.update(names)
+            new_targets.append((target, extras, list(alias_names.values())))
+
+        created = []
+        for start in range(0, len(new_targets), TARGET_BATCH_SIZE):
+            batch = new_targets[start : start + TARGET_BATCH_SIZE]
+            try:
+                created.extend(self._bulk_create_targets(batch))
+            except IntegrityError:
+                for target, extras, aliases in batch:
+                    target.pk = None
+                    try:
+                        with transaction.atomic():
+                            target.save(extras=extras, names=aliases)
+                    except IntegrityError:
+                        # Created by someone else meanwhile.
+                        num_duplicates += 1
+                    else:
+                        created.append(target)
+        return created, num_duplicates
+
+    @staticmethod
+    def _get_known_names() -> set[str]:
+        """Returns the names and aliases of every target, simplified as when the TOM
+        Toolkit matches target names.
+        """
+        simplify_name = Target.matches.simplify_name
+        names = Target.objects.values_list("name", flat=True)
+        aliases = TargetName.objects.values_list("name", flat=True)
+        return {
+            simplify_name(name)
+            for queryset in (names, aliases)
+            for name in queryset.iterator()
+        }
+
+    @staticmethod
+    def _bulk_create_targets(
+        batch: list[tuple[BaseTarget, dict[str, Any], list[str]]],
+    ) -> list[BaseTarget]:
+        """Creates a batch of targets with their extras and aliases in one transaction.
+
+        Parameters
+        ----------
+        batch : `list[tuple[BaseTarget, dict[str, Any], list[str]]]`
+            The unsaved targets with their extras and aliases.
+
+        Returns
+        -------
+        `list[BaseTarget]`
+            The created targets.
+
+        Raises
+        ------
+        IntegrityError
+            Raised if a target or alias already exists, rolling back the batch.
+        """
+        default_extras = {
+            extra_field["name"]: extra_field["default"]
+            for extra_field in settings.EXTRA_FIELDS
+            if extra_field.get("default") is not None
+        }
+        with transaction.atomic():
+            Target.objects.bulk_create([target for target, _, _ in batch])
+            # Not every database returns the primary keys of created rows.
+            pks = dict(
+                Target.objects.filter(
+                    name__in=[target.name for target, _, _ in batch]
+                ).values_list("name", "pk")
+            )
+            for target, _, _ in batch:
+                target.pk = pks[target.name]
+            TargetName.objects.bulk_create(
+                TargetName(target=target, name=name)
+                for target, _, aliases in batch
+                for name in aliases
+            )
+            # Extras are rare and saved one at a time to convert their typed values.
+            for target, extras, _ in batch:
+                for key, value in {**default_extras, **extras}.items():
+                    TargetExtra(target=target, key=key, value=value).save()
+        return [target for target, _, _ in batch]
 
     def to_target(
         self, alert: dict[str, Any]
@@ -0,0 +1,81 @@
+"""Base class for websocket consumers that buffer messages per connection."""
+
+__all__ = ["BufferedWebsocketConsumer"]
+
+import asyncio
+import json
+from collections.abc import Hashable
+
+from channels.generic.websocket import AsyncWebsocketConsumer
+
+from goats_tom.realtime import CoalescingBuffer
+
+
+class BufferedWebsocketConsumer(AsyncWebsocketConsumer):
+    """An async WebSocket consumer that sends messages from a per-connection buffer.
+
+    Handlers queue messages instead of awaiting the client, so a slow client never
+    holds up the channel layer. Messages queued with a key replace any pending
+    message with the same key, which drops stale progress updates. Once the buffer is
+    full, the oldest message without a key is dropped.
+
+    Attributes
+    ----------
+    max_buffer_size : `int`
+        The number of messages to buffer before dropping the oldest ones.
+
+    """
+
+    max_buffer_size = 1000
+
+    @property
+    def dropped_messages(self) -> int:
+        """The number of messages dropped because the buffer was full."""
+        return self._buffer.dropped
+
+    @property
+    def coalesced_messages(self) -> int:
+        """The number of messages replaced by a newer message with the same key."""
+        return self._buffer.coalesced
+
+    async def start_sending(self) -> None:
+        """Accepts the connection and starts sending buffered messages."""
+        self._buffer = CoalescingBuffer(self.max_buffer_size)
+        self._buffer_event = asyncio.Event()
+        await self.accept()
+        self._sender = asyncio.create_task(self._send_buffered())
+
+    async def stop_sending(self) -> None:
+        """Stops sending buffered messages and discards the pending ones."""
+        sender = getattr(self, "_sender", None)
+        if sender is None:
+            return
+        sender.cancel()
+        try:
+            await sender
+        except asyncio.CancelledError:
+            pass
+        self._buffer.clear()
+
+    def queue_json(self, content: dict, key: Hashable | None = None) -> None:
+        """Queues a message to send to the client.
+
+        Parameters
+        ----------
+        content : `dict`
+            The message to send as JSON.
+        key : `Hashable | None`, optional
+            The key of the message. A pending message with the same key is replaced,
+            by default `None` to always send the message.
+
+        """
+        self._buffer.put(json.dumps(content), key=key)
+        self._buffer_event.set()
+
+    async def _send_buffered(self) -> None:
+        """Sends buffered messages to the client as they are queued."""
+        while True:
+            await self._buffer_event.wait()
+            self._buffer_event.clear()
+            while self._buffer:
+                await self.send(text_data=self._buffer.pop())
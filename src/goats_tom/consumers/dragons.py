@@ -1,16 +1,29 @@
 """Class for DRAGONS updates through a websocket."""
 
 __all__ = ["DRAGONSConsumer"]
-import json
 
-from asgiref.sync import async_to_sync
-from channels.generic.websocket import WebsocketConsumer
+from channels.db import database_sync_to_async
+from django.contrib.auth.models import User
+from tom_targets.models import Target
+from tom_targets.permissions import targets_for_user
 
+from goats_tom.models import DRAGONSReduce, DRAGONSRun
+from goats_tom.realtime import DRAGONSLogBuffer, get_dragons_run_group_name
 
-class DRAGONSConsumer(WebsocketConsumer):
+from .base import BufferedWebsocketConsumer
+
+
+class DRAGONSConsumer(BufferedWebsocketConsumer):
     """A WebSocket consumer that handles sending update to connected clients on the
     DRAGONS page.
 
+    Each connection joins the group of the run given in the URL, so clients only
+    receive the logs and progress of the run they are viewing, if they may view the
+    target of the run. Only the latest
+    pending progress of each reduction is sent to slow clients. On connection, the
+    buffered logs of unfinished reductions of the run are replayed, before any live
+    log, and live logs already replayed are skipped.
+
     Attributes
     ----------
     group_name : `str`
@@ -18,38 +31,96 @@ class DRAGONSConsumer(WebsocketConsumer):
 
     """
 
-    group_name = "dragons_group"
+    async def connect(self) -> None:
+        """Adds this consumer to the group of the run upon WebSocket connection."""
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close()
+            return
+
+        run_id = self.scope["url_route"]["kwargs"]["run_id"]
+        if not await database_sync_to_async(self.can_view_run)(user, run_id):
+            await self.close()
+            return
+
+        self.group_name = get_dragons_run_group_name(run_id)
+        # Join the group before reading the replay so no log is missed in between.
+        # Group messages are handled after this method returns, so the replay is
+        # queued first.
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.start_sending()
+
+        # Replay the recent logs so reloaded pages keep the context of reductions.
+        replay_events = await database_sync_to_async(self.get_replay_events)(run_id)
+        self.replayed_seqs: dict[int, int] = {}
+        for event in replay_events:
+            self.queue_json(self._build_log(event))
+            if "seq" in event:
+                self.replayed_seqs[event["reduce_id"]] = event["seq"]
+
+    @staticmethod
+    def can_view_run(user: User, run_id: int) -> bool:
+        """Checks whether a user may view the target of a run.
 
-    def connect(self) -> None:
-        """Adds this consumer to the DRAGONS group upon WebSocket connection."""
-        async_to_sync(self.channel_layer.group_add)(self.group_name, self.channel_name)
-        self.accept()
+        Parameters
+        ----------
+        user : `User`
+            The user connecting.
+        run_id : `int`
+            The ID of the run.
 
-    def disconnect(self, code: int) -> None:
-        """Removes this consumer from the DRAGONS group upon WebSocket disconnection.
+        Returns
+        -------
+        `bool`
+            Whether the run exists and the user may view its target.
+
+        """
+        target_ids = DRAGONSRun.objects.filter(pk=run_id).values(
+            "observation_record__target"
+        )
+        return targets_for_user(
+            user, Target.objects.filter(pk__in=target_ids), "view_target"
+        ).exists()
+
+    @staticmethod
+    def get_replay_events(run_id: int) -> list[dict]:
+        """Gets the buffered log messages of the unfinished reductions of a run.
 
         Parameters
         ----------
-        code : `int`
-            Return code to send on disconnect.
+        run_id : `int`
+            The ID of the run.
+
+        Returns
+        -------
+        `list[dict]`
+            The buffered log message events.
 
         """
-        async_to_sync(self.channel_layer.group_discard)(
-            self.group_name,
-            self.channel_name,
+        reduce_ids = (
+            DRAGONSReduce.objects.filter(recipe__dragons_run__pk=run_id)
+            .exclude(status__in=["canceled", "done", "error"])
+            .order_by("created_at")
+            .values_list("pk", flat=True)
         )
+        return DRAGONSLogBuffer.get_many(reduce_ids)
 
-    def log_message(self, event: dict) -> None:
-        """Sends a log message to the client connected through WebSocket.
+    @staticmethod
+    def _build_log(event: dict) -> dict:
+        """Constructs the log message sent to the client.
 
         Parameters
         ----------
         event : `dict`
             The event dictionary containing the log data.
 
+        Returns
+        -------
+        `dict`
+            The log message.
+
         """
-        # Construct the log message.
-        log = {
+        return {
             "update": "log",
             "message": event["message"],
             "run_id": event["run_id"],
@@ -57,10 +128,39 @@ class DRAGONSConsumer(WebsocketConsumer):
             "reduce_id": event["reduce_id"],
         }
 
-        # Send the log message to the WebSocket.
-        self.send(text_data=json.dumps(log))
+    async def disconnect(self, code: int) -> None:
+        """Removes this consumer from the group of the run upon WebSocket
+        disconnection.
+
+        Parameters
+        ----------
+        code : `int`
+            Return code to send on disconnect.
+
+        """
+        await self.stop_sending()
+        if not hasattr(self, "group_name"):
+            return
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def log_message(self, event: dict) -> None:
+        """Sends a log message to the client connected through WebSocket.
+
+        Parameters
+        ----------
+        event : `dict`
+            The event dictionary containing the log data.
 
-    def recipe_progress_message(self, event: dict) -> None:
+        """
+        # Skip log messages already replayed.
+        replayed_seq = getattr(self, "replayed_seqs", {}).get(event["reduce_id"])
+        if replayed_seq is not None and event.get("seq", 0) <= replayed_seq:
+            return
+
+        # Queue the log message for the WebSocket.
+        self.queue_json(self._build_log(event))
+
+    async def recipe_progress_message(self, event: dict) -> None:
         """Sends a message about recipe progress to the client through a WebSocket.
 
         Parameters
@@ -78,5 +178,28 @@ class DRAGONSConsumer(WebsocketConsumer):
             "run_id": event["run_id"],
         }
 
-        # Send the update to the WebSocket.
-        self.send(text_data=json.dumps(recipe_progress))
+        # Queue the update, replacing pending progress of the same reduction.
+        self.queue_json(recipe_progress, key=("recipe", event["reduce_id"]))
+
+    async def publish_progress_message(self, event: dict) -> None:
+        """Sends the status of a file published as a data product to the client
+        through a WebSocket.
+
+        Parameters
+        ----------
+        event : `dict`
+            The event dictionary containing the file status.
+
+        """
+        # Construct the update.
+        publish_progress = {
+            "update": "publish",
+            "run_id": event["run_id"],
+            "product_id": event["product_id"],
+            "status": event["status"],
+            "message": event["message"],
+            "dataproduct_id": event["dataproduct_id"],
+        }
+
+        # Queue the update, replacing pending updates of the same file.
+        self.queue_json(publish_progress, key=("publish", event["product_id"]))
@@ -2,32 +2,41 @@
 
 __all__ = ["UpdatesConsumer"]
 
-import json
+from goats_tom.realtime import BROADCAST_GROUP_NAME, get_updates_group_name
 
-from asgiref.sync import async_to_sync
-from channels.generic.websocket import WebsocketConsumer
+from .base import BufferedWebsocketConsumer
 
 
-class UpdatesConsumer(WebsocketConsumer):
+class UpdatesConsumer(BufferedWebsocketConsumer):
     """A WebSocket consumer that handles sending updates to
     connected clients on all pages.
 
+    Each connection joins the group of its authenticated user, so downloads and
+    notifications only reach the user they belong to, and the broadcast group for
+    updates meant for everyone. Only the latest pending state of each download is
+    sent to slow clients.
+
     Attributes
     ----------
-    group_name : `str`
-        The name of the group that this consumer handles updates for.
+    group_names : `list[str]`
+        The names of the groups that this consumer handles updates for.
 
     """
 
-    group_name = "updates_group"
+    async def connect(self) -> None:
+        """Adds this consumer to the groups of the user upon WebSocket connection."""
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close()
+            return
 
-    def connect(self) -> None:
-        """Adds this consumer to the updates group upon WebSocket connection."""
-        async_to_sync(self.channel_layer.group_add)(self.group_name, self.channel_name)
-        self.accept()
+        self.group_names = [get_updates_group_name(user.pk), BROADCAST_GROUP_NAME]
+        for group_name in self.group_names:
+            await self.channel_layer.group_add(group_name, self.channel_name)
+        await self.start_sending()
 
-    def disconnect(self, code: int) -> None:
-        """Removes this consumer from the updates group upon WebSocket disconnection.
+    async def disconnect(self, code: int) -> None:
+        """Removes this consumer from the groups upon WebSocket disconnection.
 
         Parameters
         ----------
@@ -35,12 +44,11 @@ class UpdatesConsumer(WebsocketConsumer):
             Return code to send on disconnect.
 
         """
-        async_to_sync(self.channel_layer.group_discard)(
-            self.group_name,
-            self.channel_name,
-        )
+        await self.stop_sending()
+        for group_name in getattr(self, "group_names", []):
+            await self.channel_layer.group_discard(group_name, self.channel_name)
 
-    def notification_message(self, event: dict) -> None:
+    async def notification_message(self, event: dict) -> None:
         """Sends a notification message to the client connected through WebSocket.
 
         Parameters
@@ -58,10 +66,10 @@ class UpdatesConsumer(WebsocketConsumer):
             "message": event["message"],
         }
 
-        # Send the notification message to the WebSocket.
-        self.send(text_data=json.dumps(notification))
+        # Queue the notification message for the WebSocket.
+        self.queue_json(notification)
 
-    def download_message(self, event: dict) -> None:
+    async def download_message(self, event: dict) -> None:
         """Sends a download update to the client connected through WebSocket.
 
         Parameters
@@ -82,5 +90,5 @@ class UpdatesConsumer(WebsocketConsumer):
             "error": event["error"],
         }
 
-        # Send the download update to the WebSocket.
-        self.send(text_data=json.dumps(download))
+        # Queue the update, replacing pending updates of the same download.
+        self.queue_json(download, key=("download", event["unique_id"]))
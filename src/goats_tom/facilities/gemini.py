@@ -189,18 +189,74 @@ class GOATSGEMFacility(BaseRoboticObservationFacility):
         return SITES
 
     def get_observation_status(self, observation_id):
-        try:
-            observation_summary = ocs_client.get_observation_summary(observation_id)
+        return self.get_observation_statuses([observation_id])[observation_id]
 
-            if not observation_summary["success"]:
-                raise Exception(f"{observation_summary['error']}")
+    def get_observation_statuses(self, observation_ids: list[str]) -> dict[str, dict]:
+        """Gets the status of several observations, fetching each program once.
 
-            state = observation_summary["data"]["status"]
+        Parameters
+        ----------
+        observation_ids : `list[str]`
+            The observation IDs.
+
+        Returns
+        -------
+        `dict[str, dict]`
+            The status of each observation, with "Error" as the state of those that
+            could not be retrieved.
+        """
+        statuses = {}
+        summaries = ocs_client.get_observation_summaries(observation_ids)
+        for observation_id, observation_summary in summaries.items():
+            try:
+                if not observation_summary["success"]:
+                    raise Exception(f"{observation_summary['error']}")
+
+                state = observation_summary["data"]["status"]
+
+            except Exception as e:
+                logger.error(e)
+                state = "Error"
+            statuses[observation_id] = {
+                "state": state,
+                "scheduled_start": None,
+                "scheduled_end": None,
+            }
+        return statuses
+
+    def update_all_observation_statuses(self, target=None):
+        """Updates the status of the non-terminal observation records in one batch.
 
-        except Exception as e:
-            logger.error(e)
-            state = "Error"
-        return {"state": state, "scheduled_start": None, "scheduled_end": None}
+        Parameters
+        ----------
+        target : `Target | None`, optional
+            Only update the records of this target, by default `None`.
+
+        Returns
+        -------
+        `list[tuple[str, str]]`
+            The observation IDs of the records that failed to update, with the error.
+        """
+        failed_records = []
+        records = ObservationRecord.objects.filter(facility=self.name)
+        if target:
+            records = records.filter(target=target)
+        records = list(
+            records.exclude(status__in=self.get_terminal_observing_states())
+        )
+        statuses = self.get_observation_statuses(
+            [record.observation_id for record in records]
+        )
+        for record in records:
+            try:
+                status = statuses[record.observation_id]
+                record.status = status["state"]
+                record.scheduled_start = status["scheduled_start"]
+                record.scheduled_end = status["scheduled_end"]
+                record.save()
+            except Exception as e:
+                failed_records.append((record.observation_id, str(e)))
+        return failed_records
 
     def get_flux_constant(self) -> u:
         """Returns the astropy quantity that a facility uses for its spectral flux
@@ -2,6 +2,7 @@
 
 __all__ = ["_QExpressionTransformer"]
 import ast
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
@@ -18,6 +19,9 @@ class _QExpressionTransformer(ast.NodeVisitor):
     strict : `bool | None`
         Whether to enforce strict exact matches or allow close and partial matches, by
         default `None`.
+    indexed_descriptors : `Iterable[str]`, optional
+        Descriptors stored in model columns of the same name, which are queried
+        directly instead of through ``astrodata_descriptors``, by default none.
     """
 
     operator_mapping = {
@@ -52,8 +56,9 @@ class _QExpressionTransformer(ast.NodeVisitor):
 
     field_header = "astrodata_descriptors__"
 
-    def __init__(self, strict: bool = False):
+    def __init__(self, strict: bool = False, indexed_descriptors: Iterable[str] = ()):
         self.strict = strict
+        self.indexed_descriptors = frozenset(indexed_descriptors)
 
         # Store current field for operations.
         self.current_field = None
@@ -177,12 +182,26 @@ class _QExpressionTransformer(ast.NodeVisitor):
             relative_tolerance * abs(value), self.absolute_tolerace
         )
 
-        return Q(
-            **{
-                f"{self.field_header}{self.current_field}__gte": lower_bound,
-                f"{self.field_header}{self.current_field}__lte": upper_bound,
-            }
-        )
+        field = self._get_lookup_field(self.current_field)
+        return Q(**{f"{field}__gte": lower_bound, f"{field}__lte": upper_bound})
+
+    def _get_lookup_field(self, name: str) -> str:
+        """Gets the field to query for a descriptor, preferring its indexed column.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the descriptor.
+
+        Returns
+        -------
+        `str`
+            The column name if the descriptor is indexed, else the lookup into
+            ``astrodata_descriptors``.
+        """
+        if name in self.indexed_descriptors:
+            return name
+        return f"{self.field_header}{name}"
 
     def visit_Name(self, node: ast.Name) -> str:
         """Process a variable name into the corresponding field reference in Django.
@@ -195,11 +214,11 @@ class _QExpressionTransformer(ast.NodeVisitor):
         Returns
         -------
         `str`
-            A string that prefixes the field name with a descriptor suitable for Django
-            queries.
+            The field name suitable for Django queries, either an indexed column or a
+            lookup into the astrodata descriptors.
         """
         self.current_field = node.id
-        return f"{self.field_header}{node.id}"
+        return self._get_lookup_field(node.id)
 
     def visit_Constant(self, node: ast.Constant) -> Any:
         """Returns the constant value from an AST Constant node.
@@ -3,15 +3,62 @@
 __all__ = ["AstrodataFilter"]
 
 import ast
+import time
+from functools import lru_cache
+from typing import Any
 
-from django.db.models import Q
+from django.db.models import Q, QuerySet
 
 from goats_tom.filters._q_expression_transformer import _QExpressionTransformer
+from goats_tom.models import DRAGONSFile
+
+# Number of compiled expressions to keep. The frontend sends the same expression on
+# every refresh and page change, so a small cache covers the active users.
+COMPILED_EXPRESSION_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=COMPILED_EXPRESSION_CACHE_SIZE)
+def _compile(expression: str, strict: bool) -> Q | None:
+    """Compiles a normalized expression into a Django Q object.
+
+    The returned Q object is shared between callers and must not be modified in
+    place; combining it with ``&``, ``|`` or ``~`` creates new objects.
+
+    Parameters
+    ----------
+    expression : `str`
+        The expression to compile, stripped of surrounding whitespace.
+    strict : `bool`
+        Whether to return strict queries.
+
+    Returns
+    -------
+    `Q | None`
+        A Django Q object of the expression if valid, else `None`.
+    """
+    if not expression:
+        # Query all files if no filter.
+        return Q()
+
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError:
+        return None
+
+    transformer = _QExpressionTransformer(
+        strict=strict, indexed_descriptors=DRAGONSFile.indexed_descriptors
+    )
+    return transformer.visit(tree.body)
 
 
 class AstrodataFilter:
     """Constructs a Django Q object to filter astrodata descriptors based on a given
-    expression."""
+    expression.
+
+    Descriptors listed in `DRAGONSFile.indexed_descriptors` are queried through their
+    indexed columns. Compiled expressions are kept in a bounded LRU cache keyed on the
+    expression and strictness.
+    """
 
     @staticmethod
     def parse(expression: str, strict: bool = False) -> Q | None:
@@ -29,13 +76,76 @@ class AstrodataFilter:
         `Q | None`
             A Django Q object of the expression if valid, else `None`.
         """
-        if not expression.strip():
-            # Query all files if no filter.
-            return Q()
+        return _compile(expression.strip(), bool(strict))
+
+    @staticmethod
+    def explain(
+        expression: str, queryset: QuerySet, strict: bool = False
+    ) -> dict[str, Any]:
+        """Parse the expression and report the query it generates and its timing.
 
+        Parameters
+        ----------
+        expression : `str`
+            The expression to parse.
+        queryset : `QuerySet`
+            The queryset the filter is applied to.
+        strict : `bool`, optional
+            Whether to return strict queries, by default `False`.
+
+        Returns
+        -------
+        `dict[str, Any]`
+            The expression, whether it was valid and already cached, the generated
+            Q object and SQL, the database query plan, the number of matches, and the
+            compile and query times in milliseconds. Invalid expressions, and those
+            that fail to apply to the queryset, report an error instead of the query
+            details.
+        """
+        hits = _compile.cache_info().hits
+        start = time.perf_counter()
         try:
-            tree = ast.parse(expression, mode="eval")
-            transformer = _QExpressionTransformer(strict=strict)
-            return transformer.visit(tree.body)
-        except SyntaxError:
-            return None
+            query_filter = AstrodataFilter.parse(expression, strict=strict)
+            error = None if query_filter is not None else "Invalid syntax."
+        except Exception as e:
+            query_filter = None
+            error = str(e)
+        compile_time = time.perf_counter() - start
+
+        result = {
+            "expression": expression,
+            "strict": strict,
+            "valid": query_filter is not None,
+            "cached": _compile.cache_info().hits > hits,
+            "compile_time_ms": compile_time * 1000,
+        }
+        if query_filter is None:
+            result["error"] = error
+            return result
+
+        # Lookups that do not apply to the queryset only fail once applied.
+        try:
+            filtered = queryset.filter(query_filter)
+            start = time.perf_counter()
+            count = filtered.count()
+            query_time = time.perf_counter() - start
+            plan = filtered.explain()
+        except Exception as e:
+            result.update({"valid": False, "error": str(e)})
+            return result
+
+        result.update(
+            {
+                "q": str(query_filter),
+                "sql": str(filtered.query),
+                "plan": plan,
+                "count": count,
+                "query_time_ms": query_time * 1000,
+            }
+        )
+        return result
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clears the cache of compiled expressions."""
+        _compile.cache_clear()
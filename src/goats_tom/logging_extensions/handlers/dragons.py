@@ -2,27 +2,37 @@
 
 __all__ = ["DRAGONSHandler"]
 
+import itertools
 import logging
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
+from goats_tom.realtime import (
+    DRAGONSLogBuffer,
+    get_dragons_run_group_name,
+    get_publisher,
+)
 
 
 class DRAGONSHandler(logging.Handler):
     """A custom logging handler that sends messages to a WebSocket consumer group for
-    DRAGONS logs.
+    DRAGONS logs, sent to the group of the run.
+
+    The latest messages are also kept in a `DRAGONSLogBuffer`, so clients that connect
+    during the reduction can replay them. Messages are numbered so clients can skip
+    the ones they received both live and replayed.
     """
 
-    group_name = "dragons_group"
     func_type = "log.message"
 
     def __init__(self, recipe_id: int, reduce_id: int, run_id: int) -> None:
-        """Initialize the handler with the channel layer."""
+        """Initialize the handler with the realtime publisher."""
         super().__init__()
         self.recipe_id = recipe_id
         self.reduce_id = reduce_id
         self.run_id = run_id
-        self.channel_layer = get_channel_layer()
+        self.group_name = get_dragons_run_group_name(run_id)
+        self.log_buffer = DRAGONSLogBuffer(reduce_id)
+        self.publisher = get_publisher()
+        self._seq = itertools.count(1)
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record. The log message is sent to the WebSocket group.
@@ -35,18 +45,26 @@ class DRAGONSHandler(logging.Handler):
         """
         log_entry = self.format(record)
 
-        # Send message to the group.
+        event = {
+            "type": self.func_type,
+            "message": log_entry,
+            "recipe_id": self.recipe_id,
+            "reduce_id": self.reduce_id,
+            "run_id": self.run_id,
+            "seq": next(self._seq),
+        }
+
+        # Buffer the message for replay and send it to the group.
         try:
-            async_to_sync(self.channel_layer.group_send)(
-                self.group_name,
-                {
-                    "type": self.func_type,
-                    "message": log_entry,
-                    "recipe_id": self.recipe_id,
-                    "reduce_id": self.reduce_id,
-                    "run_id": self.run_id,
-                },
-            )
+            self.log_buffer.append(event)
+            self.publisher.publish(self.group_name, event)
         except Exception:
             # Use logging.Handler builtin error handling.
             self.handleError(record)
+
+    def close(self) -> None:
+        """Writes the buffered messages to the cache and closes the handler."""
+        try:
+            self.log_buffer.flush()
+        finally:
+            super().close()
@@ -0,0 +1,19 @@
+"""Django command to hash reduced data saved without a hash."""
+
+from django.core.management.base import BaseCommand
+
+from goats_tom.models import ReducedDatumHash
+
+
+class Command(BaseCommand):
+    """Stores the hashes of reduced data that were bulk created without one, such as
+    by the TOM Toolkit, so they are found as duplicates of new data.
+    """
+
+    help = "Hashes reduced data saved without a hash."
+
+    def handle(self, *args, **options) -> None:
+        num_hashes = ReducedDatumHash.objects.count()
+        ReducedDatumHash.create_missing()
+        num_created = ReducedDatumHash.objects.count() - num_hashes
+        self.stdout.write(f"Hashed {num_created} reduced data.")
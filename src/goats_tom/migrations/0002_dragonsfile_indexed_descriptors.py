@@ -0,0 +1,120 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:46
+
+from django.core.exceptions import ValidationError
+from django.db import migrations, models
+
+INDEXED_DESCRIPTORS = (
+    "exposure_time",
+    "central_wavelength",
+    "ut_datetime",
+    "ut_date",
+    "filter_name",
+    "disperser",
+    "detector_roi_setting",
+    "binning",
+)
+
+
+def backfill_indexed_descriptors(apps, schema_editor):
+    """Copy the indexed descriptors of existing files into their new columns."""
+    DRAGONSFile = apps.get_model("goats_tom", "DRAGONSFile")
+    fields = {name: DRAGONSFile._meta.get_field(name) for name in INDEXED_DESCRIPTORS}
+
+    batch = []
+    for dragons_file in DRAGONSFile.objects.only("id", "astrodata_descriptors").iterator():
+        descriptors = dragons_file.astrodata_descriptors or {}
+        for name, field in fields.items():
+            try:
+                value = field.to_python(descriptors.get(name))
+            except ValidationError:
+                value = None
+            setattr(dragons_file, name, value)
+        batch.append(dragons_file)
+        if len(batch) >= 500:
+            DRAGONSFile.objects.bulk_update(batch, INDEXED_DESCRIPTORS)
+            batch = []
+    if batch:
+        DRAGONSFile.objects.bulk_update(batch, INDEXED_DESCRIPTORS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goats_tom', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='binning',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='central_wavelength',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='detector_roi_setting',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='disperser',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='exposure_time',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='filter_name',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='ut_date',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='ut_datetime',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'exposure_time'], name='dragonsfile_exptime_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'central_wavelength'], name='dragonsfile_centwave_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'ut_datetime'], name='dragonsfile_utdatetime_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'ut_date'], name='dragonsfile_utdate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'filter_name'], name='dragonsfile_filter_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'disperser'], name='dragonsfile_disperser_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'detector_roi_setting'], name='dragonsfile_roi_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dragonsfile',
+            index=models.Index(fields=['dragons_run', 'binning'], name='dragonsfile_binning_idx'),
+        ),
+        migrations.RunPython(backfill_indexed_descriptors, migrations.RunPython.noop),
+    ]
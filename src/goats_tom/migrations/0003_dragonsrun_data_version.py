@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:49
+
+from django.db import migrations, models
+import django.utils.timezone
+import goats_tom.models.dragons_run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goats_tom', '0002_dragonsfile_indexed_descriptors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dragonsrun',
+            name='data_modified',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.AddField(
+            model_name='dragonsrun',
+            name='data_version',
+            field=models.CharField(default=goats_tom.models.dragons_run.new_data_version, editable=False, max_length=32),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goats_tom', '0003_dragonsrun_data_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PrimitivesCatalog',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('instrument', models.CharField(editable=False, max_length=50)),
+                ('version', models.CharField(editable=False, max_length=30)),
+                ('tags', models.JSONField(default=list, editable=False)),
+                ('tags_hash', models.CharField(editable=False, max_length=64)),
+                ('primitives', models.JSONField(default=dict, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('instrument', 'version', 'tags_hash')},
+            },
+        ),
+        migrations.AddField(
+            model_name='dragonsfile',
+            name='primitives_catalog',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='files', to='goats_tom.primitivescatalog'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:23
+
+import hashlib
+import json
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_hashes(apps, schema_editor):
+    """Stores the hashes of the existing reduced data."""
+    ReducedDatum = apps.get_model("tom_dataproducts", "ReducedDatum")
+    ReducedDatumHash = apps.get_model("goats_tom", "ReducedDatumHash")
+    batch = []
+    for reduced_datum in ReducedDatum.objects.only(
+        "pk", "target_id", "data_type", "value"
+    ).iterator(chunk_size=2000):
+        serialized = json.dumps(reduced_datum.value, sort_keys=True, skipkeys=True)
+        batch.append(
+            ReducedDatumHash(
+                reduced_datum_id=reduced_datum.pk,
+                target_id=reduced_datum.target_id,
+                data_type=reduced_datum.data_type,
+                value_hash=hashlib.sha256(serialized.encode()).hexdigest(),
+            )
+        )
+        if len(batch) == 2000:
+            ReducedDatumHash.objects.bulk_create(batch)
+            batch = []
+    ReducedDatumHash.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tom_dataproducts', '0014_alter_reduceddatum_timestamp'),
+        # Depend on the rename to BaseTarget rather than the latest migration, as later
+        # tom_targets data migrations use guardian without depending on it.
+        ('tom_targets', '0021_rename_target_basetarget_alter_basetarget_options'),
+        ('goats_tom', '0004_primitivescatalog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReducedDatumHash',
+            fields=[
+                ('reduced_datum', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='content_hash', serialize=False, to='tom_dataproducts.reduceddatum')),
+                ('data_type', models.CharField(max_length=100)),
+                ('value_hash', models.CharField(max_length=64)),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tom_targets.basetarget')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['target', 'data_type', 'value_hash'], name='reduceddatumhash_lookup_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_hashes, migrations.RunPython.noop),
+    ]
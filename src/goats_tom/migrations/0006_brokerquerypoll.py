@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tom_alerts', '0007_alter_alertstreammessage_message_id'),
+        ('goats_tom', '0005_reduceddatumhash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BrokerQueryPoll',
+            fields=[
+                ('broker_query', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='poll', serialize=False, to='tom_alerts.brokerquery')),
+                ('watermark', models.FloatField(blank=True, null=True)),
+                ('last_polled', models.DateTimeField(blank=True, null=True)),
+                ('last_latency', models.FloatField(blank=True, null=True)),
+                ('last_num_results', models.PositiveIntegerField(default=0)),
+                ('last_num_created', models.PositiveIntegerField(default=0)),
+                ('last_num_duplicates', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+            ],
+        ),
+    ]
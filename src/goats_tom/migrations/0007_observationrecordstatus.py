@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tom_observations', '0012_auto_20210205_1819'),
+        ('goats_tom', '0006_brokerquerypoll'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ObservationRecordStatus',
+            fields=[
+                ('observation_record', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='status_refresh', serialize=False, to='tom_observations.observationrecord')),
+                ('last_refreshed', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+            ],
+        ),
+    ]
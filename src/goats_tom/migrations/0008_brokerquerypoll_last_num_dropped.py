@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goats_tom', '0007_observationrecordstatus'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='brokerquerypoll',
+            name='last_num_dropped',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goats_tom', '0008_brokerquerypoll_last_num_dropped'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PeriodicActorSchedule',
+            fields=[
+                ('actor_name', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('token', models.CharField(max_length=32)),
+            ],
+        ),
+    ]
@@ -1,4 +1,5 @@
 from goats_tom.models.base_recipe import BaseRecipe
+from goats_tom.models.broker_query_poll import BrokerQueryPoll
 from goats_tom.models.dataproduct_metadata import DataProductMetadata
 from goats_tom.models.download import Download
 from goats_tom.models.dragons_file import DRAGONSFile
@@ -12,7 +13,11 @@ from goats_tom.models.logins import (
     LCOLogin,
     TNSLogin,
 )
+from goats_tom.models.observation_record_status import ObservationRecordStatus
+from goats_tom.models.periodic_actor_schedule import PeriodicActorSchedule
+from goats_tom.models.primitives_catalog import PrimitivesCatalog
 from goats_tom.models.recipes_module import RecipesModule
+from goats_tom.models.reduced_datum_hash import ReducedDatumHash
 
 __all__ = [
     "DRAGONSFile",
@@ -23,7 +28,12 @@ __all__ = [
     "DRAGONSReduce",
     "BaseRecipe",
     "RecipesModule",
+    "PrimitivesCatalog",
     "DataProductMetadata",
+    "ReducedDatumHash",
+    "BrokerQueryPoll",
+    "ObservationRecordStatus",
+    "PeriodicActorSchedule",
     "AstroDatalabLogin",
     "GPPLogin",
     "LCOLogin",
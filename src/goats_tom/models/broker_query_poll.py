@@ -0,0 +1,48 @@
+"""Module for the incremental polling state of saved broker queries."""
+
+__all__ = ["BrokerQueryPoll"]
+
+from django.db import models
+from tom_alerts.models import BrokerQuery
+
+
+class BrokerQueryPoll(models.Model):
+    """Stores how far a saved broker query was polled and how the last poll went.
+
+    Attributes
+    ----------
+    broker_query : `models.OneToOneField`
+        The saved broker query.
+    watermark : `models.FloatField`
+        The newest alert observation time, as an MJD, of the loci already polled.
+    last_polled : `models.DateTimeField`
+        When the query was last polled.
+    last_latency : `models.FloatField`
+        The seconds the last poll took.
+    last_num_results : `models.PositiveIntegerField`
+        The number of loci returned by the last poll.
+    last_num_created : `models.PositiveIntegerField`
+        The number of targets created by the last poll.
+    last_num_duplicates : `models.PositiveIntegerField`
+        The number of loci of the last poll that were already targets.
+    last_num_dropped : `models.PositiveIntegerField`
+        The number of loci of the last poll whose alerts could not be fetched.
+    last_error : `models.TextField`
+        The error of the last poll, empty if it succeeded.
+
+    """
+
+    broker_query = models.OneToOneField(
+        BrokerQuery, on_delete=models.CASCADE, primary_key=True, related_name="poll"
+    )
+    watermark = models.FloatField(null=True, blank=True)
+    last_polled = models.DateTimeField(null=True, blank=True)
+    last_latency = models.FloatField(null=True, blank=True)
+    last_num_results = models.PositiveIntegerField(default=0)
+    last_num_created = models.PositiveIntegerField(default=0)
+    last_num_duplicates = models.PositiveIntegerField(default=0)
+    last_num_dropped = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    def __str__(self) -> str:
+        return f"Poll of {self.broker_query_id} up to {self.watermark}"
@@ -2,15 +2,15 @@
 
 __all__ = ["DRAGONSFile"]
 
-import inspect
 from typing import Any
 
 import astrodata
+from django.core.exceptions import ValidationError
 from django.db import models
-from gempy.scripts import showpars
-from numpydoc.docscrape import NumpyDocString
 from tom_dataproducts.models import DataProduct
 
+from goats_tom.models.primitives_catalog import PrimitivesCatalog
+
 
 class DRAGONSFile(models.Model):
     """Represents a file associated with a DRAGONS run.
@@ -28,14 +28,35 @@ class DRAGONSFile(models.Model):
     recipes_module : `models.ForeignKey`
         An optional foreign key to the `RecipesModule`, indicating which
         recipes module is associated with this file.
+    primitives_catalog : `models.ForeignKey`
+        An optional foreign key to the `PrimitivesCatalog` with the primitives that
+        apply to this file.
     observation_type : `models.CharField`
         A character field storing the type of the file.
     object_name : `models.CharField`
         An optional character field storing the name of the object related to
         the file, if applicable.
+    astrodata_descriptors : `models.JSONField`
+        The serialized astrodata descriptors of the file.
+    indexed_descriptors : `tuple[str, ...]`
+        The descriptors that are also stored in typed, indexed columns of the same
+        name, copied from ``astrodata_descriptors`` on save, so filters on them do
+        not need to extract values from JSON. To index another descriptor, add a
+        nullable field and an index for it, then list it here.
 
     """
 
+    indexed_descriptors = (
+        "exposure_time",
+        "central_wavelength",
+        "ut_datetime",
+        "ut_date",
+        "filter_name",
+        "disperser",
+        "detector_roi_setting",
+        "binning",
+    )
+
     dragons_run = models.ForeignKey(
         "goats_tom.DRAGONSRun",
         on_delete=models.CASCADE,
@@ -49,15 +70,80 @@ class DRAGONSFile(models.Model):
         null=True,
         related_name="files",
     )
+    primitives_catalog = models.ForeignKey(
+        "goats_tom.PrimitivesCatalog",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="files",
+    )
     observation_type = models.CharField(max_length=50, null=True, blank=True)
     object_name = models.CharField(max_length=100, null=True, blank=True)
     astrodata_descriptors = models.JSONField(default=dict)
     url = models.CharField(max_length=255, null=False, blank=False)
     product_id = models.CharField(max_length=100, null=False, blank=False)
     observation_class = models.CharField(max_length=50, null=False, blank=False)
+    exposure_time = models.FloatField(null=True, blank=True)
+    central_wavelength = models.FloatField(null=True, blank=True)
+    ut_datetime = models.CharField(max_length=32, null=True, blank=True)
+    ut_date = models.CharField(max_length=32, null=True, blank=True)
+    filter_name = models.CharField(max_length=255, null=True, blank=True)
+    disperser = models.CharField(max_length=255, null=True, blank=True)
+    detector_roi_setting = models.CharField(max_length=255, null=True, blank=True)
+    binning = models.CharField(max_length=255, null=True, blank=True)
 
     class Meta:
         unique_together = ("dragons_run", "data_product")
+        # Filtering is always scoped to a run, so index each descriptor with it.
+        indexes = [
+            models.Index(
+                fields=["dragons_run", "exposure_time"], name="dragonsfile_exptime_idx"
+            ),
+            models.Index(
+                fields=["dragons_run", "central_wavelength"],
+                name="dragonsfile_centwave_idx",
+            ),
+            models.Index(
+                fields=["dragons_run", "ut_datetime"], name="dragonsfile_utdatetime_idx"
+            ),
+            models.Index(
+                fields=["dragons_run", "ut_date"], name="dragonsfile_utdate_idx"
+            ),
+            models.Index(
+                fields=["dragons_run", "filter_name"], name="dragonsfile_filter_idx"
+            ),
+            models.Index(
+                fields=["dragons_run", "disperser"], name="dragonsfile_disperser_idx"
+            ),
+            models.Index(
+                fields=["dragons_run", "detector_roi_setting"],
+                name="dragonsfile_roi_idx",
+            ),
+            models.Index(
+                fields=["dragons_run", "binning"], name="dragonsfile_binning_idx"
+            ),
+        ]
+
+    def save(self, *args, **kwargs) -> None:
+        """Saves the file, keeping the indexed descriptor columns in sync."""
+        self.sync_indexed_descriptors()
+        super().save(*args, **kwargs)
+
+    def sync_indexed_descriptors(self) -> None:
+        """Copies the indexed descriptors from ``astrodata_descriptors`` into their
+        columns.
+
+        Values that cannot be converted to the column type are stored as `None`.
+        """
+        descriptors = self.astrodata_descriptors or {}
+        for name in self.indexed_descriptors:
+            field = self._meta.get_field(name)
+            try:
+                value = field.to_python(descriptors.get(name))
+            except ValidationError:
+                value = None
+            setattr(self, name, value)
 
     @property
     def file_path(self) -> str:
@@ -85,6 +171,10 @@ class DRAGONSFile(models.Model):
         """Lists all available primitives and their documentation for the file type
         associated with this DRAGONS file object.
 
+        The primitives are served from the linked `PrimitivesCatalog`. If the file has
+        none, the catalog for its instrument, tags and DRAGONS version is built and
+        linked first.
+
         Returns
         -------
         `dict[str, Any]`
@@ -93,42 +183,20 @@ class DRAGONSFile(models.Model):
             method's docstring parsed according to the numpy documentation standard.
 
         """
-        data = {}
-        primitive_obj, _ = showpars.get_pars(self.file_path)
-
-        for item in dir(primitive_obj):
-            if not item.startswith("_") and inspect.ismethod(
-                getattr(primitive_obj, item),
-            ):
-                method = getattr(primitive_obj, item)
-                params = primitive_obj.params.get(item)
-                if params is not None:
-                    data[item] = {
-                        "params": {
-                            # Filter and store parameters that do not start with
-                            # "debug".
-                            k: {"value": f"{v}", "doc": f"{params.doc(k)}"}
-                            for k, v in params.items()
-                            if not k.startswith("debug")
-                        },
-                        "docstring": {},
-                    }
-                    try:
-                        docstring = NumpyDocString(method.__doc__)
-                        # Parse and store the docstring content, transforming section
-                        # titles to lowercase and replacing spaces with underscores.
-                        data[item]["docstring"] = {
-                            section.lower().replace(" ", "_"): content
-                            for section, content in docstring._parsed_data.items()
-                        }
-                    except (ValueError, TypeError) as e:
-                        print(f"Error processing docstring for {item}: {str(e)}")
-                        continue
-                else:
-                    print(f"Error getting {item} from params, does not exist.")
-                    continue
-
-        return data
+        if self.primitives_catalog is None:
+            if self.recipes_module is not None:
+                instrument = self.recipes_module.instrument
+            else:
+                instrument = astrodata.open(self.file_path).instrument(generic=True)
+            self.primitives_catalog = PrimitivesCatalog.build(
+                self.file_path, instrument, self.dragons_run.version
+            )
+            # Update only the link, as the data of the file did not change.
+            DRAGONSFile.objects.filter(pk=self.pk).update(
+                primitives_catalog=self.primitives_catalog
+            )
+
+        return self.primitives_catalog.primitives
 
     def list_groups(self) -> list[str]:
         """Returns a list of groups for the file.
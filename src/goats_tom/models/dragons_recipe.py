@@ -5,6 +5,7 @@ __all__ = ["DRAGONSRecipe"]
 from typing import Any
 
 from django.db import models
+from django.db.models import F
 
 
 class DRAGONSRecipe(models.Model):
@@ -172,9 +173,15 @@ class DRAGONSRecipe(models.Model):
             dictionary if no matching file is found.
 
         """
-        first_file = self.recipe.recipes_module.files.filter(
-            observation_type=self.observation_type
-        ).first()
+        first_file = (
+            self.recipe.recipes_module.files.filter(
+                observation_type=self.observation_type
+            )
+            # Prefer a file whose primitives catalog is already built.
+            .order_by(F("primitives_catalog").asc(nulls_last=True))
+            .select_related("primitives_catalog")
+            .first()
+        )
 
         if first_file:
             return first_file.list_primitives_and_docstrings()
@@ -5,12 +5,14 @@ __all__ = ["DRAGONSRun"]
 import datetime
 import shutil
 import subprocess
+import uuid
 from importlib import metadata
 from pathlib import Path
 
 from django.conf import settings
 from django.core.files.storage import default_storage
 from django.db import models
+from django.utils import timezone
 from recipe_system import cal_service
 from tom_dataproducts.models import DataProduct
 from tom_observations.models import ObservationRecord
@@ -39,6 +41,11 @@ def get_dragons_version():
         return "Unknown"
 
 
+def new_data_version() -> str:
+    """Returns a new, unique data version stamp for a run."""
+    return uuid.uuid4().hex
+
+
 class DRAGONSRun(models.Model):
     """Represents a DRAGONS run setup configuration.
 
@@ -67,6 +74,11 @@ class DRAGONSRun(models.Model):
         The time at which this object was created.
     modified : `models.DateTimeField`
         The time at which this object was last modified.
+    data_version : `models.CharField`
+        Stamp that changes whenever the files, recipes or reductions of the run
+        change, used to validate cached payloads.
+    data_modified : `models.DateTimeField`
+        The time at which the files, recipes or reductions last changed.
 
     Methods
     -------
@@ -109,6 +121,10 @@ class DRAGONSRun(models.Model):
         null=False,
         default=get_dragons_version,
     )
+    data_version = models.CharField(
+        max_length=32, editable=False, default=new_data_version
+    )
+    data_modified = models.DateTimeField(editable=False, default=timezone.now)
 
     class Meta:
         # Ensure run_id is unique within the scope of each
@@ -142,6 +158,29 @@ class DRAGONSRun(models.Model):
 
         return super(DRAGONSRun, self).save(*args, **kwargs)
 
+    @classmethod
+    def bump_data_version(cls, pk: int) -> None:
+        """Marks the files, recipes or reductions of a run as changed.
+
+        Parameters
+        ----------
+        pk : `int`
+            The primary key of the run.
+        """
+        cls.objects.filter(pk=pk).update(
+            data_version=new_data_version(), data_modified=timezone.now()
+        )
+
+    def get_data_etag(self) -> str:
+        """Returns the entity tag of the run's data payload.
+
+        Returns
+        -------
+        `str`
+            The quoted entity tag.
+        """
+        return f'"{self.pk}-{self.data_version}"'
+
     def get_output_dir(self) -> Path:
         """Returns the full path to the output directory.
 
@@ -212,6 +251,59 @@ class DRAGONSRun(models.Model):
         """
         return self.get_output_dir() / self.log_filename
 
+    def read_log(self, offset: int | None = None, max_bytes: int = 65536) -> dict:
+        """Reads part of the log file, either from an offset or from the end.
+
+        Parameters
+        ----------
+        offset : `int | None`, optional
+            The byte offset to read from, by default `None` to read the last lines.
+            Reads stop at the last full line unless the whole file was read.
+        max_bytes : `int`, optional
+            The maximum number of bytes to read, by default 65536.
+
+        Returns
+        -------
+        `dict`
+            The byte offset the content starts at, the offset to continue reading
+            from, the size of the log file, and the content read.
+
+        """
+        log_file = self.get_log_file()
+        size = log_file.stat().st_size if log_file.exists() else 0
+
+        if offset is None:
+            start = max(size - max_bytes, 0)
+        else:
+            start = min(offset, size)
+
+        content = b""
+        if start < size:
+            with log_file.open("rb") as f:
+                f.seek(start)
+                content = f.read(max_bytes)
+
+        if offset is None and start > 0:
+            # Start the tail at a full line.
+            newline = content.find(b"\n")
+            if newline != -1:
+                start += newline + 1
+                content = content[newline + 1 :]
+
+        if start + len(content) < size:
+            # End at a full line, so lines and multi-byte characters are not split
+            # across reads.
+            newline = content.rfind(b"\n")
+            if newline != -1:
+                content = content[: newline + 1]
+
+        return {
+            "offset": start,
+            "next_offset": start + len(content),
+            "size": size,
+            "content": content.decode(errors="replace"),
+        }
+
     def get_config_file(self) -> Path:
         """Returns the full path to the configuration file.
 
@@ -0,0 +1,35 @@
+"""Module for the freshness of the cached status of observation records."""
+
+__all__ = ["ObservationRecordStatus"]
+
+from django.db import models
+from tom_observations.models import ObservationRecord
+
+
+class ObservationRecordStatus(models.Model):
+    """Stores when the status of an observation record was last refreshed.
+
+    The status itself is kept on the observation record.
+
+    Attributes
+    ----------
+    observation_record : `models.OneToOneField`
+        The observation record.
+    last_refreshed : `models.DateTimeField`
+        When the status was last refreshed from the facility.
+    last_error : `models.TextField`
+        The error of the last refresh, empty if it succeeded.
+
+    """
+
+    observation_record = models.OneToOneField(
+        ObservationRecord,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="status_refresh",
+    )
+    last_refreshed = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    def __str__(self) -> str:
+        return f"Status of {self.observation_record_id} at {self.last_refreshed}"
@@ -0,0 +1,28 @@
+"""Module for the schedules of the actors run periodically in background."""
+
+__all__ = ["PeriodicActorSchedule"]
+
+from django.db import models
+
+
+class PeriodicActorSchedule(models.Model):
+    """Stores the token of the current schedule of a periodic actor.
+
+    Kept in the database rather than the cache, as a schedule whose token is evicted
+    would stop for good.
+
+    Attributes
+    ----------
+    actor_name : `models.CharField`
+        The name of the periodic actor.
+    token : `models.CharField`
+        The token of the current schedule, earlier schedules stop once they see a
+        different one.
+
+    """
+
+    actor_name = models.CharField(max_length=255, primary_key=True)
+    token = models.CharField(max_length=32)
+
+    def __str__(self) -> str:
+        return f"Schedule {self.token} of {self.actor_name}"
@@ -0,0 +1,177 @@
+"""Module for the precomputed help of DRAGONS primitives."""
+
+__all__ = ["PrimitivesCatalog"]
+
+import hashlib
+import inspect
+from collections.abc import Iterable
+from typing import Any
+
+from django.db import models
+from gempy.scripts import showpars
+from numpydoc.docscrape import NumpyDocString
+
+
+def build_primitives_help(file_path: str) -> tuple[dict[str, Any], set[str]]:
+    """Lists all available primitives and their documentation for a file.
+
+    Parameters
+    ----------
+    file_path : `str`
+        The path to the file to find the applicable primitives for.
+
+    Returns
+    -------
+    `tuple[dict[str, Any], set[str]]`
+        A dictionary containing method names as keys and another dictionary as
+        values, which includes parameters and their documentation, as well as the
+        method's docstring parsed according to the numpy documentation standard, and
+        the tags of the file.
+
+    """
+    data = {}
+    primitive_obj, tags = showpars.get_pars(file_path)
+
+    for item in dir(primitive_obj):
+        if not item.startswith("_") and inspect.ismethod(
+            getattr(primitive_obj, item),
+        ):
+            method = getattr(primitive_obj, item)
+            params = primitive_obj.params.get(item)
+            if params is not None:
+                data[item] = {
+                    "params": {
+                        # Filter and store parameters that do not start with "debug".
+                        k: {"value": f"{v}", "doc": f"{params.doc(k)}"}
+                        for k, v in params.items()
+                        if not k.startswith("debug")
+                    },
+                    "docstring": {},
+                }
+                try:
+                    docstring = NumpyDocString(method.__doc__)
+                    # Parse and store the docstring content, transforming section
+                    # titles to lowercase and replacing spaces with underscores.
+                    data[item]["docstring"] = {
+                        section.lower().replace(" ", "_"): content
+                        for section, content in docstring._parsed_data.items()
+                    }
+                except (ValueError, TypeError) as e:
+                    print(f"Error processing docstring for {item}: {str(e)}")
+                    continue
+            else:
+                print(f"Error getting {item} from params, does not exist.")
+                continue
+
+    return data, set(tags)
+
+
+class PrimitivesCatalog(models.Model):
+    """Stores the primitives, parameters and docstrings that apply to files of an
+    instrument and set of tags for a DRAGONS version.
+
+    Finding the primitives requires instantiating the primitive class and parsing
+    every docstring, so it is done once per combination and shared by all files.
+
+    Attributes
+    ----------
+    instrument : `models.CharField`
+        The generic instrument name.
+    version : `models.CharField`
+        The version of DRAGONS the catalog was built with.
+    tags : `models.JSONField`
+        The sorted astrodata tags the catalog applies to.
+    tags_hash : `models.CharField`
+        A hash of the tags, used to look up the catalog.
+    primitives : `models.JSONField`
+        The primitives keyed by name, with their parameters and parsed docstring.
+    created_at : `models.DateTimeField`
+        Timestamp when the catalog was built.
+
+    """
+
+    instrument = models.CharField(max_length=50, editable=False)
+    version = models.CharField(max_length=30, editable=False)
+    tags = models.JSONField(default=list, editable=False)
+    tags_hash = models.CharField(max_length=64, editable=False)
+    primitives = models.JSONField(default=dict, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("instrument", "version", "tags_hash")
+
+    def __str__(self) -> str:
+        return f"Primitives for {self.instrument} (v{self.version})"
+
+    @staticmethod
+    def hash_tags(tags: Iterable[str]) -> str:
+        """Builds an order independent hash of a set of tags.
+
+        Parameters
+        ----------
+        tags : `Iterable[str]`
+            The astrodata tags.
+
+        Returns
+        -------
+        `str`
+            The hash of the tags.
+
+        """
+        return hashlib.sha256(",".join(sorted(tags)).encode()).hexdigest()
+
+    @classmethod
+    def lookup(
+        cls, instrument: str, version: str, tags: Iterable[str]
+    ) -> "PrimitivesCatalog | None":
+        """Finds the catalog for an instrument, DRAGONS version and set of tags.
+
+        Parameters
+        ----------
+        instrument : `str`
+            The generic instrument name.
+        version : `str`
+            The DRAGONS version.
+        tags : `Iterable[str]`
+            The astrodata tags.
+
+        Returns
+        -------
+        `PrimitivesCatalog | None`
+            The catalog if it was built, else `None`.
+
+        """
+        return cls.objects.filter(
+            instrument=instrument, version=version, tags_hash=cls.hash_tags(tags)
+        ).first()
+
+    @classmethod
+    def build(
+        cls, file_path: str, instrument: str, version: str
+    ) -> "PrimitivesCatalog":
+        """Builds and stores the catalog for the instrument and tags of a file, or
+        returns the existing one.
+
+        Parameters
+        ----------
+        file_path : `str`
+            The path to a file with the instrument and tags to build the catalog for.
+        instrument : `str`
+            The generic instrument name.
+        version : `str`
+            The DRAGONS version.
+
+        Returns
+        -------
+        `PrimitivesCatalog`
+            The catalog.
+
+        """
+        primitives, tags = build_primitives_help(file_path)
+        catalog, _ = cls.objects.get_or_create(
+            instrument=instrument,
+            version=version,
+            tags_hash=cls.hash_tags(tags),
+            defaults={"tags": sorted(tags), "primitives": primitives},
+        )
+        return catalog
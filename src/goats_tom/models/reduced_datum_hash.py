@@ -0,0 +1,169 @@
+"""Module for the content hashes of reduced data."""
+
+__all__ = ["ReducedDatumHash"]
+
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from django.db import models
+from tom_dataproducts.models import ReducedDatum
+from tom_targets.models import BaseTarget
+
+# Number of rows hashed and inserted per query when hashing existing data.
+BATCH_SIZE = 2000
+
+
+class ReducedDatumHash(models.Model):
+    """Stores a hash of the value of a reduced datum, so duplicates of new data can be
+    found with an indexed lookup instead of serializing the target's whole history.
+
+    The target and data type are copied from the datum so the lookup only touches
+    this table.
+
+    Attributes
+    ----------
+    reduced_datum : `models.OneToOneField`
+        The reduced datum the hash belongs to.
+    target : `models.ForeignKey`
+        The target of the reduced datum.
+    data_type : `models.CharField`
+        The data type of the reduced datum.
+    value_hash : `models.CharField`
+        The hash of the value of the reduced datum.
+
+    """
+
+    reduced_datum = models.OneToOneField(
+        ReducedDatum,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="content_hash",
+    )
+    target = models.ForeignKey(BaseTarget, on_delete=models.CASCADE, related_name="+")
+    data_type = models.CharField(max_length=100)
+    value_hash = models.CharField(max_length=64)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["target", "data_type", "value_hash"],
+                name="reduceddatumhash_lookup_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.data_type} hash {self.value_hash} for {self.reduced_datum_id}"
+
+    @staticmethod
+    def hash_value(value: Any) -> str:
+        """Builds a hash of a reduced datum value that does not depend on key order.
+
+        Parameters
+        ----------
+        value : `Any`
+            The JSON value of the reduced datum.
+
+        Returns
+        -------
+        `str`
+            The hash of the value.
+
+        """
+        serialized = json.dumps(value, sort_keys=True, skipkeys=True)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    @classmethod
+    def from_reduced_datum(cls, reduced_datum: ReducedDatum) -> "ReducedDatumHash":
+        """Builds the unsaved hash of a reduced datum.
+
+        Parameters
+        ----------
+        reduced_datum : `ReducedDatum`
+            The saved reduced datum.
+
+        Returns
+        -------
+        `ReducedDatumHash`
+            The hash of the reduced datum.
+
+        """
+        return cls(
+            reduced_datum_id=reduced_datum.pk,
+            target_id=reduced_datum.target_id,
+            data_type=reduced_datum.data_type,
+            value_hash=cls.hash_value(reduced_datum.value),
+        )
+
+    @classmethod
+    def create_for(cls, reduced_datums: Iterable[ReducedDatum]) -> None:
+        """Stores the hashes of saved reduced data, skipping those already hashed.
+
+        Parameters
+        ----------
+        reduced_datums : `Iterable[ReducedDatum]`
+            The saved reduced data.
+
+        """
+        cls.objects.bulk_create(
+            (cls.from_reduced_datum(reduced_datum) for reduced_datum in reduced_datums),
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def create_missing(cls, **filters) -> None:
+        """Stores the hashes of reduced data that were saved without one, such as
+        data bulk created by the TOM Toolkit. Run by the ``hash_reduced_data``
+        command rather than on every lookup.
+
+        Parameters
+        ----------
+        **filters
+            Filters for the reduced data to check.
+
+        """
+        missing = ReducedDatum.objects.filter(content_hash__isnull=True, **filters)
+        cls.create_for(
+            missing.only("pk", "target_id", "data_type", "value").iterator(
+                chunk_size=BATCH_SIZE
+            )
+        )
+
+    @classmethod
+    def find_existing(
+        cls, target: BaseTarget, data_type: str, value_hashes: Iterable[str]
+    ) -> set[str]:
+        """Finds which hashes are already stored for a target and data type.
+
+        Reduced data bulk created without a hash are not found until hashed with
+        `create_missing`.
+
+        Parameters
+        ----------
+        target : `BaseTarget`
+            The target of the data.
+        data_type : `str`
+            The data type of the data.
+        value_hashes : `Iterable[str]`
+            The hashes of the values to look up.
+
+        Returns
+        -------
+        `set[str]`
+            The hashes that are already stored.
+
+        """
+        value_hashes = list(set(value_hashes))
+        existing = set()
+        # Split very large uploads to stay below the query parameter limit.
+        for start in range(0, len(value_hashes), BATCH_SIZE):
+            existing.update(
+                cls.objects.filter(
+                    target=target,
+                    data_type=data_type,
+                    value_hash__in=value_hashes[start : start + BATCH_SIZE],
+                ).values_list("value_hash", flat=True)
+            )
+        return existing
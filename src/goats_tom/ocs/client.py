@@ -8,11 +8,18 @@ from the Gemini Observatory's databases.
 __all__ = ["OCSClient"]
 
 import ssl
+import threading
+import time
 import xmlrpc.client
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Any
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 
 from .gemini_id import GeminiID
 from .parser import OCSParser
@@ -63,9 +70,69 @@ class OCSClient:
     }
     odb_url = "/odbbrowser/targets?programReference="
     wdba_url = "/wdba"
+    # Number of programs fetched at the same time by `get_observation_summaries`.
+    max_workers = 8
+    # Seconds a parsed program summary is reused by `get_observation_summaries`.
+    program_cache_timeout = 60
+    # Maximum number of parsed program summaries kept.
+    program_cache_size = 32
 
     def __init__(self):
         self.parser = OCSParser()
+        # Bypass the expired certificate.
+        self._ssl_context = ssl._create_unverified_context()
+        self._sessions: dict[str, requests.Session] = {}
+        # XML-RPC proxies keep their connection open but aren't thread safe, so each
+        # thread has its own.
+        self._proxies = threading.local()
+        self._lock = threading.Lock()
+        # Lock of each program being fetched, with the number of threads using it.
+        self._program_locks: dict[str, tuple[threading.Lock, int]] = {}
+        self._program_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+
+    def _get_session(self, site: str) -> requests.Session:
+        """Returns the HTTP session of a site, reusing its connections.
+
+        Parameters
+        ----------
+        site : `str`
+            The site.
+
+        Returns
+        -------
+        `requests.Session`
+            The session shared by the threads of this client.
+        """
+        with self._lock:
+            if site not in self._sessions:
+                session = requests.Session()
+                # Use verify=False to bypass expired certificate.
+                session.verify = False
+                adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+                session.mount("https://", adapter)
+                self._sessions[site] = session
+            return self._sessions[site]
+
+    def _get_proxy(self, site: str) -> xmlrpc.client.ServerProxy:
+        """Returns the XML-RPC proxy of a site for the current thread.
+
+        Parameters
+        ----------
+        site : `str`
+            The site.
+
+        Returns
+        -------
+        `xmlrpc.client.ServerProxy`
+            The proxy, reusing its connection between calls.
+        """
+        proxies = self._proxies.__dict__
+        if site not in proxies:
+            url = f"{self._get_site_url(site)}{self.wdba_url}"
+            proxies[site] = xmlrpc.client.ServerProxy(url, context=self._ssl_context)
+        return proxies[site]
 
     def _get_site_url(self, site: str) -> str:
         """Determines the site URL based on the site.
@@ -122,21 +189,16 @@ class OCSClient:
             base_url = self._get_site_url(gemini_id.site)
 
             if method_name is not None:
-                url = f"{base_url}{self.wdba_url}"
-
-                # Bypass the expired certificate.
-                context = ssl._create_unverified_context()
-
                 # Get the method and call it.
-                with xmlrpc.client.ServerProxy(url, context=context) as proxy:
-                    raw_data = getattr(proxy, method_name)(gemini_id.observation_id)
+                proxy = self._get_proxy(gemini_id.site)
+                raw_data = getattr(proxy, method_name)(gemini_id.observation_id)
 
                 return {"success": True, "raw_data": raw_data}
 
             full_url = f"{base_url}{self.odb_url}{gemini_id.program_id}"
 
-            # Use verify=False to bypass expired certificate.
-            response = requests.get(full_url, verify=False, timeout=3)
+            session = self._get_session(gemini_id.site)
+            response = session.get(full_url, timeout=3)
             response.raise_for_status()
             return {"success": True, "raw_data": response.text}
 
@@ -195,16 +257,148 @@ class OCSClient:
         response = self._send_request(observation_id)
         if not response["success"] or skip_parsing:
             return response
-        parsed_response = self.parser.parse_odb_response(response["raw_data"])
-        del response["raw_data"]
+        parsed_response = self.parser.parse_odb_response(
+            response["raw_data"],
+            observation_ids=[observation_id],
+            fields=["observations"],
+        )
+
+        return self._find_observation(parsed_response, observation_id)
+
+    def get_observation_summaries(
+        self, observation_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Fetches summaries for several observation IDs.
+
+        Observations of the same program share a single fetch of the program, and
+        programs are fetched concurrently. Program summaries are reused for
+        ``program_cache_timeout`` seconds.
+
+        Parameters
+        ----------
+        observation_ids : `list[str]`
+            The observation IDs.
+
+        Returns
+        -------
+        `dict[str, dict[str, Any]]`
+            The summary of each observation ID, as returned by
+            `get_observation_summary`.
+        """
+        summaries = {}
+        program_ids = {}
+        for observation_id in dict.fromkeys(observation_ids):
+            try:
+                program_ids[observation_id] = GeminiID(observation_id).program_id
+            except Exception as e:
+                summaries[observation_id] = {"success": False, "error": str(e)}
+
+        unique_program_ids = list(dict.fromkeys(program_ids.values()))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            programs = dict(
+                zip(
+                    unique_program_ids,
+                    executor.map(self._get_cached_program, unique_program_ids),
+                )
+            )
+
+        for observation_id, program_id in program_ids.items():
+            program = programs[program_id]
+            if not program["success"]:
+                summaries[observation_id] = program
+                continue
+            summaries[observation_id] = self._find_observation(
+                program["data"], observation_id
+            )
+        return summaries
+
+    @contextmanager
+    def _program_lock(self, program_id: str) -> Iterator[None]:
+        """Holds the lock of a program, dropping it once no thread uses it.
+
+        Parameters
+        ----------
+        program_id : `str`
+            The program ID.
+        """
+        with self._lock:
+            lock, num_users = self._program_locks.get(program_id, (threading.Lock(), 0))
+            self._program_locks[program_id] = (lock, num_users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, num_users = self._program_locks[program_id]
+                if num_users == 1:
+                    del self._program_locks[program_id]
+                else:
+                    self._program_locks[program_id] = (lock, num_users - 1)
 
-        observations = parsed_response.get("observations", {}).get("observation", [])
+    def _get_cached_program(self, program_id: str) -> dict[str, Any]:
+        """Fetches the observations of a program, reusing recent ones.
+
+        Concurrent calls for the same program wait for a single fetch.
+
+        Parameters
+        ----------
+        program_id : `str`
+            The program ID.
+
+        Returns
+        -------
+        `dict[str, Any]`
+            Program summary with only its observations.
+        """
+        with self._program_lock(program_id):
+            with self._lock:
+                cached = self._program_cache.get(program_id)
+                if cached and time.monotonic() - cached[0] < self.program_cache_timeout:
+                    self._program_cache.move_to_end(program_id)
+                    return {"success": True, "data": cached[1]}
+
+            response = self._send_request(program_id)
+            if response["success"]:
+                # Only the observations are needed to find their status.
+                response["data"] = self.parser.parse_odb_response(
+                    response.pop("raw_data"), fields=["observations"]
+                )
+                with self._lock:
+                    self._program_cache[program_id] = (
+                        time.monotonic(),
+                        response["data"],
+                    )
+                    self._program_cache.move_to_end(program_id)
+                    while len(self._program_cache) > self.program_cache_size:
+                        self._program_cache.popitem(last=False)
+            return response
+
+    def _find_observation(
+        self, program_summary: dict[str, Any], observation_id: str
+    ) -> dict[str, Any]:
+        """Finds an observation in a parsed program summary.
+
+        Parameters
+        ----------
+        program_summary : `dict[str, Any]`
+            The parsed program summary.
+        observation_id : `str`
+            The observation ID.
+
+        Returns
+        -------
+        `dict[str, Any]`
+            Observation summary.
+        """
+        observations = program_summary.get("observations", {}).get("observation", [])
+        # A single observation isn't parsed as a list.
+        if isinstance(observations, dict):
+            observations = [observations]
 
         # Search for matching observation ID.
         for observation in observations:
             if observation.get("id") == observation_id:
-                response["data"] = observation
-                return response
+                return {"success": True, "data": observation}
 
         # Return error if the observation ID is missing from the program ID.
         gemini_id = GeminiID(observation_id)
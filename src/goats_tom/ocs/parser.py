@@ -7,25 +7,85 @@ related to sequences, telescope configurations, and observation database (ODB)
 information.
 
 Each method converts the XML data into a structured dictionary, facilitating
-easier access and manipulation of the data in Python.
+easier access and manipulation of the data in Python. Program and sequence
+responses can be large, so they are parsed incrementally, discarding each
+element once converted.
 """
 
 __all__ = ["OCSParser"]
 
+import io
 import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 
+def _iterparse(xml_data: str | bytes) -> Iterator[tuple[str, ET.Element]]:
+    """Iterates over the start and end events of XML data.
+
+    Parameters
+    ----------
+    xml_data : `str | bytes`
+        The XML data.
+
+    Yields
+    ------
+    `tuple[str, ET.Element]`
+        The event, "start" or "end", and its element.
+    """
+    source = io.BytesIO(xml_data if isinstance(xml_data, bytes) else xml_data.encode())
+    return ET.iterparse(source, events=("start", "end"))
+
+
+def _add_child(parsed: dict[str, Any], tag: str, value: Any) -> None:
+    """Adds a parsed child element, handling repeated elements as lists."""
+    if tag in parsed:
+        if not isinstance(parsed[tag], list):
+            parsed[tag] = [parsed[tag]]
+        parsed[tag].append(value)
+    else:
+        parsed[tag] = value
+
+
+def _parse_odb_element(element: ET.Element) -> Any:
+    """Recursively parses an XML element into a dictionary.
+
+    Parameters
+    ----------
+    element : `ET.Element`
+        An XML element to parse.
+
+    Returns
+    -------
+    `Any`
+        The text of the element if it has any, otherwise a dictionary of its children.
+    """
+    # Consolidate text elements directly
+    if element.text and element.text.strip():
+        return element.text.strip()
+
+    parsed = {}
+    for child in element:
+        _add_child(parsed, child.tag, _parse_odb_element(child))
+    return parsed
+
+
 class OCSParser:
     """Class to parse response from OCS."""
 
-    def parse_sequence_response(self, xml_data: str) -> dict[str, Any]:
+    def parse_sequence_response(
+        self, xml_data: str, systems: Iterable[str] | None = None
+    ) -> dict[str, Any]:
         """Parses the XML data of a sequence and converts it into a dictionary.
 
+        The XML is parsed incrementally and each step is discarded once converted.
+
         Parameters
         ----------
         xml_data : `str`
             The XML data as a string.
+        systems : `Iterable[str] | None`, optional
+            The names of the systems to keep in each step, by default all of them.
 
         Returns
         -------
@@ -33,47 +93,37 @@ class OCSParser:
             A dictionary representation of the XML sequence data.
 
         """
+        systems = set(systems) if systems is not None else None
+        parsed_data = {"version": "", "steps": {}}
+
+        # Stack of the open elements, the root being the first.
+        path = []
+        for event, element in _iterparse(xml_data):
+            if event == "start":
+                path.append(element)
+                if len(path) == 1:
+                    parsed_data["version"] = element.attrib.get("version", "")
+                continue
+            path.pop()
+
+            # Only handle the "step" elements of the root.
+            if len(path) != 1 or element.tag != "step":
+                continue
 
-        def parse_sequence_element(system_element: ET.Element) -> dict[str, Any]:
-            """Parses an element of the XML into a dictionary.
-
-            Parameters
-            ----------
-            system_element : `ET.Element`
-                A "system" XML element.
-
-            Returns
-            -------
-            `dict[str, Any]`
-                A dictionary representation of the "system" element.
-
-            """
-            system_data = {}
-            for param in system_element:
-                # Check if the child element is a "param" tag.
-                if param.tag == "param":
-                    system_data[param.attrib["name"]] = param.attrib["value"]
-            return system_data
-
-        # Parse the XML data from the response.
-        root = ET.fromstring(xml_data)
-
-        # Initialize the dictionary to store parsed data.
-        parsed_data = {"version": root.attrib.get("version", ""), "steps": {}}
-
-        # Iterate over each "step" element found in the XML.
-        for step in root.findall("step"):
-            step_name = step.attrib.get("name", "")
             step_data = {}
-
-            # Iterate over each "system" element within the step.
-            for system in step.findall("system"):
+            for system in element.findall("system"):
                 system_name = system.attrib.get("name", "")
-                step_data[system_name] = parse_sequence_element(system)
-
-            # Assign the processed data of this step to the corresponding step
-            # in "parsed_data".
-            parsed_data["steps"][step_name] = step_data
+                if systems is not None and system_name not in systems:
+                    continue
+                step_data[system_name] = {
+                    param.attrib["name"]: param.attrib["value"]
+                    for param in system
+                    if param.tag == "param"
+                }
+            parsed_data["steps"][element.attrib.get("name", "")] = step_data
+
+            # Discard the converted step.
+            path[0].remove(element)
 
         return parsed_data
 
@@ -141,13 +191,27 @@ class OCSParser:
 
         return parsed_dict
 
-    def parse_odb_response(self, xml_data: str) -> dict[str, Any]:
+    def parse_odb_response(
+        self,
+        xml_data: str,
+        observation_ids: Iterable[str] | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
         """Parses the XML data of program information.
 
+        The XML is parsed incrementally: each field of the program, and each
+        observation, is converted once read and then discarded. Parsing stops as
+        soon as everything requested has been read.
+
         Parameters
         ----------
         xml_data : `str`
             The XML data as a string.
+        observation_ids : `Iterable[str] | None`, optional
+            The IDs of the observations to keep, by default all of them.
+        fields : `Iterable[str] | None`, optional
+            The fields of the program to keep, such as "observations", by default all
+            of them.
 
         Returns
         -------
@@ -155,44 +219,71 @@ class OCSParser:
             A dictionary representation of the parsed XML program data.
 
         """
-
-        def parse_odb_element(element: ET.Element) -> Any:
-            """Recursively parses an XML element into a dictionary.
-
-            Parameters
-            ----------
-            element : `ET.Element`
-                An XML element to parse.
-
-            Returns
-            -------
-            `Any`
-                A XML element.
-
-            """
-            parsed = {}
-            # Consolidate text elements directly
-            if element.text and element.text.strip():
-                return element.text.strip()
-
-            for child in element:
-                child_parsed = parse_odb_element(child)
-                if child.tag in parsed:
-                    # Handle repeated elements as lists
-                    if not isinstance(parsed[child.tag], list):
-                        parsed[child.tag] = [parsed[child.tag]]
-                    parsed[child.tag].append(child_parsed)
-                else:
-                    parsed[child.tag] = child_parsed
-
-            return parsed
-
-        root = ET.fromstring(xml_data)
-
-        # Assuming the root is "queryResult", and the first child is "programs"
-        # which contains a single "program" element.
-        program_element = root.find("./programs/program")
-        if program_element is not None:
-            return parse_odb_element(program_element)
-        else:
+        pending_ids = set(observation_ids) if observation_ids is not None else None
+        pending_fields = set(fields) if fields is not None else None
+        keep_observations = pending_fields is None or "observations" in pending_fields
+
+        # The root is "queryResult", and the first child is "programs" which contains
+        # a single "program" element.
+        program_path = ["queryResult", "programs", "program"]
+        observation_path = [*program_path, "observations", "observation"]
+
+        program = None
+        observations = {}
+        # Stack of the open elements, the root being the first.
+        path = []
+        tags = []
+        for event, element in _iterparse(xml_data):
+            if event == "start":
+                path.append(element)
+                tags.append(element.tag)
+                if tags == program_path and program is None:
+                    program = {}
+                continue
+            path.pop()
+            tags.pop()
+
+            if tags + [element.tag] == observation_path:
+                # Keep the observation if requested, otherwise drop it.
+                observation_id = (element.findtext("id") or "").strip()
+                if keep_observations and (
+                    pending_ids is None or observation_id in pending_ids
+                ):
+                    _add_child(observations, element.tag, _parse_odb_element(element))
+                    if pending_ids is not None:
+                        pending_ids.discard(observation_id)
+                path[-1].remove(element)
+
+                # Stop once the requested observations are the only thing left.
+                if (
+                    pending_ids is not None
+                    and not pending_ids
+                    and pending_fields is not None
+                    and pending_fields <= {"observations"}
+                ):
+                    break
+
+            elif tags == program_path and program is not None:
+                if pending_fields is None or element.tag in pending_fields:
+                    if element.tag == "observations":
+                        # Its observations were already converted and discarded.
+                        _add_child(program, element.tag, observations)
+                    else:
+                        _add_child(program, element.tag, _parse_odb_element(element))
+                    if pending_fields is not None:
+                        pending_fields.discard(element.tag)
+                path[-1].remove(element)
+
+                if pending_fields is not None and not pending_fields:
+                    break
+
+            elif tags == program_path[:2] and element.tag == "program":
+                # Only the first program is parsed.
+                break
+
+        if program is None:
             return {}
+        if observations and "observations" not in program:
+            # Parsing stopped before the end of the observations.
+            program["observations"] = observations
+        return program
@@ -1,4 +1,13 @@
-from .run_data_processor import run_data_processor
+from .run_data_processor import (
+    process_data_product,
+    run_data_processor,
+    save_reduced_data,
+)
 from .spectroscopy_processor import SpectroscopyProcessor
 
-__all__ = ["run_data_processor", "SpectroscopyProcessor"]
+__all__ = [
+    "run_data_processor",
+    "process_data_product",
+    "save_reduced_data",
+    "SpectroscopyProcessor",
+]
@@ -1,14 +1,15 @@
 """Module that overrides the TOMToolkit until it gets merged."""
 
-__all__ = ["run_data_processor"]
+__all__ = ["run_data_processor", "process_data_product", "save_reduced_data"]
 
-import json
 import logging
 from importlib import import_module
 
 from django.conf import settings
 from tom_dataproducts.models import ReducedDatum
 
+from goats_tom.models import ReducedDatumHash
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +34,26 @@ def run_data_processor(dp, dp_type_override=None):
     call
     :rtype: `QuerySet` of `ReducedDatum`
     """
+    data, data_type = process_data_product(dp, dp_type_override)
+    return save_reduced_data(dp, data, data_type)
+
+
+def process_data_product(dp, dp_type_override=None):
+    """
+    Runs the `DATA_PROCESSORS` processor for the data product type without touching
+    the database, so the processing can run in worker threads.
+
+    :param dp: DataProduct which will be processed into a list
+    :type dp: DataProduct
+
+    :param dp_type_override: Optional. DataProduct type to override with. If None, the
+    type from the `dp` object is used.
+    :type dp_type_override: str, optional
+
+    :returns: The list of (timestamp, datum, source) tuples returned by the processor,
+    and the data type to store them as
+    :rtype: tuple of list and str
+    """
     data_type = dp_type_override or dp.data_product_type
     try:
         processor_class = settings.DATA_PROCESSORS[data_type]
@@ -54,30 +75,42 @@ def run_data_processor(dp, dp_type_override=None):
     # data returned by process_data is a list of 3-tuples: (timestamp, datum, source)
     data = data_processor.process_data(dp)
     data_type = data_processor.data_type_override() or data_type
+    return data, data_type
+
+
+def save_reduced_data(dp, data, data_type):
+    """
+    Inserts the processed data of a data product into the database, skipping values
+    already stored for its target.
+
+    :param dp: DataProduct the data was processed from
+    :type dp: DataProduct
 
-    # Add only the new (non-duplicate) ReducedDatum objects to the database
+    :param data: The list of (timestamp, datum, source) tuples to insert
+    :type data: list
 
-    # 1. For quick O(1) lookup, create a hash table of existing ReducedDatum objects
+    :param data_type: The data type to store the data as
+    :type data_type: str
 
-    # Extract exising ReducedDatums for this target, and create a hash table (dict)
-    # (We make the reduced_dataum.value JSONField dict hashable by converting it to a
-    # json string).
-    # This is so we can do O(1) lookups below as we check for duplicate data.
-    existing_reduced_datum_values = {
-        json.dumps(rd.value, sort_keys=True, skipkeys=True): 1
-        for rd in ReducedDatum.objects.filter(target=dp.target)
-    }
+    :returns: QuerySet of `ReducedDatum` objects of the data product
+    :rtype: `QuerySet` of `ReducedDatum`
+    """
+    # Add only the new (non-duplicate) ReducedDatum objects to the database.
+
+    # 1. Hash the new values and look up which hashes are already stored for this
+    # target in a single indexed query, rather than serializing every existing
+    # ReducedDatum of the target.
+    value_hashes = [ReducedDatumHash.hash_value(datum[1]) for datum in data]
+    existing_value_hashes = ReducedDatumHash.find_existing(
+        dp.target, data_type, value_hashes
+    )
 
     # 2. Create the list of new ReducedDatum objects (ready for bulk_create)
     new_reduced_datums = []
+    new_value_hashes = []
     skipped_data = []
-    for datum in data:
-        # Check if the value is already in the ReducedDatum table
-        # (via lookup in the hash table created above for this purpose)
-        if (
-            json.dumps(datum[1], sort_keys=True, skipkeys=True)
-            in existing_reduced_datum_values
-        ):
+    for datum, value_hash in zip(data, value_hashes):
+        if value_hash in existing_value_hashes:
             skipped_data.append(datum)
         else:
             new_reduced_datums.append(
@@ -90,16 +123,25 @@ def run_data_processor(dp, dp_type_override=None):
                     source_name=datum[2],
                 )
             )
+            new_value_hashes.append(value_hash)
 
-    # prior to checking for duplicates, we created the (yet-to-be-inserted)
-    # ReducedDatum list like this:
-    # reduced_datums = [ReducedDatum(target=dp.target, data_product=dp,
-    # data_type=data_type,
-    #                                timestamp=datum[0], value=datum[1],
-    # source_name=datum[2]) for datum in data]
-
-    # 3. Finally, insert the new ReducedDatum objects into the database
+    # 3. Finally, insert the new ReducedDatum objects and their hashes into the
+    # database. Rows whose primary key is not returned by the database backend are
+    # hashed by the `hash_reduced_data` command.
     ReducedDatum.objects.bulk_create(new_reduced_datums)
+    ReducedDatumHash.objects.bulk_create(
+        [
+            ReducedDatumHash(
+                reduced_datum_id=reduced_datum.pk,
+                target_id=reduced_datum.target_id,
+                data_type=data_type,
+                value_hash=value_hash,
+            )
+            for reduced_datum, value_hash in zip(new_reduced_datums, new_value_hashes)
+            if reduced_datum.pk is not None
+        ],
+        ignore_conflicts=True,
+    )
 
     # log what happened
     if skipped_data:
@@ -1,24 +1,75 @@
 """Module that overrides spectroscopy processor for GOATS."""
 
-__all__ = ["SpectroscopyProcessor"]
+__all__ = ["SpectroscopyProcessor", "get_fits_facilities"]
 
+import mimetypes
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 from astropy import units as u
 from astropy.io import fits
 from astropy.time import Time
 from astropy.wcs import WCS
 from specutils import Spectrum1D
 from tom_dataproducts.models import DataProduct
+from tom_dataproducts.processors.data_serializers import SpectrumSerializer
 from tom_dataproducts.processors.spectroscopy_processor import (
     SpectroscopyProcessor as BaseSpectroscopyProcessor,
 )
-from tom_observations.facility import get_service_class, get_service_classes
+from tom_observations.facility import BaseObservationFacility, get_service_classes
+
+# Name of the extensions holding the spectra in multi-extension FITS files.
+SCIENCE_EXTNAME = "SCI"
+
+
+@lru_cache(maxsize=1)
+def get_fits_facilities() -> tuple[tuple[str, BaseObservationFacility], ...]:
+    """Instantiates the facilities used to detect where a FITS file comes from.
+
+    The facilities are only instantiated once per process instead of once per HDU.
+
+    Returns
+    -------
+    `tuple[tuple[str, BaseObservationFacility], ...]`
+        The facility names and instances, in the order they are configured.
+    """
+    return tuple((name, clazz()) for name, clazz in get_service_classes().items())
 
 
 class SpectroscopyProcessor(BaseSpectroscopyProcessor):
     """Custom logic for GOATS processing. This is taken from TOMToolkit."""
 
+    def process_data(
+        self, data_product: DataProduct
+    ) -> list[tuple[datetime, dict, str]]:
+        """Processes a data product into serialized spectra.
+
+        Multi-extension FITS files produce one spectrum per science extension.
+
+        Parameters
+        ----------
+        data_product : `DataProduct`
+            The data product to process.
+
+        Returns
+        -------
+        `list[tuple[datetime, dict, str]]`
+            The observation date, serialized spectrum and facility name of each
+            spectrum.
+        """
+        mimetype = mimetypes.guess_type(data_product.data.path)[0]
+        if mimetype not in self.FITS_MIMETYPES:
+            return super().process_data(data_product)
+
+        serializer = SpectrumSerializer()
+        return [
+            (date_obs, serializer.serialize(spectrum), facility_name)
+            for spectrum, date_obs, facility_name in self._process_spectra_from_fits(
+                data_product
+            )
+        ]
+
     def _process_spectrum_from_fits(
         self, dataproduct: DataProduct
     ) -> tuple[Spectrum1D, datetime, str]:
@@ -33,59 +84,133 @@ class SpectroscopyProcessor(BaseSpectroscopyProcessor):
         -------
         `tuple[Spectrum1D, Time, str]`
             A tuple containing the spectrum object, observation date and time, and the
-            name of the facility that processed the FITS file.
+            name of the facility that processed the FITS file. For multi-extension
+            files, the first spectrum is returned.
+        """
+        return self._process_spectra_from_fits(dataproduct)[0]
+
+    def _process_spectra_from_fits(
+        self, dataproduct: DataProduct
+    ) -> list[tuple[Spectrum1D, datetime, str]]:
+        """Processes a FITS file to extract all its spectra in a single pass.
+
+        Parameters
+        ----------
+        dataproduct : `DataProduct`
+            The data product object containing the path to the FITS file.
+
+        Returns
+        -------
+        `list[tuple[Spectrum1D, Time, str]]`
+            The spectrum object, observation date and time, and the name of the
+            facility that processed the FITS file, for each spectrum in the file.
+
+        Raises
+        ------
+        ValueError
+            Raised if the file has no spectrum or contains image data.
+        """
+        with fits.open(dataproduct.data.path, memmap=True) as hdul:
+            spectrum_hdus = self._get_spectrum_hdus(hdul)
+            if not spectrum_hdus:
+                raise ValueError("No spectrum found in FITS file.")
+
+            # Check all headers for the facility.
+            facility_name = "UNKNOWN"
+            facility = None
+            date_obs = datetime.now()
+            for hdu in hdul:
+                for name, candidate in get_fits_facilities():
+                    if candidate.is_fits_facility(hdu.header):
+                        facility_name = name
+                        facility = candidate
+                        date_obs = facility.get_date_obs_from_fits_header(hdu.header)
+                        break
+                if facility is not None:
+                    break  # Stop checking if a valid facility is found.
+
+            date_obs = Time(date_obs).to_datetime()
+            return [
+                (self._build_spectrum(hdu, facility), date_obs, facility_name)
+                for hdu in spectrum_hdus
+            ]
+
+    @staticmethod
+    def _get_spectrum_hdus(hdul: fits.HDUList) -> list[fits.hdu.base.ExtensionHDU]:
+        """Finds the HDUs holding spectra.
+
+        Parameters
+        ----------
+        hdul : `fits.HDUList`
+            The opened FITS file.
+
+        Returns
+        -------
+        `list[fits.hdu.base.ExtensionHDU]`
+            The science extensions with data, or the first HDU with image data if
+            there are none.
+        """
+        image_hdus = [
+            hdu
+            for hdu in hdul
+            if isinstance(hdu, (fits.PrimaryHDU, fits.ImageHDU)) and hdu.size
+        ]
+        science_hdus = [hdu for hdu in image_hdus if hdu.name == SCIENCE_EXTNAME]
+        return science_hdus or image_hdus[:1]
+
+    def _build_spectrum(
+        self, hdu: fits.hdu.base.ExtensionHDU, facility: BaseObservationFacility | None
+    ) -> Spectrum1D:
+        """Builds the spectrum of an HDU.
+
+        Parameters
+        ----------
+        hdu : `fits.hdu.base.ExtensionHDU`
+            The HDU holding the flux.
+        facility : `BaseObservationFacility | None`
+            The facility that processed the file, if found.
+
+        Returns
+        -------
+        `Spectrum1D`
+            The spectrum.
+
+        Raises
+        ------
+        ValueError
+            Raised if the HDU contains image data.
         """
-        # Get flux and primary header using fits.getdata.
-        flux, primary_header = fits.getdata(dataproduct.data.path, header=True)
+        header = hdu.header.copy()
 
-        naxis = primary_header.get("NAXIS")
+        naxis = header.get("NAXIS")
         if naxis is not None and naxis == 2:
             raise ValueError("Cannot plot FITS image data (NAXIS=2).")
 
+        flux = hdu.data
         dim = len(flux.shape)
         if dim == 3:
             flux = flux[0, 0, :]
         elif flux.shape[0] == 2:
             flux = flux[0, :]
-        if primary_header["CUNIT1"] == "deg":
+        if header.get("CUNIT1") == "deg":
             # Loop through header keywords.
-            for key, value in primary_header.items():
+            for key, value in header.items():
                 if "WAT" in key and value is not None:
                     if "label=Wavelength units=" in value:
-                        primary_header["CUNIT1"] = value.split("units=")[-1].strip()
+                        header["CUNIT1"] = value.split("units=")[-1].strip()
                         break
 
-        wcs = WCS(header=primary_header, naxis=1)
+        wcs = WCS(header=header, naxis=1)
 
         # Get the flux unit and convert to astropy unit.
-        flux_unit = primary_header.get("BUNIT")
+        flux_unit = header.get("BUNIT")
         if flux_unit is not None:
             flux_unit = u.Unit(flux_unit)
-
-        # Initialize facility information.
-        facility_name = "UNKNOWN"
-        date_obs = datetime.now()
-
-        # Open the FITS file to check all headers for the facility.
-        with fits.open(dataproduct.data.path) as hdul:
-            for hdu in hdul:
-                header = hdu.header
-                for facility_class in get_service_classes():
-                    facility = get_service_class(facility_class)()
-                    if facility.is_fits_facility(header):
-                        facility_name = facility_class
-                        if flux_unit is None:
-                            flux_unit = facility.get_flux_constant()
-                        date_obs = facility.get_date_obs_from_fits_header(header)
-                        break
-                if facility_name != "UNKNOWN":
-                    break  # Stop checking if a valid facility is found.
-
-        # Use a default flux unit if none was determined.
-        if flux_unit is None:
+        elif facility is not None:
+            flux_unit = facility.get_flux_constant()
+        else:
+            # Use a default flux unit if none was determined.
             flux_unit = self.DEFAULT_FLUX_CONSTANT
 
-        # Create a Spectrum1D object with the flux and WCS.
-        spectrum = Spectrum1D(flux=flux * flux_unit, wcs=wcs)
-
-        return spectrum, Time(date_obs).to_datetime(), facility_name
+        # Copy the flux out of the memory-mapped file before it is closed.
+        return Spectrum1D(flux=np.array(flux) * flux_unit, wcs=wcs)
@@ -1,9 +1,26 @@
+from .coalescing_buffer import CoalescingBuffer
 from .download_state import DownloadState
 from .dragons_progress import DRAGONSProgress
+from .groups import (
+    BROADCAST_GROUP_NAME,
+    get_dragons_run_group_name,
+    get_updates_group_name,
+)
+from .log_buffer import DRAGONSLogBuffer
 from .notification_instance import NotificationInstance
+from .publish_progress import PublishProgress
+from .publisher import RealtimePublisher, get_publisher
 
 __all__ = [
     "DownloadState",
     "NotificationInstance",
     "DRAGONSProgress",
+    "PublishProgress",
+    "DRAGONSLogBuffer",
+    "BROADCAST_GROUP_NAME",
+    "get_dragons_run_group_name",
+    "get_updates_group_name",
+    "CoalescingBuffer",
+    "RealtimePublisher",
+    "get_publisher",
 ]
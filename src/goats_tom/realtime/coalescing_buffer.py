@@ -0,0 +1,99 @@
+"""Bounded message buffer that replaces stale messages with newer ones."""
+
+__all__ = ["CoalescingBuffer"]
+
+import itertools
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+# Marks the keys generated for messages added without a key.
+_UNKEYED = object()
+
+
+class CoalescingBuffer:
+    """A first-in, first-out buffer of messages where messages added with a key
+    replace the pending message with the same key.
+
+    Once the buffer is full, the oldest message without a key is dropped, so the
+    latest state of keyed messages such as progress updates is never lost.
+
+    Parameters
+    ----------
+    max_size : `int`
+        The number of messages to buffer before dropping the oldest ones.
+
+    Attributes
+    ----------
+    dropped : `int`
+        The number of messages dropped because the buffer was full.
+    coalesced : `int`
+        The number of messages replaced by a newer message with the same key.
+
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.dropped = 0
+        self.coalesced = 0
+        self._messages: OrderedDict[Hashable, Any] = OrderedDict()
+        self._unkeyed_ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def put(self, message: Any, key: Hashable | None = None) -> None:
+        """Adds a message to the buffer.
+
+        Parameters
+        ----------
+        message : `Any`
+            The message.
+        key : `Hashable | None`, optional
+            The key of the message. A pending message with the same key is replaced,
+            by default `None` to always keep the message.
+
+        """
+        if key is None:
+            key = (_UNKEYED, next(self._unkeyed_ids))
+        elif key in self._messages:
+            # Replace the stale message, moving it behind the messages added since.
+            del self._messages[key]
+            self.coalesced += 1
+
+        self._messages[key] = message
+
+        if len(self._messages) > self.max_size:
+            self._drop_oldest()
+
+    def pop(self) -> Any:
+        """Removes and returns the oldest message.
+
+        Returns
+        -------
+        `Any`
+            The oldest message.
+
+        Raises
+        ------
+        KeyError
+            Raised if the buffer is empty.
+
+        """
+        _, message = self._messages.popitem(last=False)
+        return message
+
+    def clear(self) -> None:
+        """Discards all pending messages."""
+        self._messages.clear()
+
+    def _drop_oldest(self) -> None:
+        """Drops the oldest message without a key, or the oldest message if all have
+        keys.
+        """
+        drop_key = next(
+            (k for k in self._messages if isinstance(k, tuple) and k[0] is _UNKEYED),
+            next(iter(self._messages)),
+        )
+        del self._messages[drop_key]
+        self.dropped += 1
@@ -4,17 +4,25 @@ __all__ = ["DownloadState"]
 
 import uuid
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
+from .groups import get_updates_group_name
+from .publisher import get_publisher
 
 
 class DownloadState:
-    """Class responsible for managing the state of the download task."""
+    """Class responsible for managing the state of the download task.
+
+    Parameters
+    ----------
+    user_id : `int | None`, optional
+        The ID of the user to send the updates to, by default `None` to send them to
+        everyone.
+
+    """
 
-    group_name = "updates_group"
     func_type = "download.message"
 
-    def __init__(self) -> None:
+    def __init__(self, user_id: int | None = None) -> None:
+        self.group_name: str = get_updates_group_name(user_id)
         self.unique_id: str = f"{uuid.uuid4()}"
         self.label: str = ""
         self.status: str = ""
@@ -67,10 +75,10 @@ class DownloadState:
         self._send()
 
     def _send(self) -> None:
-        """Sends a download update over the websocket."""
-        channel_layer = get_channel_layer()
-
-        async_to_sync(channel_layer.group_send)(
+        """Sends a download update over the websocket without waiting for it to be
+        delivered. Pending updates of the same download are replaced.
+        """
+        get_publisher().publish(
             self.group_name,
             {
                 "type": self.func_type,
@@ -82,6 +90,7 @@ class DownloadState:
                 "done": self.done,
                 "error": self.error,
             },
+            key=("download", self.unique_id),
         )
 
     @staticmethod
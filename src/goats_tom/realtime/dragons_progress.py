@@ -2,16 +2,17 @@
 
 __all__ = ["DRAGONSProgress"]
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
-
 from goats_tom.models import DRAGONSReduce
 
+from .groups import get_dragons_run_group_name
+from .publisher import get_publisher
+
 
 class DRAGONSProgress:
-    """Class responsible for updating DRAGONS recipe progress."""
+    """Class responsible for updating DRAGONS recipe progress, sent to the group of
+    the run.
+    """
 
-    group_name = "dragons_group"
     func_type = "recipe.progress.message"
 
     @classmethod
@@ -33,7 +34,8 @@ class DRAGONSProgress:
 
     @classmethod
     def _send(cls, status: str, run_id: int, recipe_id: int, reduce_id: int) -> None:
-        """Sends a progress update to the specified group channel.
+        """Sends a progress update to the group of the run without waiting for it to
+        be delivered. Pending progress of the same reduction is replaced.
 
         Parameters
         ----------
@@ -47,9 +49,8 @@ class DRAGONSProgress:
             The identifier for the reduction process within the recipe.
 
         """
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            cls.group_name,
+        get_publisher().publish(
+            get_dragons_run_group_name(run_id),
             {
                 "type": cls.func_type,
                 "status": status,
@@ -57,4 +58,5 @@ class DRAGONSProgress:
                 "recipe_id": recipe_id,
                 "reduce_id": reduce_id,
             },
+            key=("recipe", reduce_id),
         )
@@ -0,0 +1,46 @@
+"""Names of the channel layer groups that realtime updates are sent to."""
+
+__all__ = [
+    "BROADCAST_GROUP_NAME",
+    "get_dragons_run_group_name",
+    "get_updates_group_name",
+]
+
+# Group every updates connection joins, for messages not addressed to a user.
+BROADCAST_GROUP_NAME = "updates_group"
+
+
+def get_updates_group_name(user_id: int | None = None) -> str:
+    """Returns the group for the updates of a user.
+
+    Parameters
+    ----------
+    user_id : `int | None`, optional
+        The ID of the user, by default `None`.
+
+    Returns
+    -------
+    `str`
+        The group of the user, or the broadcast group if no user is given.
+
+    """
+    if user_id is None:
+        return BROADCAST_GROUP_NAME
+    return f"updates_user_{user_id}"
+
+
+def get_dragons_run_group_name(run_id: int) -> str:
+    """Returns the group for the logs and progress of a DRAGONS run.
+
+    Parameters
+    ----------
+    run_id : `int`
+        The ID of the DRAGONS run.
+
+    Returns
+    -------
+    `str`
+        The group of the run.
+
+    """
+    return f"dragons_run_{run_id}"
@@ -0,0 +1,130 @@
+"""Class that keeps the most recent DRAGONS log lines of each reduction."""
+
+__all__ = ["DRAGONSLogBuffer"]
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+
+from django.core.cache import cache
+
+# Number of log lines kept per reduction for clients that connect mid-reduction.
+LOG_REPLAY_SIZE = 200
+# Reductions rarely run longer than a day, so older buffers are no longer needed.
+LOG_REPLAY_TIMEOUT = 60 * 60 * 24
+# Seconds between writes of a buffer to the cache.
+LOG_FLUSH_INTERVAL = 2
+
+
+class DRAGONSLogBuffer:
+    """Bounded buffer of the latest log messages of a reduction, stored in the cache
+    so any process can replay them.
+
+    Each reduction is logged by a single handler, so the buffer is kept in memory and
+    written without reading it back. Writing the whole buffer on every line is costly
+    with the file-based cache, so it is written at most every `LOG_FLUSH_INTERVAL`
+    seconds, and when flushed at the end of the reduction. Messages appended within
+    the interval are written by a timer once it elapses, so the latest lines are
+    replayed even while the reduction logs nothing else.
+
+    Parameters
+    ----------
+    reduce_id : `int`
+        The ID of the reduction.
+    size : `int`, optional
+        The number of log messages to keep, by default `LOG_REPLAY_SIZE`.
+
+    """
+
+    def __init__(self, reduce_id: int, size: int = LOG_REPLAY_SIZE) -> None:
+        self.reduce_id = reduce_id
+        self.key = self.get_key(reduce_id)
+        self.messages: deque[dict] = deque(maxlen=size)
+        self._last_flush: float | None = None
+        self._dirty = False
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        cache.delete(self.key)
+
+    @staticmethod
+    def get_key(reduce_id: int) -> str:
+        """Returns the cache key of the buffer of a reduction.
+
+        Parameters
+        ----------
+        reduce_id : `int`
+            The ID of the reduction.
+
+        Returns
+        -------
+        `str`
+            The cache key.
+
+        """
+        return f"dragons_log_buffer:{reduce_id}"
+
+    def append(self, message: dict) -> None:
+        """Appends a log message, dropping the oldest one if the buffer is full.
+
+        Parameters
+        ----------
+        message : `dict`
+            The log message event.
+
+        """
+        with self._lock:
+            self.messages.append(message)
+            self._dirty = True
+            if self._timer is not None:
+                # Already written once the pending timer fires.
+                return
+            elapsed = (
+                LOG_FLUSH_INTERVAL
+                if self._last_flush is None
+                else time.monotonic() - self._last_flush
+            )
+            if elapsed >= LOG_FLUSH_INTERVAL:
+                self._write()
+                return
+            self._timer = threading.Timer(LOG_FLUSH_INTERVAL - elapsed, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Writes the buffer to the cache if messages were appended since the last
+        write, cancelling any pending timed write.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._write()
+
+    def _write(self) -> None:
+        """Writes the buffer to the cache if it changed, holding the lock."""
+        if not self._dirty:
+            return
+        cache.set(self.key, list(self.messages), LOG_REPLAY_TIMEOUT)
+        self._last_flush = time.monotonic()
+        self._dirty = False
+
+    @classmethod
+    def get_many(cls, reduce_ids: Iterable[int]) -> list[dict]:
+        """Returns the buffered log messages of reductions.
+
+        Parameters
+        ----------
+        reduce_ids : `Iterable[int]`
+            The IDs of the reductions.
+
+        Returns
+        -------
+        `list[dict]`
+            The buffered log messages, oldest first for each reduction, in the order
+            of the given reductions.
+
+        """
+        keys = [cls.get_key(reduce_id) for reduce_id in reduce_ids]
+        buffers = cache.get_many(keys)
+        return [message for key in keys for message in buffers.get(key, [])]
@@ -4,14 +4,13 @@ __all__ = ["NotificationInstance"]
 
 import uuid
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
+from .groups import get_updates_group_name
+from .publisher import get_publisher
 
 
 class NotificationInstance:
     """Class responsible for creating and sending a notification."""
 
-    group_name = "updates_group"
     func_type = "notification.message"
 
     @classmethod
@@ -20,6 +19,7 @@ class NotificationInstance:
         label: str = "",
         message: str = "",
         color: str = "primary",
+        user_id: int | None = None,
     ) -> None:
         """Creates and sends a notification.
 
@@ -32,14 +32,25 @@ class NotificationInstance:
         color : `str`, optional
             The bootstrap color scheme to apply to the notification, by default
             "primary".
+        user_id : `int | None`, optional
+            The ID of the user to notify, by default `None` to notify everyone.
 
         """
         unique_id = f"{uuid.uuid4()}"
-        cls._send(unique_id, label, message, color)
+        cls._send(
+            unique_id, label, message, color, group_name=get_updates_group_name(user_id)
+        )
 
     @classmethod
-    def _send(cls, unique_id: str, label: str, message: str, color: str) -> None:
-        """Sends a notification.
+    def _send(
+        cls,
+        unique_id: str,
+        label: str,
+        message: str,
+        color: str,
+        group_name: str,
+    ) -> None:
+        """Sends a notification without waiting for it to be delivered.
 
         Parameters
         ----------
@@ -51,11 +62,12 @@ class NotificationInstance:
             The label of the notification.
         color : `str`
             The bootstrap color scheme to apply to the notification.
+        group_name : `str`
+            The group to send the notification to.
 
         """
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            cls.group_name,
+        get_publisher().publish(
+            group_name,
             {
                 "type": cls.func_type,
                 "unique_id": unique_id,
@@ -0,0 +1,54 @@
+"""Class that sends the progress of publishing DRAGONS outputs as data products."""
+
+__all__ = ["PublishProgress"]
+
+from .groups import get_dragons_run_group_name
+from .publisher import get_publisher
+
+
+class PublishProgress:
+    """Class responsible for updating the status of each file published from a DRAGONS
+    run, sent to the group of the run.
+    """
+
+    func_type = "publish.progress.message"
+
+    @classmethod
+    def send(
+        cls,
+        run_id: int,
+        product_id: str,
+        status: str,
+        message: str = "",
+        dataproduct_id: int | None = None,
+    ) -> None:
+        """Sends the status of a file without waiting for it to be delivered. Pending
+        updates of the same file are replaced.
+
+        Parameters
+        ----------
+        run_id : `int`
+            The identifier for the run the file belongs to.
+        product_id : `str`
+            The path of the file relative to the media root, used as product ID.
+        status : `str`
+            The status of the file, one of "queued", "processing", "done", "skipped" or
+            "error".
+        message : `str`, optional
+            Details about the status, such as the error, by default "".
+        dataproduct_id : `int | None`, optional
+            The ID of the created data product, by default `None`.
+
+        """
+        get_publisher().publish(
+            get_dragons_run_group_name(run_id),
+            {
+                "type": cls.func_type,
+                "run_id": run_id,
+                "product_id": product_id,
+                "status": status,
+                "message": message,
+                "dataproduct_id": dataproduct_id,
+            },
+            key=("publish", product_id),
+        )
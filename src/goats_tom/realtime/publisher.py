@@ -0,0 +1,185 @@
+"""Shared publisher that sends realtime updates without blocking the caller."""
+
+__all__ = ["RealtimePublisher", "get_publisher"]
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from collections.abc import Hashable
+
+from channels.layers import get_channel_layer
+
+from .coalescing_buffer import CoalescingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Number of messages waiting to be sent before the oldest ones are dropped.
+MAX_PENDING_MESSAGES = 1000
+# Seconds to wait for pending messages to be sent when the process exits.
+EXIT_FLUSH_TIMEOUT = 5
+# Seconds between logs of the message counters of a publisher.
+STATS_LOG_INTERVAL = 10 * 60
+
+# Publishers keyed by the ID of the process that started them.
+_publishers: dict[int, "RealtimePublisher"] = {}
+_publishers_lock = threading.Lock()
+
+
+class RealtimePublisher:
+    """Sends messages to channel layer groups from a background event loop.
+
+    All messages of a process go through one event loop thread and one channel layer,
+    so the connection to the channel layer is reused instead of being set up by
+    ``async_to_sync`` for every message. Publishing only adds the message to a
+    `CoalescingBuffer` and returns, so progress updates can be published from tight
+    loops. Pending messages with the same key are coalesced, so only the latest
+    progress of a task is sent. The message counters are logged every
+    `STATS_LOG_INTERVAL` seconds while messages are sent, and when the process exits.
+
+    Parameters
+    ----------
+    max_pending : `int`, optional
+        The number of messages to buffer before dropping the oldest ones, by default
+        `MAX_PENDING_MESSAGES`.
+
+    Attributes
+    ----------
+    sent : `int`
+        The number of messages sent.
+    failed : `int`
+        The number of messages the channel layer failed to send.
+
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_MESSAGES) -> None:
+        self.sent = 0
+        self.failed = 0
+        self._buffer = CoalescingBuffer(max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._last_stats_log = time.monotonic()
+        self._loop = asyncio.new_event_loop()
+        self._wakeup = asyncio.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="realtime-publisher", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        """The number of messages dropped because too many were pending."""
+        return self._buffer.dropped
+
+    @property
+    def coalesced(self) -> int:
+        """The number of messages replaced by a newer message with the same key."""
+        return self._buffer.coalesced
+
+    def publish(
+        self, group_name: str, message: dict, key: Hashable | None = None
+    ) -> None:
+        """Queues a message to send to a group and returns immediately.
+
+        Parameters
+        ----------
+        group_name : `str`
+            The group to send the message to.
+        message : `dict`
+            The message, including its "type".
+        key : `Hashable | None`, optional
+            The key of the message. A pending message with the same key and group is
+            replaced, by default `None` to always send the message.
+
+        """
+        if key is not None:
+            key = (group_name, key)
+        with self._lock:
+            self._buffer.put((group_name, message), key=key)
+            self._idle.clear()
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until all pending messages are sent.
+
+        Parameters
+        ----------
+        timeout : `float | None`, optional
+            The number of seconds to wait, by default `None` to wait indefinitely.
+
+        Returns
+        -------
+        `bool`
+            `True` if all messages were sent, `False` if the timeout was reached.
+
+        """
+        return self._idle.wait(timeout)
+
+    def log_stats(self) -> None:
+        """Logs the number of messages sent, failed, dropped and coalesced."""
+        self._last_stats_log = time.monotonic()
+        logger.info(
+            "Realtime publisher: %d sent, %d failed, %d dropped, %d coalesced.",
+            self.sent,
+            self.failed,
+            self.dropped,
+            self.coalesced,
+        )
+
+    def _run(self) -> None:
+        """Runs the event loop of the publisher."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._send_pending())
+
+    async def _send_pending(self) -> None:
+        """Sends pending messages as they are published."""
+        channel_layer = get_channel_layer()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while True:
+                with self._lock:
+                    if not self._buffer:
+                        self._idle.set()
+                        break
+                    group_name, message = self._buffer.pop()
+                try:
+                    await channel_layer.group_send(group_name, message)
+                    self.sent += 1
+                except Exception:
+                    self.failed += 1
+                    logger.exception("Failed to send update to %s.", group_name)
+                if time.monotonic() - self._last_stats_log >= STATS_LOG_INTERVAL:
+                    self.log_stats()
+
+
+def get_publisher() -> RealtimePublisher:
+    """Returns the publisher of the current process, starting it if needed.
+
+    A new publisher is started in forked processes, as threads do not survive a fork.
+
+    Returns
+    -------
+    `RealtimePublisher`
+        The publisher.
+
+    """
+    pid = os.getpid()
+    with _publishers_lock:
+        if pid not in _publishers:
+            _publishers[pid] = RealtimePublisher()
+        return _publishers[pid]
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    """Gives pending messages a chance to be sent before the process exits, and logs
+    the message counters.
+    """
+    publisher = _publishers.get(os.getpid())
+    if publisher is not None:
+        publisher.flush(EXIT_FLUSH_TIMEOUT)
+        publisher.log_stats()
@@ -4,5 +4,5 @@ from goats_tom.consumers import DRAGONSConsumer, UpdatesConsumer
 
 websocket_urlpatterns = [
     path("ws/updates/", UpdatesConsumer.as_asgi()),
-    path("ws/dragons/", DRAGONSConsumer.as_asgi()),
+    path("ws/dragons/<int:run_id>/", DRAGONSConsumer.as_asgi()),
 ]
@@ -1,8 +1,10 @@
 from .antares2goats import Antares2GoatsSerializer
+from .antares2goats_bulk import Antares2GoatsBulkSerializer
 from .astro_datalab import AstroDatalabSerializer
 from .base_recipe import BaseRecipeSerializer
 from .dataproduct import DataProductSerializer
 from .dataproduct_metadata import DataProductMetadataSerializer
+from .dataproducts_publish import DataProductsPublishSerializer
 from .dragons_caldb import DRAGONSCaldbSerializer
 from .dragons_file import DRAGONSFileFilterSerializer, DRAGONSFileSerializer
 from .dragons_processed_files import DRAGONSProcessedFilesSerializer
@@ -12,9 +14,14 @@ from .dragons_reduce import (
     DRAGONSReduceSerializer,
     DRAGONSReduceUpdateSerializer,
 )
-from .dragons_run import DRAGONSRunFilterSerializer, DRAGONSRunSerializer
-from .header import HeaderSerializer
+from .dragons_run import (
+    DRAGONSRunFilterSerializer,
+    DRAGONSRunLogSerializer,
+    DRAGONSRunSerializer,
+)
+from .header import HeaderSerializer, HeadersSerializer
 from .recipes_module import RecipesModuleSerializer
+from .reduceddatum_series import ReducedDatumSeriesSerializer
 from .run_processor import RunProcessorSerializer
 
 __all__ = [
@@ -23,18 +30,23 @@ __all__ = [
     "DRAGONSRunSerializer",
     "DRAGONSFileFilterSerializer",
     "DRAGONSRunFilterSerializer",
+    "DRAGONSRunLogSerializer",
     "DRAGONSFileSerializer",
     "DRAGONSReduceFilterSerializer",
     "DRAGONSReduceSerializer",
     "DRAGONSReduceUpdateSerializer",
     "RecipesModuleSerializer",
+    "ReducedDatumSeriesSerializer",
     "DRAGONSCaldbSerializer",
     "BaseRecipeSerializer",
     "DRAGONSProcessedFilesSerializer",
     "DataProductSerializer",
+    "DataProductsPublishSerializer",
     "RunProcessorSerializer",
     "DataProductMetadataSerializer",
     "Antares2GoatsSerializer",
+    "Antares2GoatsBulkSerializer",
     "HeaderSerializer",
+    "HeadersSerializer",
     "AstroDatalabSerializer",
 ]
@@ -0,0 +1,43 @@
+"""Module to serialize requests to import many ANTARES loci as targets."""
+
+__all__ = ["Antares2GoatsBulkSerializer"]
+
+from rest_framework import serializers
+from tom_alerts.models import BrokerQuery
+
+# Number of loci that can be imported in one request.
+MAX_IMPORT_LOCI = 1000
+
+
+class Antares2GoatsBulkSerializer(serializers.Serializer):
+    """Serializer for importing many ANTARES loci, or the results of a saved query.
+
+    Attributes
+    ----------
+    locusids : `serializers.ListField`
+        The IDs of the loci to import.
+    query : `serializers.PrimaryKeyRelatedField`
+        A saved ANTARES query whose results are imported.
+    """
+
+    locusids = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        min_length=1,
+        max_length=MAX_IMPORT_LOCI,
+        required=False,
+    )
+    query = serializers.PrimaryKeyRelatedField(
+        queryset=BrokerQuery.objects.filter(broker="ANTARES"), required=False
+    )
+
+    def validate_locusids(self, locusids: list[str]) -> list[str]:
+        """Drops repeated locus IDs, keeping their order."""
+        return list(dict.fromkeys(locusids))
+
+    def validate(self, data: dict) -> dict:
+        """Check that either 'locusids' or 'query' is provided."""
+        if ("locusids" in data) == ("query" in data):
+            raise serializers.ValidationError(
+                "Exactly one of 'locusids' or 'query' must be provided."
+            )
+        return data
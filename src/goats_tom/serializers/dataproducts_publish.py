@@ -0,0 +1,114 @@
+"""Module to serialize requests to publish many DRAGONS outputs as data products."""
+
+__all__ = ["DataProductsPublishSerializer"]
+
+from pathlib import Path
+from typing import Any
+
+from django.contrib.auth.models import Group
+from rest_framework import serializers
+from tom_dataproducts.models import DATA_TYPE_CHOICES
+
+from goats_tom.models import DRAGONSRun
+from goats_tom.utils import resolve_media_path
+
+# Number of files that can be published in one request.
+MAX_PUBLISH_FILES = 1000
+
+
+class PublishFileSerializer(serializers.Serializer):
+    """Serializer for a file to publish, relative to the media root."""
+
+    filepath = serializers.CharField(max_length=255)
+    filename = serializers.CharField(max_length=255)
+
+
+class DataProductsPublishSerializer(serializers.Serializer):
+    """Serializer for publishing output files of a DRAGONS run as data products.
+
+    Attributes
+    ----------
+    dragons_run : `serializers.PrimaryKeyRelatedField`
+        The run the files were produced by.
+    files : `serializers.ListField`
+        The files to publish, each with a "filepath" and "filename".
+    data_product_type : `serializers.ChoiceField`
+        The data product type of the files.
+    groups : `serializers.PrimaryKeyRelatedField`
+        The groups given access to the data products.
+    """
+
+    dragons_run = serializers.PrimaryKeyRelatedField(queryset=DRAGONSRun.objects.all())
+    files = serializers.ListField(
+        child=PublishFileSerializer(),
+        min_length=1,
+        max_length=MAX_PUBLISH_FILES,
+    )
+    data_product_type = serializers.ChoiceField(
+        choices=list(DATA_TYPE_CHOICES), default="fits_file"
+    )
+    groups = serializers.PrimaryKeyRelatedField(
+        queryset=Group.objects.all(), many=True, required=False
+    )
+
+    def validate_files(self, files: list[dict]) -> list[dict]:
+        """Drops repeated files.
+
+        Parameters
+        ----------
+        files : `list[dict]`
+            The files to publish.
+
+        Returns
+        -------
+        `list[dict]`
+            The unique files to publish.
+        """
+        unique_files = {(file["filepath"], file["filename"]): file for file in files}
+        return list(unique_files.values())
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Checks every file is an existing output of the run.
+
+        Parameters
+        ----------
+        attrs : `dict[str, Any]`
+            The validated fields.
+
+        Returns
+        -------
+        `dict[str, Any]`
+            The validated fields.
+
+        Raises
+        ------
+        `serializers.ValidationError`
+            Raised if a file is outside of the output directory of the run, or does
+            not exist.
+        """
+        output_dir = attrs["dragons_run"].get_output_dir().resolve()
+        outside = []
+        missing = []
+        for file in attrs["files"]:
+            name = str(Path(file["filepath"]) / file["filename"])
+            try:
+                full_path = resolve_media_path(name)
+            except ValueError:
+                outside.append(name)
+                continue
+            if not full_path.is_relative_to(output_dir):
+                outside.append(name)
+            elif not full_path.is_file():
+                missing.append(file["filename"])
+        if outside:
+            raise serializers.ValidationError(
+                {
+                    "files": "The specified files are not outputs of the run: "
+                    f"{', '.join(outside)}."
+                }
+            )
+        if missing:
+            raise serializers.ValidationError(
+                {"files": f"The specified files do not exist: {', '.join(missing)}."}
+            )
+        return attrs
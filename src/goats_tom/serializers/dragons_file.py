@@ -54,6 +54,11 @@ class DRAGONSFileFilterSerializer(serializers.Serializer):
         default=False,
         help_text="Use a tolerance for filtering numeric values.",
     )
+    filter_explain = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Return the generated SQL and its timing instead of the files.",
+    )
 
     def to_internal_value(self, data):
         new_data = data.copy()
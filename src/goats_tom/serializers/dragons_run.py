@@ -1,6 +1,10 @@
 """Serializer for DRAGONSRun."""
 
-__all__ = ["DRAGONSRunSerializer"]
+__all__ = [
+    "DRAGONSRunSerializer",
+    "DRAGONSRunFilterSerializer",
+    "DRAGONSRunLogSerializer",
+]
 
 import re
 
@@ -95,3 +99,18 @@ class DRAGONSRunFilterSerializer(serializers.Serializer):
         ),
         required=False,
     )
+
+
+class DRAGONSRunLogSerializer(serializers.Serializer):
+    offset = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="Byte offset to read the log from, or the end of the log if omitted",
+    )
+    max_bytes = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=1048576,
+        default=65536,
+        help_text="Maximum number of bytes to read",
+    )
@@ -1,10 +1,9 @@
-__all__ = ["HeaderSerializer"]
+__all__ = ["HeaderSerializer", "HeadersSerializer"]
 
-from pathlib import Path
-
-from django.conf import settings
 from rest_framework import serializers
 
+from goats_tom.utils import resolve_media_path
+
 
 class HeaderSerializer(serializers.Serializer):
     """Serializer for validating file header retrieval requests."""
@@ -17,8 +16,27 @@ class HeaderSerializer(serializers.Serializer):
     )
 
     def validate_filepath(self, value: str) -> str:
-        """Validate that the provided filepath exists."""
-        full_path = Path(settings.MEDIA_ROOT) / value
+        """Validate that the provided filepath exists within the media root."""
+        try:
+            full_path = resolve_media_path(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e)) from e
         if not full_path.exists():
             raise serializers.ValidationError("The specified file does not exist.")
         return value
+
+
+class HeadersSerializer(serializers.Serializer):
+    """Serializer for validating batch file header retrieval requests.
+
+    Files that do not exist or are outside of the media root are reported per file in
+    the response rather than failing the whole request.
+    """
+
+    filepaths = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        allow_empty=False,
+        max_length=500,
+        required=True,
+        help_text="Relative filepaths to the FITS files.",
+    )
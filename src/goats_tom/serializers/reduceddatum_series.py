@@ -0,0 +1,38 @@
+"""Module to validate requests for downsampled series of reduced data."""
+
+__all__ = ["ReducedDatumSeriesSerializer"]
+
+from rest_framework import serializers
+from tom_dataproducts.models import DataProduct
+
+from goats_tom.utils import DOWNSAMPLE_METHODS
+
+
+class ReducedDatumSeriesSerializer(serializers.Serializer):
+    data_product = serializers.PrimaryKeyRelatedField(
+        queryset=DataProduct.objects.all(),
+        help_text="Data product to build the series of",
+    )
+    data_type = serializers.ChoiceField(
+        choices=["spectroscopy", "photometry"],
+        help_text="Data type of the reduced data",
+    )
+    width = serializers.IntegerField(
+        required=False,
+        min_value=10,
+        max_value=10000,
+        default=1000,
+        help_text="Width of the plot in pixels to downsample the series to",
+    )
+    method = serializers.ChoiceField(
+        choices=DOWNSAMPLE_METHODS,
+        required=False,
+        default="lttb",
+        help_text="Downsampling method, 'lttb' or 'minmax'",
+    )
+    encoding = serializers.ChoiceField(
+        choices=["json", "binary"],
+        required=False,
+        default="json",
+        help_text="Encoding of the response, columnar JSON or little-endian floats",
+    )
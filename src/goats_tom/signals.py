@@ -0,0 +1,51 @@
+"""Signal handlers that keep the data version of DRAGONS runs and the hashes of
+reduced data up to date."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from tom_dataproducts.models import ReducedDatum
+
+from goats_tom.models import (
+    DRAGONSFile,
+    DRAGONSRecipe,
+    DRAGONSReduce,
+    DRAGONSRun,
+    ReducedDatumHash,
+)
+
+
+@receiver(post_save, sender=DRAGONSFile)
+@receiver(post_delete, sender=DRAGONSFile)
+@receiver(post_save, sender=DRAGONSRecipe)
+@receiver(post_delete, sender=DRAGONSRecipe)
+def bump_run_data_version(sender, instance, **kwargs) -> None:
+    """Bumps the data version of the run a file or recipe belongs to."""
+    DRAGONSRun.bump_data_version(instance.dragons_run_id)
+
+
+@receiver(post_save, sender=DRAGONSReduce)
+@receiver(post_delete, sender=DRAGONSReduce)
+def bump_reduce_run_data_version(sender, instance, **kwargs) -> None:
+    """Bumps the data version of the run a reduction belongs to."""
+    # Look up only the run of the recipe rather than loading the recipe.
+    dragons_run_id = (
+        DRAGONSRecipe.objects.filter(pk=instance.recipe_id)
+        .values_list("dragons_run_id", flat=True)
+        .first()
+    )
+    if dragons_run_id is not None:
+        DRAGONSRun.bump_data_version(dragons_run_id)
+
+
+@receiver(post_save, sender=ReducedDatum)
+def store_reduced_datum_hash(sender, instance, created, raw=False, **kwargs) -> None:
+    """Stores the hash of the value of a created reduced datum.
+
+    Only new data are hashed, as reduced data are not edited once stored. Data bulk
+    created by GOATS are hashed as they are inserted.
+    """
+    if not created or raw:
+        return
+    ReducedDatumHash.objects.bulk_create(
+        [ReducedDatumHash.from_reduced_datum(instance)], ignore_conflicts=True
+    )
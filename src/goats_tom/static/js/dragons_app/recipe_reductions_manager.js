@@ -179,7 +179,7 @@ class RecipeReductionsManagerController {
     this.model.runId = runId;
     const data = await this.model.fetchRecipes();
     this.view.render("create", { parentElement, data });
-    this._setupWebSocket();
+    this._setupWebSocket(runId);
     this._bindGlobalCallbacks();
 
     // Fetch the initial values.
@@ -193,6 +193,8 @@ class RecipeReductionsManagerController {
     this.model.runId = runId;
     const data = await this.model.fetchRecipes();
     this.view.render("update", { data });
+    // Updates are sent per run, so subscribe to the new run.
+    this._setupWebSocket(runId);
 
     // Fetch the initial values.
     const runningData = await this.model.fetchRunningReduces();
@@ -218,9 +220,12 @@ class RecipeReductionsManagerController {
     this.view.render("updateRecipeReduction", { recipeId, data });
   }
 
-  _setupWebSocket() {
+  _setupWebSocket(runId) {
+    if (this.ws) {
+      this.ws.close();
+    }
     const wsProtocol = window.location.protocol === "https:" ? "wss" : "ws";
-    const wsUrl = `${wsProtocol}://${window.location.host}/ws/dragons/`;
+    const wsUrl = `${wsProtocol}://${window.location.host}/ws/dragons/${runId}/`;
     this.ws = new WebSocket(wsUrl);
 
     this.ws.onmessage = (event) => {
@@ -1,4 +1,29 @@
 from .download_goa_files import download_goa_files
+from .import_antares_loci import import_antares_loci
+from .periodic_actors import (
+    PeriodicActors,
+    periodic,
+    run_periodic,
+    schedule_periodic_actors,
+)
+from .poll_broker_queries import poll_broker_queries
+from .publish_dataproducts import publish_dataproducts
+from .refresh_observation_statuses import (
+    refresh_observation_statuses,
+    refresh_target_observation_statuses,
+)
 from .run_dragons_reduce import run_dragons_reduce
 
-__all__ = ["download_goa_files", "run_dragons_reduce"]
+__all__ = [
+    "download_goa_files",
+    "import_antares_loci",
+    "periodic",
+    "PeriodicActors",
+    "poll_broker_queries",
+    "publish_dataproducts",
+    "refresh_observation_statuses",
+    "refresh_target_observation_statuses",
+    "run_dragons_reduce",
+    "run_periodic",
+    "schedule_periodic_actors",
+]
@@ -63,7 +63,7 @@ def download_goa_files(
         print("Running background task.")
         time.sleep(2)
 
-        download_state = DownloadState()
+        download_state = DownloadState(user_id=user)
 
         # Only ever one observation record passed.
         observation_record = list(
@@ -83,6 +83,7 @@ def download_goa_files(
         NotificationInstance.create_and_send(
             message="Download started.",
             label=f"{observation_id}",
+            user_id=user,
         )
         download_state.update_and_send(label=observation_id, status="Starting...")
 
@@ -147,6 +148,7 @@ def download_goa_files(
                     label=f"{observation_id}",
                     message="Error unpacking science tar file. Try again.",
                     color="warning",
+                    user_id=user,
                 )
 
         if download_calibration != "no":
@@ -174,6 +176,7 @@ def download_goa_files(
                     label=f"{observation_id}",
                     message="Error unpacking calibration tar file. Try again.",
                     color="warning",
+                    user_id=user,
                 )
         download_state.update_and_send(
             status="Finished downloads...",
@@ -254,6 +257,7 @@ def download_goa_files(
             message=f"{message}",
             label=f"{observation_id}",
             color="success",
+            user_id=user,
         )
         print("Done.")
     except TimeLimitExceeded:
@@ -263,6 +267,7 @@ def download_goa_files(
             label=f"{observation_id}",
             message="Background task time limit hit. Consider increasing timeout.",
             color="danger",
+            user_id=user,
         )
         raise
     except HTTPError as e:
@@ -272,6 +277,7 @@ def download_goa_files(
             label=f"{observation_id}",
             message=f"Connection to GOA failed, cannot download files: {e!s}",
             color="danger",
+            user_id=user,
         )
         raise
     except Exception as e:
@@ -282,5 +288,6 @@ def download_goa_files(
             label=f"{observation_id}",
             message=f"Error during download from GOA: {e!s}",
             color="danger",
+            user_id=user,
         )
         raise
@@ -0,0 +1,150 @@
+"""Imports ANTARES loci as targets in background."""
+
+__all__ = ["import_antares_loci", "import_loci"]
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import dramatiq
+from django.conf import settings
+from tom_alerts.alerts import GenericBroker
+from tom_alerts.alerts import get_service_class as tom_alerts_get_service_class
+from tom_alerts.models import BrokerQuery
+from tom_targets.models import TargetName
+
+from goats_tom.antares_client import search
+from goats_tom.realtime import DownloadState, NotificationInstance
+
+logger = logging.getLogger(__name__)
+
+# Number of loci fetched before their targets are created.
+BATCH_SIZE = 50
+# Number of loci fetched at the same time.
+MAX_WORKERS = 8
+# Maximum number of loci imported from the results of a saved query.
+MAX_QUERY_LOCI = 1000
+
+
+@dramatiq.actor(
+    max_retries=0, time_limit=getattr(settings, "DRAMATIQ_ACTOR_TIME_LIMIT", 86400000)
+)
+def import_antares_loci(
+    locus_ids: list[str] | None = None,
+    broker_query_id: int | None = None,
+    user_id: int | None = None,
+) -> None:
+    """Imports ANTARES loci as targets, reporting the progress to the user.
+
+    Parameters
+    ----------
+    locus_ids : `list[str] | None`, optional
+        The IDs of the loci to import, by default `None`.
+    broker_query_id : `int | None`, optional
+        The ID of a saved ANTARES query whose results are imported instead, by default
+        `None`.
+    user_id : `int | None`, optional
+        The ID of the user that imported the loci, who is sent the progress. By
+        default `None` to notify everyone.
+
+    """
+    label = "Import ANTARES loci"
+    progress = DownloadState(user_id)
+    progress.update_and_send(label=label, status="Fetching loci...")
+    try:
+        if broker_query_id is not None:
+            broker_query = BrokerQuery.objects.get(pk=broker_query_id)
+            locus_ids = [
+                locus.locus_id
+                for locus in search(
+                    broker_query.parameters.get("query") or {}, limit=MAX_QUERY_LOCI
+                )
+            ]
+
+        def send_progress(num_done: int, num_total: int) -> None:
+            progress.update_and_send(status=f"{num_done}/{num_total} loci")
+
+        counts = import_loci(locus_ids or [], on_progress=send_progress)
+    except Exception as e:
+        logger.exception("Failed to import ANTARES loci.")
+        progress.update_and_send(status="Failed", message=str(e), error=True)
+        NotificationInstance.create_and_send(
+            label=label, message=str(e), color="danger", user_id=user_id
+        )
+        raise
+
+    message = (
+        f"Created {counts['created']} targets, skipped {counts['duplicates']} "
+        f"existing and failed {counts['failed']} loci."
+    )
+    progress.update_and_send(status="Done", message=message, done=True)
+    NotificationInstance.create_and_send(
+        label=label,
+        message=message,
+        color="danger" if counts["failed"] else "success",
+        user_id=user_id,
+    )
+
+
+def import_loci(
+    locus_ids: list[str],
+    broker: GenericBroker | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> dict[str, int]:
+    """Imports ANTARES loci as targets.
+
+    Loci already known as a target alias are skipped without fetching them. The
+    others are fetched by a bounded pool of threads in batches, and the targets of
+    each batch are created together.
+
+    Parameters
+    ----------
+    locus_ids : `list[str]`
+        The IDs of the loci to import.
+    broker : `GenericBroker | None`, optional
+        The ANTARES broker, by default a new one.
+    on_progress : `Callable[[int, int], None] | None`, optional
+        Called with the number of loci processed and the total after each batch.
+
+    Returns
+    -------
+    `dict[str, int]`
+        The number of targets "created", of loci skipped as "duplicates" and of loci
+        that "failed" to be fetched.
+    """
+    broker = broker or tom_alerts_get_service_class("ANTARES")()
+    locus_ids = list(dict.fromkeys(locus_ids))
+    known = set(
+        TargetName.objects.filter(name__in=locus_ids).values_list("name", flat=True)
+    )
+    counts = {"created": 0, "duplicates": len(known), "failed": 0}
+    new_ids = [locus_id for locus_id in locus_ids if locus_id not in known]
+
+    num_done = len(known)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for start in range(0, len(new_ids), BATCH_SIZE):
+            batch = new_ids[start : start + BATCH_SIZE]
+            alerts = []
+            for alert in executor.map(lambda i: _fetch_alert(broker, i), batch):
+                if alert is None:
+                    counts["failed"] += 1
+                else:
+                    alerts.append(alert)
+            targets, num_duplicates = broker.create_targets(alerts)
+            counts["created"] += len(targets)
+            counts["duplicates"] += num_duplicates
+
+            num_done += len(batch)
+            if on_progress is not None:
+                on_progress(num_done, len(locus_ids))
+    return counts
+
+
+def _fetch_alert(broker: GenericBroker, locus_id: str) -> dict[str, Any] | None:
+    """Fetches a locus with its alerts, returning `None` if it can't be."""
+    try:
+        return next(broker.fetch_alerts({"locusid": locus_id}), None)
+    except Exception:
+        logger.exception("Failed to fetch ANTARES locus %s.", locus_id)
+        return None
@@ -0,0 +1,91 @@
+"""Runs actors periodically from the background workers."""
+
+__all__ = ["periodic", "run_periodic", "schedule_periodic_actors", "PeriodicActors"]
+
+import logging
+from collections.abc import Callable
+from uuid import uuid4
+
+import dramatiq
+from django.conf import settings
+from django.core.cache import cache
+
+from goats_tom.models import PeriodicActorSchedule
+
+logger = logging.getLogger(__name__)
+
+# Interval setting name and default in seconds of each periodic actor, by actor name.
+PERIODIC_ACTORS: dict[str, tuple[str, int]] = {}
+# Prevents each worker process from scheduling the actors again when booting.
+BOOT_LOCK_KEY = "periodic_actors:boot"
+BOOT_LOCK_TIMEOUT = 60
+
+
+def periodic(setting: str, default: int) -> Callable[[dramatiq.Actor], dramatiq.Actor]:
+    """Registers an actor to be sent periodically by the background workers.
+
+    Parameters
+    ----------
+    setting : `str`
+        The name of the setting holding the interval in seconds.
+    default : `int`
+        The interval in seconds if the setting is not defined.
+
+    Returns
+    -------
+    `Callable[[dramatiq.Actor], dramatiq.Actor]`
+        The decorator registering the actor.
+    """
+
+    def decorator(actor: dramatiq.Actor) -> dramatiq.Actor:
+        PERIODIC_ACTORS[actor.actor_name] = (setting, default)
+        return actor
+
+    return decorator
+
+
+@dramatiq.actor(max_retries=0)
+def run_periodic(actor_name: str, token: str) -> None:
+    """Sends a periodic actor and schedules the next run.
+
+    Each schedule holds a token, so a schedule started again when the workers
+    restart supersedes the previous one instead of running alongside it.
+
+    Parameters
+    ----------
+    actor_name : `str`
+        The name of the periodic actor.
+    token : `str`
+        The token of the schedule.
+    """
+    if not PeriodicActorSchedule.objects.filter(
+        actor_name=actor_name, token=token
+    ).exists():
+        logger.debug("Schedule of %s was superseded.", actor_name)
+        return
+
+    setting, default = PERIODIC_ACTORS[actor_name]
+    interval = getattr(settings, setting, default)
+    try:
+        dramatiq.get_broker().get_actor(actor_name).send()
+    finally:
+        run_periodic.send_with_options(args=(actor_name, token), delay=interval * 1000)
+
+
+def schedule_periodic_actors() -> None:
+    """Starts a new schedule for every periodic actor, superseding existing ones."""
+    for actor_name in PERIODIC_ACTORS:
+        token = uuid4().hex
+        PeriodicActorSchedule.objects.update_or_create(
+            actor_name=actor_name, defaults={"token": token}
+        )
+        run_periodic.send(actor_name, token)
+
+
+class PeriodicActors(dramatiq.Middleware):
+    """Schedules the periodic actors once the background workers boot."""
+
+    def after_worker_boot(self, broker: dramatiq.Broker, worker: dramatiq.Worker):
+        # Every worker process boots, only the first one schedules.
+        if cache.add(BOOT_LOCK_KEY, True, BOOT_LOCK_TIMEOUT):
+            schedule_periodic_actors()
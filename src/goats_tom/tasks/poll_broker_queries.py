@@ -0,0 +1,196 @@
+"""Polls saved ANTARES queries for new loci in background."""
+
+__all__ = [
+    "poll_broker_queries",
+    "poll_broker_query",
+    "advance_watermark",
+    "build_incremental_query",
+]
+
+import logging
+import time
+from typing import Any
+
+import dramatiq
+from astropy.time import Time
+from django.conf import settings
+from django.utils import timezone
+from tom_alerts.alerts import GenericBroker
+from tom_alerts.alerts import get_service_class as tom_alerts_get_service_class
+from tom_alerts.models import BrokerQuery
+
+from goats_tom.antares_client import search
+from goats_tom.brokers.antares import MAX_ALERTS
+from goats_tom.models import BrokerQueryPoll
+from goats_tom.realtime import NotificationInstance
+
+from .periodic_actors import periodic
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the names of queries saved from the browser extension.
+SAVED_QUERY_PREFIX = "esquery_ANTARES_"
+# Locus field the watermark is kept on.
+WATERMARK_FIELD = "properties.newest_alert_observation_time"
+
+
+@periodic("BROKER_QUERY_POLL_INTERVAL", 15 * 60)
+@dramatiq.actor(
+    max_retries=0, time_limit=getattr(settings, "DRAMATIQ_ACTOR_TIME_LIMIT", 86400000)
+)
+def poll_broker_queries() -> None:
+    """Polls every saved ANTARES query for loci updated since its last poll.
+
+    A failing query is recorded and does not stop the others from being polled.
+    """
+    broker = tom_alerts_get_service_class("ANTARES")()
+    broker_queries = BrokerQuery.objects.filter(
+        broker="ANTARES", name__startswith=SAVED_QUERY_PREFIX
+    )
+    for broker_query in broker_queries:
+        try:
+            poll_broker_query(broker, broker_query)
+        except Exception:
+            logger.exception("Failed to poll %s.", broker_query.name)
+
+
+def poll_broker_query(
+    broker: GenericBroker, broker_query: BrokerQuery
+) -> BrokerQueryPoll:
+    """Creates targets for the loci updated since the last poll of a query.
+
+    The query is restricted to loci with an alert newer than the watermark, oldest
+    first, so a poll capped by the broker continues where it stopped on the next
+    one. The watermark only advances up to the first locus whose alerts could not be
+    fetched, so it is polled again. The first poll starts from when the query was
+    saved. Loci already known as a target or an alias are skipped.
+
+    Parameters
+    ----------
+    broker : `GenericBroker`
+        The ANTARES broker.
+    broker_query : `BrokerQuery`
+        The saved query.
+
+    Returns
+    -------
+    `BrokerQueryPoll`
+        The updated polling state of the query.
+
+    Raises
+    ------
+    Exception
+        Raised if the query fails, after recording the error.
+    """
+    poll, _ = BrokerQueryPoll.objects.get_or_create(broker_query=broker_query)
+    watermark = poll.watermark
+    if watermark is None:
+        watermark = float(Time(broker_query.created).mjd)
+
+    start = time.perf_counter()
+    poll.last_polled = timezone.now()
+    try:
+        loci = list(
+            search(
+                build_incremental_query(
+                    broker_query.parameters.get("query") or {}, watermark
+                ),
+                limit=MAX_ALERTS,
+                sort=WATERMARK_FIELD,
+            )
+        )
+        alerts = broker.hydrate_loci(loci)
+        targets, num_duplicates = broker.create_targets(alerts)
+        num_created = len(targets)
+    except Exception as e:
+        poll.last_latency = time.perf_counter() - start
+        poll.last_error = str(e)
+        poll.save()
+        raise
+
+    poll.watermark = advance_watermark(
+        watermark, loci, {alert["locus_id"] for alert in alerts}
+    )
+    poll.last_latency = time.perf_counter() - start
+    poll.last_num_results = len(loci)
+    poll.last_num_dropped = len(loci) - len(alerts)
+    poll.last_num_created = num_created
+    poll.last_num_duplicates = num_duplicates
+    poll.last_error = ""
+    poll.save()
+    BrokerQuery.objects.filter(pk=broker_query.pk).update(last_run=poll.last_polled)
+
+    logger.info(
+        "Polled %s in %.2f seconds: %d loci, %d new targets, %d duplicates, %d"
+        " dropped.",
+        broker_query.name,
+        poll.last_latency,
+        poll.last_num_results,
+        num_created,
+        num_duplicates,
+        poll.last_num_dropped,
+    )
+    if num_created:
+        NotificationInstance.create_and_send(
+            label="ANTARES query",
+            message=f"Created {num_created} targets from {broker_query.name}.",
+        )
+    return poll
+
+
+def advance_watermark(
+    watermark: float, loci: list, fetched_locus_ids: set[str]
+) -> float:
+    """Advances a watermark over the loci of a poll whose alerts were fetched.
+
+    Parameters
+    ----------
+    watermark : `float`
+        The watermark the poll started from.
+    loci : `list[Locus]`
+        The loci listed by the poll, oldest first.
+    fetched_locus_ids : `set[str]`
+        The IDs of the loci whose alerts were fetched.
+
+    Returns
+    -------
+    `float`
+        The newest alert observation time of the loci before the first one that was
+        not fetched, excluding loci as new as it.
+    """
+    field = WATERMARK_FIELD.removeprefix("properties.")
+    newest = []
+    for locus in loci:
+        observed = locus.properties.get(field)
+        if locus.locus_id not in fetched_locus_ids:
+            if observed is not None:
+                newest = [value for value in newest if value < observed]
+            break
+        if observed is not None:
+            newest.append(observed)
+    return max([watermark, *newest])
+
+
+def build_incremental_query(query: dict[str, Any], watermark: float) -> dict:
+    """Restricts an Elastic Search query to loci with alerts newer than a watermark.
+
+    Parameters
+    ----------
+    query : `dict[str, Any]`
+        The saved query, with a top-level "query" key.
+    watermark : `float`
+        The newest alert observation time, as an MJD, already polled.
+
+    Returns
+    -------
+    `dict`
+        The restricted query.
+    """
+    return {
+        "query": {
+            "bool": {
+                "must": [query.get("query") or {"match_all": {}}],
+                "filter": [{"range": {WATERMARK_FIELD: {"gt": watermark}}}],
+            }
+        }
+    }
@@ -0,0 +1,246 @@
+"""Publishes DRAGONS outputs as data products in background."""
+
+__all__ = ["publish_dataproducts"]
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import dramatiq
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.db import IntegrityError, transaction
+from guardian.shortcuts import assign_perm
+from tom_common.hooks import run_hook
+from tom_dataproducts.models import DataProduct, ReducedDatum
+
+from goats_tom.models import DataProductMetadata, DRAGONSRun
+from goats_tom.processors import process_data_product, save_reduced_data
+from goats_tom.realtime import NotificationInstance, PublishProgress
+
+logger = logging.getLogger(__name__)
+
+# Number of data products created per query.
+BATCH_SIZE = 50
+# Number of files processed at the same time.
+MAX_WORKERS = 4
+
+
+@dramatiq.actor(
+    max_retries=0, time_limit=getattr(settings, "DRAMATIQ_ACTOR_TIME_LIMIT", 86400000)
+)
+def publish_dataproducts(
+    run_id: int,
+    files: list[dict[str, str]],
+    data_product_type: str = "fits_file",
+    group_ids: list[int] | None = None,
+    user_id: int | None = None,
+) -> None:
+    """Publishes output files of a DRAGONS run as data products of its target.
+
+    Data products and their metadata are created in batches. The files of each batch
+    are processed into reduced data by a bounded pool of threads, while the reduced
+    data are stored from this thread. The status of each file is sent to the group of
+    the run. Files already published are skipped, and files that fail to process are
+    removed again.
+
+    Parameters
+    ----------
+    run_id : `int`
+        The ID of the run that produced the files.
+    files : `list[dict[str, str]]`
+        The files to publish, each with a "filepath" relative to the media root and a
+        "filename".
+    data_product_type : `str`, optional
+        The data product type of the files, by default "fits_file".
+    group_ids : `list[int] | None`, optional
+        The IDs of the groups given access to the data products, by default `None`.
+    user_id : `int | None`, optional
+        The ID of the user that published the files, who is sent the notifications.
+        By default `None` to notify everyone.
+
+    """
+    label = "Publish DRAGONS outputs"
+    try:
+        run = DRAGONSRun.objects.select_related("observation_record__target").get(
+            pk=run_id
+        )
+    except DRAGONSRun.DoesNotExist:
+        NotificationInstance.create_and_send(
+            label=label,
+            message="DRAGONS run not found.",
+            color="danger",
+            user_id=user_id,
+        )
+        raise
+
+    product_ids = [str(Path(file["filepath"]) / file["filename"]) for file in files]
+    for product_id in product_ids:
+        PublishProgress.send(run_id, product_id, "queued")
+    NotificationInstance.create_and_send(
+        label=label, message=f"Publishing {len(product_ids)} files.", user_id=user_id
+    )
+
+    groups = []
+    if group_ids and not settings.TARGET_PERMISSIONS_ONLY:
+        groups = list(Group.objects.filter(pk__in=group_ids))
+
+    counts = {"done": 0, "skipped": 0, "error": 0}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for start in range(0, len(product_ids), BATCH_SIZE):
+            batch = product_ids[start : start + BATCH_SIZE]
+            dps = _create_data_products(run, batch, data_product_type, groups, counts)
+
+            futures = {}
+            for dp in dps:
+                try:
+                    run_hook("data_product_post_upload", dp)
+                except Exception as e:
+                    _discard_data_product(run_id, dp, e, counts)
+                    continue
+                PublishProgress.send(run_id, dp.product_id, "processing")
+                # Only the processing runs in the workers, the database is used from
+                # here.
+                futures[executor.submit(process_data_product, dp)] = dp
+            for future in as_completed(futures):
+                dp = futures[future]
+                try:
+                    data, data_type = future.result()
+                    reduced_data = save_reduced_data(dp, data, data_type)
+                    for group in groups:
+                        assign_perm(
+                            "tom_dataproducts.view_reduceddatum", group, reduced_data
+                        )
+                except Exception as e:
+                    _discard_data_product(run_id, dp, e, counts)
+                else:
+                    counts["done"] += 1
+                    PublishProgress.send(
+                        run_id, dp.product_id, "done", dataproduct_id=dp.pk
+                    )
+
+    NotificationInstance.create_and_send(
+        label=label,
+        message=(
+            f"Published {counts['done']} files, skipped {counts['skipped']} already "
+            f"published and failed {counts['error']}."
+        ),
+        color="danger" if counts["error"] else "success",
+        user_id=user_id,
+    )
+
+
+def _create_data_products(
+    run: DRAGONSRun,
+    product_ids: list[str],
+    data_product_type: str,
+    groups: list[Group],
+    counts: dict[str, int],
+) -> list[DataProduct]:
+    """Creates the data products and metadata of a batch of files.
+
+    Parameters
+    ----------
+    run : `DRAGONSRun`
+        The run that produced the files.
+    product_ids : `list[str]`
+        The paths of the files relative to the media root, used as product IDs.
+    data_product_type : `str`
+        The data product type of the files.
+    groups : `list[Group]`
+        The groups given access to the data products.
+    counts : `dict[str, int]`
+        The number of files per final status, updated with the skipped and failed
+        files.
+
+    Returns
+    -------
+    `list[DataProduct]`
+        The created data products.
+
+    """
+    run_id = run.pk
+    existing = set(
+        DataProduct.objects.filter(product_id__in=product_ids).values_list(
+            "product_id", flat=True
+        )
+    )
+    for product_id in existing:
+        counts["skipped"] += 1
+        PublishProgress.send(
+            run_id, product_id, "skipped", message="Already published."
+        )
+
+    observation_record = run.observation_record
+    # NOTE: Only processed files appear in the run directory, so like a single upload
+    # the data products are marked as processed without opening them.
+    new_dps = [
+        DataProduct(
+            product_id=product_id,
+            target=observation_record.target,
+            observation_record=observation_record,
+            data_product_type=data_product_type,
+            # Since the runs are stored in the local storage, don't need to copy.
+            data=product_id,
+        )
+        for product_id in product_ids
+        if product_id not in existing
+    ]
+    try:
+        with transaction.atomic():
+            dps = DataProduct.objects.bulk_create(new_dps)
+            DataProductMetadata.objects.bulk_create(
+                [DataProductMetadata(dataproduct=dp, processed=True) for dp in dps]
+            )
+    except Exception:
+        # Another request published some of the files meanwhile, or one of them is
+        # invalid, so retry them one at a time to only leave those out.
+        logger.exception("Failed to create a batch of data products, retrying.")
+        dps = []
+        for dp in new_dps:
+            dp.pk = None
+            dp._state.adding = True
+            try:
+                with transaction.atomic():
+                    dp.save()
+                    DataProductMetadata.objects.create(dataproduct=dp, processed=True)
+            except IntegrityError:
+                counts["skipped"] += 1
+                PublishProgress.send(
+                    run_id, dp.product_id, "skipped", message="Already published."
+                )
+            except Exception as e:
+                logger.exception("Failed to create %s.", dp.product_id)
+                counts["error"] += 1
+                PublishProgress.send(run_id, dp.product_id, "error", message=str(e))
+            else:
+                dps.append(dp)
+
+    # Same permissions as a single upload.
+    for group in groups if dps else []:
+        for perm in ("view", "delete"):
+            assign_perm(f"tom_dataproducts.{perm}_dataproduct", group, dps)
+    return dps
+
+
+def _discard_data_product(
+    run_id: int, dp: DataProduct, error: Exception, counts: dict[str, int]
+) -> None:
+    """Removes a data product that failed to publish and reports the error.
+
+    Parameters
+    ----------
+    run_id : `int`
+        The ID of the run that produced the file.
+    dp : `DataProduct`
+        The data product that failed.
+    error : `Exception`
+        The error raised.
+    counts : `dict[str, int]`
+        The number of files per final status, updated with the failed file.
+    """
+    logger.exception("Failed to publish %s.", dp.product_id, exc_info=error)
+    ReducedDatum.objects.filter(data_product=dp).delete()
+    dp.delete()
+    counts["error"] += 1
+    PublishProgress.send(run_id, dp.product_id, "error", message=str(error))
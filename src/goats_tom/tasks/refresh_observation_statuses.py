@@ -0,0 +1,190 @@
+"""Refreshes the status of observation records in background."""
+
+__all__ = [
+    "refresh_observation_statuses",
+    "refresh_target_observation_statuses",
+    "refresh_statuses",
+]
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+
+import dramatiq
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.utils import timezone
+from tom_observations import facility
+from tom_observations.facility import BaseObservationFacility
+from tom_observations.models import ObservationRecord
+
+from goats_tom.models import ObservationRecordStatus
+from goats_tom.realtime import DownloadState, NotificationInstance
+
+from .periodic_actors import periodic
+
+logger = logging.getLogger(__name__)
+
+# Number of observation records refreshed together.
+BATCH_SIZE = 50
+
+
+@periodic("OBSERVATION_STATUS_REFRESH_INTERVAL", 15 * 60)
+@dramatiq.actor(
+    max_retries=0, time_limit=getattr(settings, "DRAMATIQ_ACTOR_TIME_LIMIT", 86400000)
+)
+def refresh_observation_statuses() -> None:
+    """Refreshes the status of every observation record not in a terminal state."""
+    failed = refresh_statuses(ObservationRecord.objects.all())
+    if failed:
+        logger.warning("Failed to refresh %d observation statuses.", len(failed))
+
+
+@dramatiq.actor(
+    max_retries=0, time_limit=getattr(settings, "DRAMATIQ_ACTOR_TIME_LIMIT", 86400000)
+)
+def refresh_target_observation_statuses(
+    target_id: int, user_id: int | None = None
+) -> None:
+    """Refreshes the status of the observation records of a target.
+
+    Parameters
+    ----------
+    target_id : `int`
+        The ID of the target.
+    user_id : `int | None`, optional
+        The ID of the user that requested the refresh, whose credentials are used
+        by facilities and who is sent the progress. By default `None`.
+
+    """
+    label = "Update observations status"
+    progress = DownloadState(user_id)
+    progress.update_and_send(label=label, status="Refreshing statuses...")
+
+    def send_progress(num_done: int, num_total: int) -> None:
+        progress.update_and_send(status=f"{num_done}/{num_total} observations")
+
+    try:
+        user = User.objects.filter(pk=user_id).first() if user_id else None
+        records = ObservationRecord.objects.filter(target_id=target_id)
+        failed = refresh_statuses(records, user=user, on_progress=send_progress)
+    except Exception as e:
+        logger.exception("Failed to refresh observation statuses.")
+        progress.update_and_send(status="Failed", message=str(e), error=True)
+        NotificationInstance.create_and_send(
+            label=label, message=str(e), color="danger", user_id=user_id
+        )
+        raise
+
+    if failed:
+        message = f"Failed to refresh {len(failed)} observation statuses."
+    else:
+        message = "Observation statuses refreshed, reload the page to see them."
+    progress.update_and_send(status="Done", message=message, done=True)
+    NotificationInstance.create_and_send(
+        label=label,
+        message=message,
+        color="danger" if failed else "success",
+        user_id=user_id,
+    )
+
+
+def refresh_statuses(
+    records: QuerySet,
+    user: User | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> list[tuple[str, str]]:
+    """Refreshes the status of observation records not in a terminal state.
+
+    Records are refreshed in batches per facility and user. Facilities that can look
+    up the statuses of several observations at once, such as Gemini, are sent a
+    whole batch. When each status was last refreshed, and the error of the last
+    refresh, are stored with it.
+
+    Parameters
+    ----------
+    records : `QuerySet`
+        The observation records.
+    user : `User | None`, optional
+        The user whose credentials are used by facilities. By default `None`, the
+        credentials of the user that submitted each record are used, as facilities
+        such as LCO and SOAR need a user's token.
+    on_progress : `Callable[[int, int], None] | None`, optional
+        Called with the number of records refreshed and the total after each batch.
+
+    Returns
+    -------
+    `list[tuple[str, str]]`
+        The observation IDs of the records that failed to refresh, with the error.
+    """
+    # Keep only the records of known facilities whose status can still change.
+    batches = []
+    facility_names = records.values_list("facility", flat=True).distinct()
+    for facility_name in facility_names.order_by("facility"):
+        try:
+            facility_class = facility.get_service_class(facility_name)
+        except ImportError:
+            logger.warning("Unknown facility %s.", facility_name)
+            continue
+        terminal_states = facility_class().get_terminal_observing_states()
+        facility_records = (
+            records.filter(facility=facility_name)
+            .exclude(status__in=terminal_states)
+            .select_related("user")
+        )
+
+        # Each user gets its own instance, as the credentials are set on it.
+        records_by_user = defaultdict(list)
+        for record in facility_records:
+            records_by_user[user or record.user].append(record)
+        for record_user, user_records in records_by_user.items():
+            instance = facility_class()
+            instance.set_user(record_user)
+            for start in range(0, len(user_records), BATCH_SIZE):
+                batches.append((instance, user_records[start : start + BATCH_SIZE]))
+
+    failed = []
+    num_done = 0
+    num_total = sum(len(batch) for _, batch in batches)
+    for instance, batch in batches:
+        failed.extend(_refresh_batch(instance, batch))
+        num_done += len(batch)
+        if on_progress is not None:
+            on_progress(num_done, num_total)
+    return failed
+
+
+def _refresh_batch(
+    instance: BaseObservationFacility, records: list[ObservationRecord]
+) -> list[tuple[str, str]]:
+    """Refreshes the status of a batch of records of the same facility."""
+    statuses = {}
+    if hasattr(instance, "get_observation_statuses"):
+        observation_ids = [record.observation_id for record in records]
+        try:
+            statuses = instance.get_observation_statuses(observation_ids)
+        except Exception:
+            logger.exception("Failed to get the statuses of %s.", observation_ids)
+
+    failed = []
+    for record in records:
+        try:
+            status = statuses.get(record.observation_id)
+            if status is None:
+                status = instance.get_observation_status(record.observation_id)
+            record.status = status["state"]
+            record.scheduled_start = status["scheduled_start"]
+            record.scheduled_end = status["scheduled_end"]
+            record.save()
+        except Exception as e:
+            failed.append((record.observation_id, str(e)))
+            ObservationRecordStatus.objects.update_or_create(
+                observation_record=record, defaults={"last_error": str(e)}
+            )
+            continue
+        ObservationRecordStatus.objects.update_or_create(
+            observation_record=record,
+            defaults={"last_refreshed": timezone.now(), "last_error": ""},
+        )
+    return failed
@@ -29,7 +29,9 @@ logger = logging.getLogger(__name__)
 @dramatiq.actor(
     max_retries=0, time_limit=getattr(settings, "DRAMATIQ_ACTOR_TIME_LIMIT", 86400000)
 )
-def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
+def run_dragons_reduce(
+    reduce_id: int, file_ids: list[int], user_id: int | None = None
+) -> None:
     """Executes a reduction process in the background.
 
     This function handles the entire process of setting up and executing a reduction,
@@ -41,6 +43,9 @@ def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
         The ID of the DRAGONSReduce instance to be processed.
     file_ids : `list[int]`
         A list of file IDs to limit to. If empty, use all files.
+    user_id : `int | None`, optional
+        The ID of the user that started the reduction, who is sent the notifications.
+        By default `None` to notify everyone.
 
     Raises
     ------
@@ -64,6 +69,7 @@ def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
         NotificationInstance.create_and_send(
             message="Reduction started.",
             label=reduce.get_label(),
+            user_id=user_id,
         )
         reduce.mark_initializing()
         DRAGONSProgress.create_and_send(reduce)
@@ -153,6 +159,7 @@ def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
             message="Reduction finished.",
             label=reduce.get_label(),
             color="success",
+            user_id=user_id,
         )
         reduce.mark_done()
         DRAGONSProgress.create_and_send(reduce)
@@ -163,6 +170,7 @@ def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
             label=reduce.get_label(),
             message="Background task time limit hit. Consider increasing timeout.",
             color="danger",
+            user_id=user_id,
         )
         raise
     except DRAGONSReduce.DoesNotExist:
@@ -170,6 +178,7 @@ def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
         NotificationInstance.create_and_send(
             message="Reduction not found.",
             color="danger",
+            user_id=user_id,
         )
         raise
     except Exception as e:
@@ -180,6 +189,7 @@ def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
             label=reduce.get_label(),
             message=f"Error during reduction: {e!s}",
             color="danger",
+            user_id=user_id,
         )
         raise
     finally:
@@ -189,6 +199,7 @@ def run_dragons_reduce(reduce_id: int, file_ids: list[int]) -> None:
         for h in logger.handlers[:]:
             if isinstance(h, DRAGONSHandler):
                 logger.removeHandler(h)
+                h.close()
         # Cleanup dynamically created module.
         if module_name in sys.modules:
             del sys.modules[module_name]
@@ -12,6 +12,7 @@ from .logins import (
     LCOLoginFactory,
     TNSLoginFactory,
 )
+from .primitives_catalog import PrimitivesCatalogFactory
 from .recipes_module import RecipesModuleFactory
 from .reduceddatum import ReducedDatumFactory
 from .user import UserFactory
@@ -26,6 +27,7 @@ __all__ = [
     "DRAGONSRecipeFactory",
     "DRAGONSReduceFactory",
     "DRAGONSRunFactory",
+    "PrimitivesCatalogFactory",
     "RecipesModuleFactory",
     "ReducedDatumFactory",
     "UserFactory",
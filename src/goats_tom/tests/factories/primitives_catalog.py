@@ -0,0 +1,23 @@
+import factory
+
+from goats_tom.models import PrimitivesCatalog
+
+
+class PrimitivesCatalogFactory(factory.django.DjangoModelFactory):
+    """Factory for creating `PrimitivesCatalog` instances for testing."""
+
+    class Meta:
+        model = PrimitivesCatalog
+
+    instrument = "GMOS"
+    version = factory.Faker("numerify", text="#.#.#")
+    tags = ["BIAS", "CAL", "GEMINI", "GMOS", "RAW", "SOUTH", "UNPREPARED"]
+    tags_hash = factory.LazyAttribute(lambda o: PrimitivesCatalog.hash_tags(o.tags))
+    primitives = factory.LazyAttribute(
+        lambda o: {
+            "ADUToElectrons": {
+                "params": {"suffix": {"value": "_ADUToElectrons", "doc": "Suffix"}},
+                "docstring": {"summary": ["Converts ADU to electrons."]},
+            }
+        }
+    )
@@ -1,9 +1,67 @@
 """Module for scraping the TNS website."""
 
-__all__ = ["TNSClient"]
+__all__ = ["TNSClient", "TNS_CACHE_ALIAS"]
+
+import importlib.util
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+logger = logging.getLogger(__name__)
+
+# Name of the dedicated cache in ``settings.CACHES``. A local-memory cache is used for
+# it because it evicts the least recently used entries once ``MAX_ENTRIES`` is reached.
+TNS_CACHE_ALIAS = "tns"
+# Seconds a parsed object is cached for. Only the type and redshift of an object
+# usually change after it is reported.
+CACHE_TIMEOUT = 60 * 60
+# lxml parses the object pages several times faster than the built-in parser.
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+
+def _get_cache() -> BaseCache:
+    """Returns the TNS cache, falling back to the default cache if not configured.
+
+    Returns
+    -------
+    `BaseCache`
+        The cache to store parsed objects in.
+    """
+    if TNS_CACHE_ALIAS in settings.CACHES:
+        return caches[TNS_CACHE_ALIAS]
+    return caches["default"]
+
+
+class _RateLimiter:
+    """Spaces out requests to a host, shared by the threads of a process.
+
+    Parameters
+    ----------
+    min_interval : `float`
+        Minimum number of seconds between the start of two requests.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Blocks until a request can be sent."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        # Sleep outside the lock so other threads can reserve the following slots.
+        if slot > now:
+            time.sleep(slot - now)
 
 
 class TNSClient:
@@ -32,6 +90,14 @@ class TNSClient:
         "filter": "field-filter_name",
         "radec": "field-radec",
     }
+    # Minimum number of seconds between two requests to the TNS website.
+    MIN_REQUEST_INTERVAL: float = 0.5
+    # Number of objects fetched at the same time by `get_objects`.
+    MAX_WORKERS: int = 4
+
+    # Rate limiters by host, shared by every client of the process.
+    _rate_limiters: dict[str, _RateLimiter] = {}
+    _rate_limiters_lock = threading.Lock()
 
     def __init__(
         self,
@@ -41,13 +107,35 @@ class TNSClient:
         self._session = requests.Session()
         self._session.headers.update({"User-Agent": self.USER_AGENT})
 
-    def get_object(self, object_name: str) -> dict[str, str | None]:
-        """Retrieve the raw HTML for a given TNS object.
+    def _get_rate_limiter(self) -> _RateLimiter:
+        """Returns the rate limiter of the TNS host.
+
+        Returns
+        -------
+        `_RateLimiter`
+            The rate limiter shared by the clients of the process.
+        """
+        host = urlparse(self.BASE_URL).netloc
+        with self._rate_limiters_lock:
+            if host not in self._rate_limiters:
+                self._rate_limiters[host] = _RateLimiter(self.MIN_REQUEST_INTERVAL)
+            return self._rate_limiters[host]
+
+    def get_object(
+        self, object_name: str, use_cache: bool = True
+    ) -> dict[str, str | None]:
+        """Retrieve the parsed fields of a given TNS object.
+
+        Parsed objects are cached for `CACHE_TIMEOUT` seconds, and requests to the
+        website are rate limited.
 
         Parameters
         ----------
         object_name : `str`
             Name of the object to query on TNS.
+        use_cache : `bool`, optional
+            Whether to return a cached object, by default `True`. The fetched object
+            is cached either way.
 
         Returns
         -------
@@ -61,13 +149,53 @@ class TNSClient:
         requests.HTTPError
             If the request fails with a non-2xx status code.
         """
+        object_name = object_name.strip()
+        cache_key = f"tns:{object_name}"
+        if use_cache:
+            cached = _get_cache().get(cache_key)
+            if cached is not None:
+                return cached
+
         url = f"{self.BASE_URL}/{object_name}"
+        self._get_rate_limiter().wait()
         response = self._session.get(url, timeout=self.timeout)
         response.raise_for_status()
 
         html = response.text
 
-        return self._parse_object_html(html)
+        result = self._parse_object_html(html)
+        _get_cache().set(cache_key, result, CACHE_TIMEOUT)
+        return result
+
+    def get_objects(
+        self, object_names: list[str], use_cache: bool = True
+    ) -> dict[str, dict[str, str | None] | None]:
+        """Retrieve the parsed fields of several TNS objects concurrently.
+
+        Parameters
+        ----------
+        object_names : `list[str]`
+            Names of the objects to query on TNS.
+        use_cache : `bool`, optional
+            Whether to return cached objects, by default `True`.
+
+        Returns
+        -------
+        `dict[str, dict[str, str | None] | None]`
+            The fields of each object by name, as returned by `get_object`, or `None`
+            for objects that could not be retrieved.
+        """
+
+        def get_or_none(object_name: str) -> dict[str, str | None] | None:
+            try:
+                return self.get_object(object_name, use_cache=use_cache)
+            except requests.RequestException:
+                logger.exception("Failed to get TNS object %s.", object_name)
+                return None
+
+        object_names = list(dict.fromkeys(object_names))
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            return dict(zip(object_names, executor.map(get_or_none, object_names)))
 
     def _parse_object_html(self, html: str) -> dict[str, str | None]:
         """Parse the provided HTML to extract TNS fields into a dictionary.
@@ -85,7 +213,7 @@ class TNSClient:
             Fields will be `None` if they cannot be found.
         """
         result: dict[str, str | None] = {}
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         # Extract title text for the object name with the prefix.
         result["name"] = self._parse_object_name_from_title(soup)
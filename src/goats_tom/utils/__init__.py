@@ -1,3 +1,23 @@
+from .astrodata_header import (
+    get_astrodata_descriptors,
+    read_astrodata_descriptors,
+    serialize_descriptor_value,
+)
+from .downsample import DOWNSAMPLE_METHODS, downsample
+from .json_aggregation import (
+    JSONArrayAgg,
+    RawJSON,
+    evaluate_first,
+    iter_json,
+    iter_json_object,
+    streaming_json_response,
+    supports_json_aggregation,
+)
+from .reduceddatum_series import (
+    build_series,
+    encode_series_binary,
+    encode_series_json,
+)
 from .utils import (
     build_json_response,
     create_name_reduction_map,
@@ -7,6 +27,7 @@ from .utils import (
     get_astrodata_header,
     get_recipes_and_primitives,
     get_short_name,
+    resolve_media_path,
 )
 
 __all__ = [
@@ -18,4 +39,20 @@ __all__ = [
     "get_short_name",
     "get_astrodata_header",
     "get_recipes_and_primitives",
+    "resolve_media_path",
+    "get_astrodata_descriptors",
+    "read_astrodata_descriptors",
+    "serialize_descriptor_value",
+    "JSONArrayAgg",
+    "RawJSON",
+    "evaluate_first",
+    "iter_json",
+    "iter_json_object",
+    "streaming_json_response",
+    "supports_json_aggregation",
+    "DOWNSAMPLE_METHODS",
+    "downsample",
+    "build_series",
+    "encode_series_binary",
+    "encode_series_json",
 ]
@@ -0,0 +1,146 @@
+"""Cached access to the astrodata descriptors of FITS files on disk."""
+
+__all__ = [
+    "HEADER_CACHE_ALIAS",
+    "get_astrodata_descriptors",
+    "read_astrodata_descriptors",
+    "serialize_descriptor_value",
+]
+
+import datetime
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import astrodata
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+# Name of the dedicated cache in ``settings.CACHES``. A local-memory cache is used for
+# it because it evicts the least recently used entries once ``MAX_ENTRIES`` is reached.
+HEADER_CACHE_ALIAS = "fits_headers"
+# Entries are keyed on the file modification time and size, so they never go stale and
+# only need to expire to free space.
+HEADER_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _get_cache() -> BaseCache:
+    """Returns the header cache, falling back to the default cache if not configured.
+
+    Returns
+    -------
+    `BaseCache`
+        The cache to store serialized descriptors in.
+    """
+    if HEADER_CACHE_ALIAS in settings.CACHES:
+        return caches[HEADER_CACHE_ALIAS]
+    return caches["default"]
+
+
+def _build_cache_key(file_path: Path) -> str:
+    """Builds the cache key for a file from its path, modification time and size.
+
+    Parameters
+    ----------
+    file_path : `Path`
+        The resolved path to the file.
+
+    Returns
+    -------
+    `str`
+        The cache key.
+
+    Raises
+    ------
+    OSError
+        Raised if the file cannot be accessed.
+    """
+    stat = file_path.stat()
+    raw_key = f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    return f"astrodata_header:{hashlib.sha256(raw_key.encode()).hexdigest()}"
+
+
+def serialize_descriptor_value(value: Any) -> str | int | float | bool | None:
+    """Converts a descriptor value into a JSON serializable value.
+
+    Parameters
+    ----------
+    value : `Any`
+        The value returned by an astrodata descriptor.
+
+    Returns
+    -------
+    `str | int | float | bool | None`
+        The value, with dates converted to ISO format and unsupported types converted
+        to strings.
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if not isinstance(value, (str, int, float, bool, type(None))):
+        return str(value)
+    return value
+
+
+def read_astrodata_descriptors(file_path: Path | str) -> dict[str, Any]:
+    """Evaluates every astrodata descriptor of a file without using the cache.
+
+    The file is fully opened with ``astrodata.open``, which parses every extension,
+    so callers should go through `get_astrodata_descriptors` to open each version of
+    a file only once.
+
+    Parameters
+    ----------
+    file_path : `Path | str`
+        The path to the FITS file.
+
+    Returns
+    -------
+    `dict[str, Any]`
+        The serialized descriptor values keyed by descriptor name. Descriptors that
+        raise are skipped.
+    """
+    ad = astrodata.open(str(file_path))
+
+    astrodata_descriptors = {}
+    for descriptor in ad.descriptors:
+        if hasattr(ad, descriptor):
+            try:
+                value = getattr(ad, descriptor)()
+            except Exception:
+                continue
+            astrodata_descriptors[descriptor] = serialize_descriptor_value(value)
+
+    return astrodata_descriptors
+
+
+def get_astrodata_descriptors(file_path: Path | str) -> dict[str, Any]:
+    """Gets the serialized astrodata descriptors of a file, using the header cache.
+
+    The cache is keyed on the path, modification time and size of the file, so a
+    rewritten file is read again.
+
+    Parameters
+    ----------
+    file_path : `Path | str`
+        The path to the FITS file.
+
+    Returns
+    -------
+    `dict[str, Any]`
+        The serialized descriptor values keyed by descriptor name.
+
+    Raises
+    ------
+    Exception
+        Raised if the file cannot be accessed or opened by astrodata.
+    """
+    file_path = Path(file_path).resolve()
+    cache = _get_cache()
+    cache_key = _build_cache_key(file_path)
+
+    astrodata_descriptors = cache.get(cache_key)
+    if astrodata_descriptors is None:
+        astrodata_descriptors = read_astrodata_descriptors(file_path)
+        cache.set(cache_key, astrodata_descriptors, HEADER_CACHE_TIMEOUT)
+
+    return astrodata_descriptors
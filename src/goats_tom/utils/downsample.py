@@ -0,0 +1,127 @@
+"""Downsampling of dense series to the resolution they are plotted at."""
+
+__all__ = ["downsample", "downsample_lttb", "downsample_min_max", "DOWNSAMPLE_METHODS"]
+
+import numpy as np
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def downsample_min_max(y: np.ndarray, n_bins: int) -> np.ndarray:
+    """Selects the lowest and highest point of equally sized bins.
+
+    Keeps every peak and dip visible, returning up to ``2 * n_bins`` points.
+
+    Parameters
+    ----------
+    y : `np.ndarray`
+        The values, ordered by their x coordinate.
+    n_bins : `int`
+        The number of bins, usually the width of the plot in pixels.
+
+    Returns
+    -------
+    `np.ndarray`
+        The sorted indices of the selected points.
+    """
+    n = len(y)
+    if n <= 2 * n_bins:
+        return np.arange(n)
+
+    bins = np.arange(n) * n_bins // n
+    # Sort by bin, then by value, so the first and last point of each bin are its
+    # minimum and maximum.
+    order = np.lexsort((y, bins))
+    sorted_bins = bins[order]
+    starts = np.flatnonzero(np.r_[True, sorted_bins[1:] != sorted_bins[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.concatenate([order[starts], order[ends]]))
+
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Selects points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are kept. From each bucket in between, the point forming
+    the largest triangle with the point selected from the previous bucket and the
+    average of the next bucket is kept, which preserves the visual shape of the
+    series.
+
+    Parameters
+    ----------
+    x : `np.ndarray`
+        The sorted x coordinates.
+    y : `np.ndarray`
+        The values.
+    n_out : `int`
+        The number of points to keep, usually the width of the plot in pixels.
+
+    Returns
+    -------
+    `np.ndarray`
+        The sorted indices of the selected points.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    # Bucket edges for the points between the first and last.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # Averages of the buckets, computed at once from cumulative sums.
+    x_sums = np.r_[0, np.cumsum(x)]
+    y_sums = np.r_[0, np.cumsum(y)]
+    counts = np.diff(edges)
+    x_means = np.r_[(x_sums[edges[1:]] - x_sums[edges[:-1]]) / counts, x[-1]]
+    y_means = np.r_[(y_sums[edges[1:]] - y_sums[edges[:-1]]) / counts, y[-1]]
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_x, next_y = x_means[bucket + 1], y_means[bucket + 1]
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def downsample(x: np.ndarray, y: np.ndarray, n_out: int, method: str) -> np.ndarray:
+    """Selects the points of a series to plot at a given width.
+
+    Points with a non-finite coordinate are dropped.
+
+    Parameters
+    ----------
+    x : `np.ndarray`
+        The x coordinates, in any order.
+    y : `np.ndarray`
+        The values.
+    n_out : `int`
+        The width of the plot in pixels.
+    method : `str`
+        The downsampling method, "lttb" or "minmax".
+
+    Returns
+    -------
+    `np.ndarray`
+        The indices of the selected points, ordered by their x coordinate.
+
+    Raises
+    ------
+    ValueError
+        Raised if the method is not supported.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsampling method: {method}.")
+
+    finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    finite = finite[np.argsort(x[finite], kind="stable")]
+    x, y = x[finite], y[finite]
+
+    if method == "minmax":
+        return finite[downsample_min_max(y, n_out)]
+    return finite[downsample_lttb(x, y, n_out)]
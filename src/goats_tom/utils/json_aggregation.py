@@ -0,0 +1,226 @@
+"""Database-side JSON aggregation and incremental JSON encoding for API responses."""
+
+__all__ = [
+    "JSONArrayAgg",
+    "RawJSON",
+    "evaluate_first",
+    "iter_json",
+    "iter_json_object",
+    "streaming_json_response",
+    "supports_json_aggregation",
+]
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import chain, islice
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db import NotSupportedError, connection
+from django.db.models import Aggregate, TextField
+from django.http import HttpRequest, StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+# Backends that provide both a JSON object function and a JSON array aggregate.
+_JSON_AGGREGATION_VENDORS = ("sqlite", "postgresql", "mysql")
+
+# Number of chunks joined and sent at once when streaming to an ASGI server.
+STREAM_BATCH_SIZE = 256
+
+_encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class RawJSON(str):
+    """Text that is already JSON encoded and is emitted verbatim by `iter_json`."""
+
+
+class JSONArrayAgg(Aggregate):
+    """Aggregates the grouped values into a JSON array, returned as JSON text.
+
+    The text is returned as-is so it can be written to a response without decoding
+    and re-encoding every element in Python.
+    """
+
+    function = "JSON_GROUP_ARRAY"
+    output_field = TextField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        if connection.vendor not in _JSON_AGGREGATION_VENDORS:
+            raise NotSupportedError(
+                "JSONArrayAgg() is not supported on this database backend."
+            )
+        return super().as_sql(compiler, connection, **extra_context)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            function="JSONB_AGG",
+            template="CAST(%(function)s(%(distinct)s%(expressions)s) AS TEXT)",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection, function="JSON_ARRAYAGG", **extra_context
+        )
+
+
+def supports_json_aggregation() -> bool:
+    """Checks if the default database can build JSON arrays and objects in SQL.
+
+    Returns
+    -------
+    `bool`
+        `True` if `JSONArrayAgg` and `JSONObject` can be used.
+    """
+    return (
+        connection.vendor in _JSON_AGGREGATION_VENDORS
+        and connection.features.has_json_object_function
+    )
+
+
+def _encode_key(key: Any) -> str:
+    """Encodes a dictionary key the same way `json.dumps` coerces keys to strings.
+
+    Parameters
+    ----------
+    key : `Any`
+        The key to encode.
+
+    Returns
+    -------
+    `str`
+        The JSON encoded key.
+    """
+    if not isinstance(key, str):
+        if key is True:
+            key = "true"
+        elif key is False:
+            key = "false"
+        elif key is None:
+            key = "null"
+        elif isinstance(key, float):
+            key = float.__repr__(key)
+        else:
+            key = str(key)
+    return _encoder.encode(key)
+
+
+def iter_json(value: Any) -> Iterator[str]:
+    """Encodes a value as JSON chunk by chunk.
+
+    Dictionaries and lists are walked so that `RawJSON` values nested anywhere in them
+    are emitted verbatim; everything else is encoded with the REST framework encoder.
+
+    Parameters
+    ----------
+    value : `Any`
+        The value to encode.
+
+    Yields
+    ------
+    `str`
+        Chunks of the JSON document.
+    """
+    if isinstance(value, RawJSON):
+        yield value
+    elif isinstance(value, dict):
+        yield from iter_json_object(value.items())
+    elif isinstance(value, list):
+        yield "["
+        for i, item in enumerate(value):
+            if i:
+                yield ","
+            yield from iter_json(item)
+        yield "]"
+    else:
+        yield _encoder.encode(value)
+
+
+def iter_json_object(items: Iterable[tuple[Any, Any]]) -> Iterator[str]:
+    """Encodes key and value pairs as a JSON object, consuming them lazily.
+
+    Parameters
+    ----------
+    items : `Iterable[tuple[Any, Any]]`
+        The key and value pairs, for example a generator over database rows.
+
+    Yields
+    ------
+    `str`
+        Chunks of the JSON document.
+    """
+    yield "{"
+    for i, (key, value) in enumerate(items):
+        if i:
+            yield ","
+        yield _encode_key(key)
+        yield ":"
+        yield from iter_json(value)
+    yield "}"
+
+
+def evaluate_first(items: Iterator) -> Iterator:
+    """Evaluates the first item of a lazy iterator right away.
+
+    Streamed responses are sent once the view returns, so evaluating the first item
+    runs the database query in the view and lets its errors be handled there instead
+    of truncating the response.
+
+    Parameters
+    ----------
+    items : `Iterator`
+        The lazy iterator, for example a generator over database rows.
+
+    Returns
+    -------
+    `Iterator`
+        An iterator over the same items.
+    """
+    return chain(list(islice(items, 1)), items)
+
+
+async def _aiter_chunks(chunks: Iterator[str]) -> AsyncIterator[str]:
+    """Pulls chunks in batches from a thread, as the database can't be used async.
+
+    Parameters
+    ----------
+    chunks : `Iterator[str]`
+        The chunks of the JSON document.
+
+    Yields
+    ------
+    `str`
+        Joined batches of chunks.
+    """
+    next_batch = sync_to_async(lambda: list(islice(chunks, STREAM_BATCH_SIZE)))
+    while batch := await next_batch():
+        yield "".join(batch)
+
+
+def streaming_json_response(
+    request: HttpRequest, chunks: Iterator[str]
+) -> StreamingHttpResponse:
+    """Streams a JSON document without holding it in memory.
+
+    ASGI servers buffer responses with a synchronous iterator in full, so they are
+    given an asynchronous iterator instead.
+
+    Parameters
+    ----------
+    request : `HttpRequest`
+        The request being answered, or a REST framework request wrapping it.
+    chunks : `Iterator[str]`
+        The chunks of the JSON document.
+
+    Returns
+    -------
+    `StreamingHttpResponse`
+        The streamed response.
+    """
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        return StreamingHttpResponse(
+            _aiter_chunks(chunks), content_type="application/json"
+        )
+    return StreamingHttpResponse(chunks, content_type="application/json")
@@ -0,0 +1,233 @@
+"""Level-of-detail series of reduced data for plotting."""
+
+__all__ = [
+    "build_series",
+    "encode_series_json",
+    "encode_series_binary",
+    "SERIES_DTYPE",
+]
+
+import json
+import struct
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+from astropy.time import Time
+from django.db.models import QuerySet
+
+from .downsample import downsample
+
+# Little-endian 64-bit floats keep the precision of MJDs and wavelengths.
+SERIES_DTYPE = "<f8"
+
+
+def _as_float(value: Any) -> float:
+    """Converts a stored value to a float, using NaN for missing values."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _build_columns(
+    name: str, columns: dict[str, np.ndarray], width: int, method: str, **meta
+) -> dict:
+    """Downsamples the columns of a series using the first two as x and y.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the series.
+    columns : `dict[str, np.ndarray]`
+        The columns of the series, starting with the x and y coordinates.
+    width : `int`
+        The width of the plot in pixels.
+    method : `str`
+        The downsampling method.
+    **meta
+        Other information about the series.
+
+    Returns
+    -------
+    `dict`
+        The series with its downsampled columns.
+    """
+    x, y = list(columns.values())[:2]
+    indices = downsample(x, y, width, method)
+    return {
+        "name": name,
+        **meta,
+        "total": len(x),
+        "length": len(indices),
+        "columns": {
+            column: values[indices].astype(SERIES_DTYPE)
+            for column, values in columns.items()
+        },
+    }
+
+
+def _build_spectroscopy_series(
+    queryset: QuerySet, width: int, method: str
+) -> list[dict]:
+    """Builds a series per spectrum."""
+    series = []
+    for pk, timestamp, value in queryset.values_list("pk", "timestamp", "value"):
+        if not value.get("wavelength") or not value.get("flux"):
+            continue
+        columns = {
+            "wavelength": np.asarray(value["wavelength"], dtype=float),
+            "flux": np.asarray(value["flux"], dtype=float),
+        }
+        series.append(
+            _build_columns(
+                timestamp.isoformat(),
+                columns,
+                width,
+                method,
+                id=pk,
+                units={
+                    "wavelength": value.get("wavelength_units", ""),
+                    "flux": value.get("flux_units", ""),
+                },
+            )
+        )
+    return series
+
+
+def _build_photometry_series(queryset: QuerySet, width: int, method: str) -> list[dict]:
+    """Builds a detection and a non-detection series per filter."""
+    rows = list(queryset.values_list("timestamp", "value"))
+    if not rows:
+        return []
+
+    # Convert the timestamps of data without a time in a single call.
+    times = np.array([_as_float(value.get("time")) for _, value in rows])
+    missing = np.flatnonzero(np.isnan(times))
+    if missing.size:
+        times[missing] = Time([rows[i][0] for i in missing]).mjd
+
+    detections = defaultdict(list)
+    non_detections = defaultdict(list)
+    for i, (_, value) in enumerate(rows):
+        magnitude = _as_float(value.get("magnitude"))
+        if np.isfinite(magnitude):
+            detections[value.get("filter")].append(
+                (times[i], magnitude, _as_float(value.get("error")))
+            )
+        else:
+            non_detections[value.get("filter")].append(
+                (times[i], _as_float(value.get("limit")))
+            )
+
+    series = []
+    for band, points in detections.items():
+        time, magnitude, error = np.array(points).T
+        columns = {"time": time, "magnitude": magnitude, "error": error}
+        series.append(
+            _build_columns(f"{band} detection", columns, width, method, filter=band)
+        )
+    for band, points in non_detections.items():
+        time, limit = np.array(points).T
+        columns = {"time": time, "limit": limit}
+        series.append(
+            _build_columns(f"{band} non-detection", columns, width, method, filter=band)
+        )
+    return series
+
+
+def build_series(
+    queryset: QuerySet, data_type: str, width: int, method: str
+) -> list[dict]:
+    """Builds downsampled series of reduced data for a plot of a given width.
+
+    Spectroscopy gives a series per spectrum with "wavelength" and "flux" columns.
+    Photometry gives, per filter, a detection series with "time", "magnitude" and
+    "error" columns, and a non-detection series with "time" and "limit" columns.
+    Times are MJDs.
+
+    Parameters
+    ----------
+    queryset : `QuerySet`
+        The reduced data.
+    data_type : `str`
+        The data type, "spectroscopy" or "photometry".
+    width : `int`
+        The width of the plot in pixels.
+    method : `str`
+        The downsampling method, "lttb" or "minmax".
+
+    Returns
+    -------
+    `list[dict]`
+        The series, with their columns as float arrays.
+
+    Raises
+    ------
+    ValueError
+        Raised if the data type is not supported.
+    """
+    if data_type == "spectroscopy":
+        return _build_spectroscopy_series(queryset, width, method)
+    if data_type == "photometry":
+        return _build_photometry_series(queryset.order_by("timestamp"), width, method)
+    raise ValueError(f"Unsupported data type: {data_type}.")
+
+
+def encode_series_json(series: list[dict]) -> list[dict]:
+    """Converts the columns of series to lists for JSON, with NaN as `None`.
+
+    Parameters
+    ----------
+    series : `list[dict]`
+        The series built by `build_series`.
+
+    Returns
+    -------
+    `list[dict]`
+        The series with JSON serializable columns.
+    """
+    return [
+        {
+            **item,
+            "columns": {
+                column: [None if np.isnan(v) else v for v in values.tolist()]
+                for column, values in item["columns"].items()
+            },
+        }
+        for item in series
+    ]
+
+
+def encode_series_binary(meta: dict, series: list[dict]) -> bytes:
+    """Encodes series as a JSON header followed by their columns as float arrays.
+
+    The layout is a little-endian unsigned 32-bit header length, the UTF-8 JSON
+    header, padding to a multiple of 8 bytes, then the columns of each series in
+    order, each being ``length`` little-endian 64-bit floats. The header holds the
+    metadata and, for each series, its column names instead of the values.
+
+    Parameters
+    ----------
+    meta : `dict`
+        Metadata about the request to include in the header.
+    series : `list[dict]`
+        The series built by `build_series`.
+
+    Returns
+    -------
+    `bytes`
+        The encoded series.
+    """
+    header = {
+        **meta,
+        "dtype": SERIES_DTYPE,
+        "series": [{**item, "columns": list(item["columns"])} for item in series],
+    }
+    header_bytes = json.dumps(header).encode()
+    # Pad so the arrays are aligned for typed array views in the browser.
+    header_bytes += b" " * (-(4 + len(header_bytes)) % 8)
+    arrays = [
+        values.tobytes() for item in series for values in item["columns"].values()
+    ]
+    return b"".join([struct.pack("<I", len(header_bytes)), header_bytes, *arrays])
@@ -9,6 +9,7 @@ __all__ = [
     "get_short_name",
     "get_astrodata_header",
     "get_recipes_and_primitives",
+    "resolve_media_path",
 ]
 
 import importlib
@@ -19,6 +20,7 @@ from typing import Any
 
 import astrodata
 from astropy.table import Table
+from django.conf import settings
 from django.http import JsonResponse
 from recipe_system.mappers.recipeMapper import RecipeMapper
 from recipe_system.utils.errors import ModeError, RecipeNotFound
@@ -291,3 +293,29 @@ def get_recipes_and_primitives(tags: set, instrument: str) -> dict[str, Any]:
             continue
 
     return {"recipes": recipes}
+
+
+def resolve_media_path(filepath: str | Path) -> Path:
+    """Resolves a path relative to the media root, rejecting paths outside of it.
+
+    Parameters
+    ----------
+    filepath : `str | Path`
+        The path relative to the media root.
+
+    Returns
+    -------
+    `Path`
+        The resolved absolute path.
+
+    Raises
+    ------
+    ValueError
+        Raised if the path resolves outside of the media root, such as with ".." or
+        an absolute path.
+    """
+    media_root = Path(settings.MEDIA_ROOT).resolve()
+    full_path = (media_root / filepath).resolve()
+    if not full_path.is_relative_to(media_root):
+        raise ValueError("The specified file is outside of the media directory.")
+    return full_path
@@ -1,11 +1,9 @@
 __all__ = ["TargetDetailView"]
 
 import logging
-from io import StringIO
 from urllib.parse import urlencode
 
 from django.contrib import messages
-from django.core.management import call_command
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.safestring import mark_safe
@@ -14,6 +12,8 @@ from tom_observations.models import ObservationTemplate
 from tom_observations.observation_template import ApplyObservationTemplateForm
 from tom_targets.views import TargetDetailView as BaseTargetDetailView
 
+from goats_tom.tasks import refresh_target_observation_statuses
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
@@ -28,15 +28,14 @@ class TargetDetailView(BaseTargetDetailView):
             if not request.user.is_authenticated:
                 return redirect(reverse("login"))
             target_id = kwargs.get("pk", None)
-            out = StringIO()
-            call_command(
-                "updatestatus",
-                target_id=target_id,
-                # Provide the username so the facility is updated.
-                username=request.user.username,
-                stdout=out,
+            # Refresh in background so the page never waits on the facilities, the
+            # user is notified once the statuses are refreshed.
+            refresh_target_observation_statuses.send(target_id, request.user.id)
+            messages.info(
+                request,
+                "Updating observations status in the background, you will be notified"
+                " when it is done.",
             )
-            messages.info(request, out.getvalue())
             add_hint(
                 request,
                 mark_safe(
@@ -0,0 +1,408 @@
+import numpy as np
+import pytest
+import requests
+from django.core.cache import caches
+
+from goats_tom.antares_client import AntaresHTTPClient
+from goats_tom.antares_client import cache as antares_cache
+from goats_tom.antares_client import client as antares_client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches[antares_cache.ANTARES_CACHE_ALIAS].clear()
+    yield
+    caches[antares_cache.ANTARES_CACHE_ALIAS].clear()
+
+
+@pytest.fixture
+def client(mocker):
+    mocker.patch.object(antares_client.time, "sleep")
+    return AntaresHTTPClient(
+        pool_size=2, max_retries=2, backoff_factor=0.1, backoff_max=5
+    )
+
+
+def make_response(mocker, status_code=200, content=b"{}", headers=None):
+    return mocker.MagicMock(
+        status_code=status_code, content=content, headers=headers or {}
+    )
+
+
+def test_get_success(mocker, client):
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.return_value = make_response(mocker, content=b"12345")
+
+    response = client.get("https://example.com", params={"a": 1})
+
+    assert response.status_code == 200
+    mock_get.assert_called_once_with(
+        "https://example.com",
+        params={"a": 1},
+        timeout=antares_client.config["API_TIMEOUT"],
+    )
+    stats = client.stats
+    assert stats["requests"] == 1
+    assert stats["retries"] == 0
+    assert stats["bytes"] == 5
+
+
+def test_get_retries_server_errors(mocker, client):
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.side_effect = [
+        make_response(mocker, status_code=503),
+        make_response(mocker, status_code=502),
+        make_response(mocker),
+    ]
+
+    response = client.get("https://example.com")
+
+    assert response.status_code == 200
+    assert mock_get.call_count == 3
+    assert client.stats["retries"] == 2
+    assert client.stats["errors"] == 2
+
+
+def test_get_returns_error_after_retries(mocker, client):
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.return_value = make_response(mocker, status_code=500)
+
+    response = client.get("https://example.com")
+
+    assert response.status_code == 500
+    assert mock_get.call_count == 3
+
+
+def test_get_does_not_retry_client_errors(mocker, client):
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.return_value = make_response(mocker, status_code=404)
+
+    assert client.get("https://example.com").status_code == 404
+    assert mock_get.call_count == 1
+
+
+def test_get_honors_retry_after(mocker, client):
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.side_effect = [
+        make_response(mocker, status_code=429, headers={"Retry-After": "3"}),
+        make_response(mocker),
+    ]
+
+    client.get("https://example.com")
+
+    antares_client.time.sleep.assert_called_once_with(3.0)
+
+
+def test_get_gives_up_on_long_retry_after(mocker, client):
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.return_value = make_response(
+        mocker, status_code=429, headers={"Retry-After": "120"}
+    )
+
+    assert client.get("https://example.com").status_code == 429
+    assert mock_get.call_count == 1
+
+
+def test_get_retries_connection_errors(mocker, client):
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.side_effect = requests.ConnectionError("Failed")
+
+    with pytest.raises(requests.ConnectionError):
+        client.get("https://example.com")
+    assert mock_get.call_count == 3
+    assert client.stats["errors"] == 3
+
+
+def test_backoff_is_bounded(client):
+    for attempt in range(10):
+        assert 0 <= client._backoff(attempt) <= client.backoff_max
+
+
+def test_retry_after_http_date(mocker):
+    response = make_response(
+        mocker, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+    assert AntaresHTTPClient._retry_after(response) == 0.0
+
+
+def test_reset_stats(mocker, client):
+    mocker.patch.object(client._session, "get", return_value=make_response(mocker))
+    client.get("https://example.com")
+    client.reset_stats()
+    assert client.stats["requests"] == 0
+
+
+def make_page(mocker, locus_ids, next_url=None):
+    body = {
+        "data": [
+            {
+                "type": "locus_listing",
+                "id": locus_id,
+                "attributes": {
+                    "ra": 1.0,
+                    "dec": 2.0,
+                    "properties": {},
+                    "tags": [],
+                },
+            }
+            for locus_id in locus_ids
+        ],
+        "links": {"next": next_url},
+    }
+    response = make_response(mocker)
+    response.json.return_value = body
+    return response
+
+
+@pytest.fixture
+def pages(mocker):
+    """Three pages of two loci each."""
+    responses = {
+        "page1": make_page(mocker, ["ANT1", "ANT2"], "page2"),
+        "page2": make_page(mocker, ["ANT3", "ANT4"], "page3"),
+        "page3": make_page(mocker, ["ANT5", "ANT6"]),
+    }
+    return mocker.patch.object(
+        antares_client.http_client,
+        "get",
+        side_effect=lambda url, params=None: responses[url.rsplit("/", 1)[-1]],
+    )
+
+
+@pytest.fixture
+def base_url(monkeypatch):
+    monkeypatch.setitem(antares_client.config, "ANTARES_API_BASE_URL", "https://x/")
+    return "https://x/page1"
+
+
+@pytest.mark.parametrize("read_ahead", [0, 1, 2])
+def test_list_all_resources(monkeypatch, pages, base_url, read_ahead):
+    monkeypatch.setitem(antares_client.config, "READ_AHEAD_PAGES", read_ahead)
+
+    loci = list(
+        antares_client._list_all_resources(
+            base_url, antares_client._LocusListingSchema
+        )
+    )
+
+    assert [locus.locus_id for locus in loci] == [f"ANT{i}" for i in range(1, 7)]
+    assert pages.call_count == 3
+    # Each body is parsed once.
+    for call in pages.call_args_list:
+        response = pages.side_effect(*call.args, **call.kwargs)
+        assert response.json.call_count == 1
+
+
+@pytest.mark.parametrize("read_ahead", [0, 1])
+def test_list_all_resources_limit(monkeypatch, pages, base_url, read_ahead):
+    monkeypatch.setitem(antares_client.config, "READ_AHEAD_PAGES", read_ahead)
+
+    loci = list(
+        antares_client._list_all_resources(
+            base_url, antares_client._LocusListingSchema, limit=3
+        )
+    )
+
+    assert [locus.locus_id for locus in loci] == ["ANT1", "ANT2", "ANT3"]
+    assert pages.call_count == 2
+
+
+def test_list_all_resources_error(monkeypatch, mocker, base_url):
+    response = make_response(mocker, status_code=400)
+    response.json.return_value = {"errors": ["Bad query."]}
+    mocker.patch.object(antares_client.http_client, "get", return_value=response)
+
+    with pytest.raises(antares_client.AntaresException):
+        list(
+            antares_client._list_all_resources(
+                base_url, antares_client._LocusListingSchema
+            )
+        )
+
+
+def test_search_passes_limit(mocker):
+    mock_list = mocker.patch.object(antares_client, "_list_all_resources")
+
+    antares_client.search({"query": {}}, limit=5)
+
+    assert mock_list.call_args.kwargs["limit"] == 5
+
+
+def make_locus_response(mocker, status_code=200):
+    response = make_response(mocker, status_code=status_code)
+    response.json.return_value = {
+        "data": {
+            "type": "locus",
+            "id": "ANT1",
+            "attributes": {
+                "ra": 1.0,
+                "dec": 2.0,
+                "properties": {},
+                "tags": [],
+                "lightcurve": "ant_mjd,ant_mag\n1.0,18.0\n",
+            },
+        }
+    }
+    return response
+
+
+def test_get_by_id_cached(mocker):
+    mock_get = mocker.patch.object(
+        antares_client.http_client, "get", return_value=make_locus_response(mocker)
+    )
+
+    first = antares_client.get_by_id("ANT1")
+    second = antares_client.get_by_id("ANT1")
+
+    assert first.locus_id == second.locus_id == "ANT1"
+    assert mock_get.call_count == 1
+    # The lightcurve is read from the same cached locus.
+    assert len(second.lightcurve) == 1
+    assert mock_get.call_count == 1
+
+
+def test_get_by_id_without_cache(mocker):
+    mock_get = mocker.patch.object(
+        antares_client.http_client, "get", return_value=make_locus_response(mocker)
+    )
+
+    antares_client.get_by_id("ANT1")
+    locus = antares_client.get_by_id("ANT1", use_cache=False)
+
+    assert mock_get.call_count == 2
+    assert not locus.use_cache
+
+
+def test_get_by_id_errors_not_cached(mocker):
+    mock_get = mocker.patch.object(
+        antares_client.http_client,
+        "get",
+        return_value=make_locus_response(mocker, status_code=404),
+    )
+
+    assert antares_client.get_by_id("ANT1") is None
+    assert antares_client.get_by_id("ANT1") is None
+    assert mock_get.call_count == 2
+
+
+def test_locus_alerts_cached(mocker):
+    response = make_response(mocker)
+    response.json.return_value = {
+        "data": [
+            {
+                "type": "alert",
+                "id": "alert1",
+                "attributes": {"mjd": 1.0, "properties": {}},
+            }
+        ]
+    }
+    mock_get = mocker.patch.object(
+        antares_client.http_client, "get", return_value=response
+    )
+
+    for _ in range(2):
+        locus = antares_client.Locus("ANT1", 1.0, 2.0, {}, [])
+        assert [alert.alert_id for alert in locus.alerts] == ["alert1"]
+
+    assert mock_get.call_count == 1
+
+
+def test_large_responses_not_cached(mocker, monkeypatch):
+    monkeypatch.setattr(antares_cache, "MAX_CACHED_BYTES", 1)
+    mock_get = mocker.patch.object(
+        antares_client.http_client, "get", return_value=make_locus_response(mocker)
+    )
+
+    antares_client.get_by_id("ANT1")
+    antares_client.get_by_id("ANT1")
+
+    assert mock_get.call_count == 2
+
+
+def test_build_cache_key_ignores_param_order():
+    assert antares_cache.build_cache_key(
+        "https://x/loci", {"a": 1, "b": 2}
+    ) == antares_cache.build_cache_key("https://x/loci", {"b": 2, "a": 1})
+    assert antares_cache.build_cache_key(
+        "https://x/loci", {"a": 1}
+    ) != antares_cache.build_cache_key("https://x/loci", {"a": 2})
+
+
+LIGHTCURVE_CSV = (
+    "alert_id,ant_mjd,ant_passband,ant_mag,ant_magerr,ant_survey,unused\n"
+    "a1,60000.5,g,18.5,0.1,1,x\n"
+    "a2,60001.5,R,,,1,y\n"
+)
+
+
+def test_lightcurve_deserialize():
+    lightcurve = antares_client._Lightcurve().deserialize(LIGHTCURVE_CSV)
+
+    assert list(lightcurve.columns) == [
+        "alert_id",
+        "ant_mjd",
+        "ant_passband",
+        "ant_mag",
+        "ant_magerr",
+        "ant_survey",
+    ]
+    assert lightcurve["ant_mjd"].dtype == "float64"
+    assert lightcurve["ant_mag"].dtype == "float64"
+    assert lightcurve["ant_passband"].dtype == "category"
+    assert lightcurve["ant_survey"].dtype == "Int64"
+
+
+def test_lightcurve_deserialize_empty():
+    lightcurve = antares_client._Lightcurve().deserialize("")
+
+    assert lightcurve.empty
+    assert "ant_mjd" in lightcurve.columns
+
+
+def test_lightcurve_arrays():
+    locus = antares_client.Locus(
+        "ANT1",
+        1.0,
+        2.0,
+        {},
+        [],
+        lightcurve=antares_client._Lightcurve().deserialize(LIGHTCURVE_CSV),
+    )
+
+    arrays = locus.lightcurve_arrays(["ant_mjd", "ant_mag"])
+
+    assert list(arrays) == ["ant_mjd", "ant_mag"]
+    assert arrays["ant_mjd"].tolist() == [60000.5, 60001.5]
+    assert arrays["ant_mag"][0] == 18.5
+    assert np.isnan(arrays["ant_mag"][1])
+
+
+def test_lightcurve_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    locus = antares_client.Locus(
+        "ANT1",
+        1.0,
+        2.0,
+        {},
+        [],
+        lightcurve=antares_client._Lightcurve().deserialize(LIGHTCURVE_CSV),
+    )
+
+    table = locus.lightcurve_arrow(["ant_mjd"])
+
+    assert isinstance(table, pyarrow.Table)
+    assert table.column("ant_mjd").to_pylist() == [60000.5, 60001.5]
+
+
+def test_timeseries():
+    alerts = [
+        antares_client.Alert("a1", 60000.0, {"ant_mag": 18.0}),
+        antares_client.Alert("a2", 60001.0, {"ant_mag": 18.5}),
+    ]
+    locus = antares_client.Locus("ANT1", 1.0, 2.0, {}, [], alerts=alerts)
+
+    timeseries = locus.timeseries
+
+    assert len(timeseries) == 2
+    assert timeseries.time.mjd.tolist() == [60000.0, 60001.0]
+    assert timeseries.time[0].value == antares_client.mjd_to_datetime(60000.0)
@@ -1,2 +1,74 @@
 """Test module for antares2goats."""
 # TODO: Add the tests after confirming this change fixes issue with browser extension.
+
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+from tom_alerts.models import BrokerQuery
+
+from goats_tom.api_views import Antares2GoatsViewSet
+from goats_tom.tests.factories import UserFactory
+
+
+class TestAntares2GoatsViewSetBulk(APITestCase):
+    """Class to test importing many loci with the `Antares2GoatsViewSet`."""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = UserFactory()
+        self.bulk_view = Antares2GoatsViewSet.as_view({"post": "bulk"})
+
+    def post(self, data):
+        request = self.factory.post(
+            reverse("antares2goats-bulk"), data, format="json"
+        )
+        force_authenticate(request, user=self.user)
+        return self.bulk_view(request)
+
+    @patch("goats_tom.api_views.antares2goats.import_antares_loci.send")
+    @patch("goats_tom.api_views.antares2goats.import_loci")
+    def test_bulk_small(self, mock_import, mock_send):
+        """Test few loci are imported within the request."""
+        mock_import.return_value = {"created": 1, "duplicates": 1, "failed": 0}
+
+        response = self.post({"locusids": ["ANT1", "ANT2", "ANT1"]})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 1)
+        mock_import.assert_called_once_with(["ANT1", "ANT2"])
+        mock_send.assert_not_called()
+
+    @patch("goats_tom.api_views.antares2goats.import_antares_loci.send")
+    @patch("goats_tom.api_views.antares2goats.import_loci")
+    def test_bulk_large(self, mock_import, mock_send):
+        """Test many loci are imported in the background."""
+        locus_ids = [f"ANT{i}" for i in range(300)]
+
+        response = self.post({"locusids": locus_ids})
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_import.assert_not_called()
+        mock_send.assert_called_once_with(locus_ids, None, self.user.id)
+
+    @patch("goats_tom.api_views.antares2goats.import_antares_loci.send")
+    def test_bulk_query(self, mock_send):
+        """Test the results of a saved query are imported in the background."""
+        query = BrokerQuery.objects.create(
+            name="esquery_ANTARES_1", broker="ANTARES", parameters={}
+        )
+
+        response = self.post({"query": query.pk})
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_send.assert_called_once_with(None, query.pk, self.user.id)
+
+    def test_bulk_invalid(self):
+        """Test either locus IDs or a query must be given."""
+        self.assertEqual(self.post({}).status_code, status.HTTP_400_BAD_REQUEST)
+        query = BrokerQuery.objects.create(
+            name="esquery_ANTARES_1", broker="ANTARES", parameters={}
+        )
+        response = self.post({"locusids": ["ANT1"], "query": query.pk})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,71 @@
+"""Test module for publishing DRAGONS outputs as data products."""
+
+from unittest.mock import patch
+
+from django.conf import settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from goats_tom.api_views import DataProductsViewSet
+from goats_tom.tests.factories import DRAGONSRunFactory, UserFactory
+
+
+class TestDataProductsViewSetPublish(APITestCase):
+    """Class to test publishing many files with the `DataProductsViewSet`."""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = UserFactory()
+        self.publish_view = DataProductsViewSet.as_view({"post": "publish"})
+        self.run = DRAGONSRunFactory(output_directory="publish_test")
+        output_dir = self.run.get_output_dir()
+        self.filepath = str(output_dir.relative_to(settings.MEDIA_ROOT))
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for filename in ["a.fits", "b.fits"]:
+            (output_dir / filename).touch()
+        # A file outside of the output directory of the run.
+        (output_dir.parent / "other.fits").touch()
+
+    def post(self, data):
+        request = self.factory.post(
+            reverse("dragonsdataproducts-publish"), data, format="json"
+        )
+        force_authenticate(request, user=self.user)
+        return self.publish_view(request)
+
+    @patch("goats_tom.api_views.dataproducts.publish_dataproducts.send")
+    def test_publish(self, mock_send):
+        """Test the files are queued once for publishing in the background."""
+        files = [
+            {"filepath": self.filepath, "filename": "a.fits"},
+            {"filepath": self.filepath, "filename": "b.fits"},
+            {"filepath": self.filepath, "filename": "a.fits"},
+        ]
+        response = self.post({"dragons_run": self.run.pk, "files": files})
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["count"], 2)
+        mock_send.assert_called_once_with(
+            self.run.pk, files[:2], "fits_file", [], self.user.id
+        )
+
+    @patch("goats_tom.api_views.dataproducts.publish_dataproducts.send")
+    def test_publish_missing_file(self, mock_send):
+        """Test publishing fails if a file does not exist."""
+        files = [{"filepath": self.filepath, "filename": "missing.fits"}]
+        response = self.post({"dragons_run": self.run.pk, "files": files})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        mock_send.assert_not_called()
+
+    @patch("goats_tom.api_views.dataproducts.publish_dataproducts.send")
+    def test_publish_outside_run(self, mock_send):
+        """Test publishing fails for files outside of the output directory."""
+        for filepath in [f"{self.filepath}/..", "../.."]:
+            files = [{"filepath": filepath, "filename": "other.fits"}]
+            response = self.post({"dragons_run": self.run.pk, "files": files})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("not outputs of the run", str(response.data["files"]))
+        mock_send.assert_not_called()
@@ -0,0 +1,141 @@
+"""Test module for the DRAGONS data API view."""
+
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from goats_tom.api_views import DRAGONSDataViewSet
+from goats_tom.tests.factories import (
+    DRAGONSFileFactory,
+    DRAGONSRecipeFactory,
+    DRAGONSRunFactory,
+    UserFactory,
+)
+
+
+class TestDRAGONSDataViewSet(APITestCase):
+    """Class to test the `DRAGONSData` API view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = APIRequestFactory()
+        cls.user = UserFactory()
+        cls.detail_view = DRAGONSDataViewSet.as_view({"get": "retrieve"})
+
+    def setUp(self):
+        cache.clear()
+
+    def get_response(self, dragons_run, **headers):
+        request = self.factory.get(
+            reverse("dragonsdata-detail", args=[dragons_run.pk]), **headers
+        )
+        force_authenticate(request, user=self.user)
+        with patch(
+            "goats_tom.models.DRAGONSRun.list_groups", return_value=["exposure_time"]
+        ) as mock_list_groups:
+            response = self.detail_view(request, pk=dragons_run.pk)
+            if response.streaming:
+                response.content_bytes = b"".join(response.streaming_content)
+            else:
+                response.content_bytes = response.content
+        response.list_groups_calls = mock_list_groups.call_count
+        return response
+
+    def get_data(self, dragons_run):
+        response = self.get_response(dragons_run)
+        assert response.status_code == status.HTTP_200_OK
+        return json.loads(response.content_bytes)
+
+    def test_retrieve_groups_recipes_and_files(self):
+        """Test recipes and files are grouped by observation type, class and object."""
+        dragons_run = DRAGONSRunFactory()
+        group = {
+            "observation_type": "BIAS",
+            "observation_class": "dayCal",
+            "object_name": "Bias",
+        }
+        recipe = DRAGONSRecipeFactory(dragons_run=dragons_run, **group)
+        files = DRAGONSFileFactory.create_batch(2, dragons_run=dragons_run, **group)
+        DRAGONSFileFactory(
+            dragons_run=dragons_run,
+            observation_type="OBJECT",
+            observation_class="science",
+            object_name="M31",
+        )
+
+        data = self.get_data(dragons_run)
+
+        assert data["groups"] == ["exposure_time"]
+        observation_types = data["recipes_and_files"]["observation_type"]
+        node = observation_types["BIAS"]["dayCal"]["Bias"]
+        assert [r["id"] for r in node["recipes"]] == [recipe.pk]
+        assert node["files"]["All"]["count"] == 2
+        assert {f["id"] for f in node["files"]["All"]["files"]} == {
+            f.pk for f in files
+        }
+        assert node["files"]["All"]["files"][0]["dragons_run"] == dragons_run.pk
+
+        node = observation_types["OBJECT"]["science"]["M31"]
+        assert node["recipes"] == []
+        assert node["files"]["All"]["count"] == 1
+
+    def test_retrieve_recipe_without_files(self):
+        """Test a group with only recipes has an empty file group."""
+        dragons_run = DRAGONSRunFactory()
+        DRAGONSRecipeFactory(
+            dragons_run=dragons_run,
+            observation_type="FLAT",
+            observation_class="partnerCal",
+            object_name=None,
+        )
+
+        data = self.get_data(dragons_run)
+
+        node = data["recipes_and_files"]["observation_type"]["FLAT"]["partnerCal"]
+        assert node["null"]["files"]["All"] == {"count": 0, "files": []}
+
+    def test_retrieve_sets_etag_and_last_modified(self):
+        """Test the response carries the data version of the run."""
+        dragons_run = DRAGONSRunFactory()
+
+        response = self.get_response(dragons_run)
+
+        assert response["ETag"] == dragons_run.get_data_etag()
+        assert "Last-Modified" in response
+
+    def test_retrieve_not_modified(self):
+        """Test a matching `If-None-Match` is answered with 304."""
+        dragons_run = DRAGONSRunFactory()
+        etag = self.get_response(dragons_run)["ETag"]
+
+        response = self.get_response(dragons_run, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response.list_groups_calls == 0
+
+    def test_retrieve_uses_cached_payload(self):
+        """Test the payload is built once per data version."""
+        dragons_run = DRAGONSRunFactory()
+        first = self.get_response(dragons_run)
+        second = self.get_response(dragons_run)
+
+        assert first.list_groups_calls == 1
+        assert second.list_groups_calls == 0
+        assert second.content_bytes == first.content_bytes
+
+    def test_retrieve_after_change(self):
+        """Test changing the files of a run invalidates the entity tag and cache."""
+        dragons_run = DRAGONSRunFactory()
+        etag = self.get_response(dragons_run)["ETag"]
+
+        DRAGONSFileFactory(dragons_run=dragons_run)
+        response = self.get_response(dragons_run, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.list_groups_calls == 1
@@ -1,5 +1,10 @@
 """Test module for a DRAGONS file."""
 
+import json
+from unittest.mock import patch
+
+import pytest
+from django.db import DatabaseError
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
@@ -70,3 +75,130 @@ class TestDRAGONSFilesViewSet(APITestCase):
         response = self.list_view(request)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_group_by_descriptor(self):
+        """Test grouping DRAGONS files by an astrodata descriptor."""
+        dragons_run = DRAGONSRunFactory()
+        for exposure_time in [10.0, 10.0, 30.0]:
+            DRAGONSFileFactory(
+                dragons_run=dragons_run,
+                astrodata_descriptors={"exposure_time": exposure_time},
+            )
+
+        request = self.factory.get(
+            reverse("dragonsfiles-list"),
+            {"dragons_run": dragons_run.pk, "group_by": ["exposure_time"]},
+        )
+        self.authenticate(request)
+
+        response = self.list_view(request)
+        data = json.loads(b"".join(response.streaming_content))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert list(data) == ["10.0", "30.0"]
+        assert data["10.0"]["count"] == 2
+        assert len(data["10.0"]["files"]) == 2
+        assert data["30.0"]["count"] == 1
+        assert set(data["30.0"]["files"][0]) == {
+            "id",
+            "product_id",
+            "url",
+            "object_name",
+            "observation_type",
+            "observation_class",
+        }
+
+    def test_group_by_all(self):
+        """Test grouping all DRAGONS files under a single group."""
+        dragons_run = DRAGONSRunFactory()
+        DRAGONSFileFactory.create_batch(3, dragons_run=dragons_run)
+
+        request = self.factory.get(
+            reverse("dragonsfiles-list"),
+            {"dragons_run": dragons_run.pk, "group_by": ["all"]},
+        )
+        self.authenticate(request)
+
+        response = self.list_view(request)
+        data = json.loads(b"".join(response.streaming_content))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data["All"]["count"] == 3
+        assert len(data["All"]["files"]) == 3
+
+    def test_group_by_database_error(self):
+        """Test a database error is raised by the view, not while streaming."""
+        request = self.factory.get(reverse("dragonsfiles-list"), {"group_by": ["all"]})
+        self.authenticate(request)
+
+        with patch.object(
+            DRAGONSFilesViewSet,
+            "_iter_all_group",
+            side_effect=lambda queryset: (_ for _ in ()).throw(DatabaseError("Failed")),
+        ):
+            with pytest.raises(DatabaseError):
+                self.list_view(request)
+
+    def test_group_by_no_files(self):
+        """Test grouping returns an empty group when there are no files."""
+        dragons_run = DRAGONSRunFactory()
+
+        request = self.factory.get(
+            reverse("dragonsfiles-list"),
+            {"dragons_run": dragons_run.pk, "group_by": ["exposure_time"]},
+        )
+        self.authenticate(request)
+
+        response = self.list_view(request)
+        data = json.loads(b"".join(response.streaming_content))
+
+        assert data == {"N/A": {"count": 0, "files": []}}
+
+    def test_filter_expression_on_indexed_descriptor(self):
+        """Test filtering DRAGONS files on an indexed descriptor column."""
+        dragons_run = DRAGONSRunFactory()
+        for exposure_time in [10.0, 20.0, 30.0]:
+            DRAGONSFileFactory(
+                dragons_run=dragons_run,
+                astrodata_descriptors={"exposure_time": exposure_time},
+            )
+
+        request = self.factory.get(
+            reverse("dragonsfiles-list"),
+            {"dragons_run": dragons_run.pk, "filter_expression": "exposure_time > 15"},
+        )
+        self.authenticate(request)
+
+        response = self.list_view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("results")) == 2
+
+    def test_filter_explain(self):
+        """Test requesting the explanation of a filter expression."""
+        dragons_run = DRAGONSRunFactory()
+        DRAGONSFileFactory(
+            dragons_run=dragons_run, astrodata_descriptors={"exposure_time": 20.0}
+        )
+
+        request = self.factory.get(
+            reverse("dragonsfiles-list"),
+            {
+                "dragons_run": dragons_run.pk,
+                "filter_expression": "exposure_time > 15",
+                "filter_explain": True,
+            },
+        )
+        self.authenticate(request)
+
+        # Only staff users can see the SQL outside of debug mode.
+        response = self.list_view(request)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        force_authenticate(request, user=UserFactory(is_staff=True))
+        response = self.list_view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["valid"]
+        assert response.data["count"] == 1
+        assert "sql" in response.data
@@ -0,0 +1,102 @@
+"""Test module for the DRAGONS processed files."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from goats_tom.api_views import DRAGONSProcessedFilesViewSet
+from goats_tom.tests.factories import UserFactory
+
+
+class TestDRAGONSProcessedFilesViewSet(APITestCase):
+    """Class to test the `DRAGONSProcessedFilesViewSet` header actions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = APIRequestFactory()
+        cls.user = UserFactory()
+        cls.header_view = DRAGONSProcessedFilesViewSet.as_view({"post": "header"})
+        cls.headers_view = DRAGONSProcessedFilesViewSet.as_view({"post": "headers"})
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_root = Path(temp_dir.name) / "media"
+        (self.media_root / "run").mkdir(parents=True)
+        (self.media_root / "run" / "a.fits").touch()
+        (Path(temp_dir.name) / "secret.fits").touch()
+
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        patcher = patch(
+            "goats_tom.api_views.dragons_processed_files.get_astrodata_descriptors",
+            return_value={"exposure_time": 10.0},
+        )
+        self.mock_descriptors = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, view, url_name, data):
+        request = self.factory.post(reverse(url_name), data, format="json")
+        force_authenticate(request, user=self.user)
+        return view(request)
+
+    def test_headers(self):
+        """Test reading the headers of many files, reporting errors per file."""
+        response = self.post(
+            self.headers_view,
+            "dragonsprocessedfiles-headers",
+            {"filepaths": ["run/a.fits", "run/missing.fits", "../secret.fits"]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert [result["filepath"] for result in results] == [
+            "run/a.fits",
+            "run/missing.fits",
+            "../secret.fits",
+        ]
+        assert results[0]["astrodata_descriptors"] == {"exposure_time": 10.0}
+        assert results[1]["error"] == "The specified file does not exist."
+        assert "outside of the media directory" in results[2]["error"]
+        self.mock_descriptors.assert_called_once_with(
+            (self.media_root / "run" / "a.fits").resolve()
+        )
+
+    def test_headers_absolute_path_rejected(self):
+        """Test absolute paths outside of the media root are not read."""
+        secret = self.media_root.parent / "secret.fits"
+
+        response = self.post(
+            self.headers_view, "dragonsprocessedfiles-headers", {"filepaths": [str(secret)]}
+        )
+
+        assert "astrodata_descriptors" not in response.data["results"][0]
+        self.mock_descriptors.assert_not_called()
+
+    def test_header_outside_media_root(self):
+        """Test the header of a file outside of the media root is rejected."""
+        response = self.post(
+            self.header_view, "dragonsprocessedfiles-header", {"filepath": "../secret.fits"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        self.mock_descriptors.assert_not_called()
+
+    def test_header(self):
+        """Test reading the header of a single file."""
+        response = self.post(
+            self.header_view, "dragonsprocessedfiles-header", {"filepath": "run/a.fits"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "filename": "a.fits",
+            "astrodata_descriptors": {"exposure_time": 10.0},
+        }
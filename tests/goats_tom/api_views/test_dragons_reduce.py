@@ -115,6 +115,7 @@ class TestDRAGONSReduceViewSet(APITestCase):
             label=reduction.get_label(),
             color="warning",
             message="Background task canceled.",
+            user_id=self.user.id,
         )
         self.assertEqual(reduction.status, "canceled")
 
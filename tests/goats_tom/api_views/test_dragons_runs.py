@@ -1,5 +1,9 @@
 """Test module for a DRAGONS run."""
 
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
@@ -22,6 +26,7 @@ class TestDRAGONSRunViewSet(APITestCase):
         cls.detail_view = DRAGONSRunsViewSet.as_view(
             {"get": "retrieve", "delete": "destroy"},
         )
+        cls.log_view = DRAGONSRunsViewSet.as_view({"get": "log"})
 
     def authenticate(self, request):
         """Helper method to authenticate requests."""
@@ -129,3 +134,34 @@ class TestDRAGONSRunViewSet(APITestCase):
         response = self.list_view(request)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_read_log(self):
+        """Test reading the log of a run from an offset."""
+        dragons_run = DRAGONSRunFactory()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = Path(tmp_dir) / "log.log"
+            log_file.write_text("first\nsecond\n")
+            request = self.factory.get(
+                reverse("dragonsruns-log", args=[dragons_run.pk]), {"offset": 6}
+            )
+            self.authenticate(request)
+
+            with patch.object(DRAGONSRun, "get_log_file", return_value=log_file):
+                response = self.log_view(request, pk=dragons_run.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["content"], "second\n")
+        self.assertEqual(response.data["next_offset"], 13)
+
+    def test_read_log_invalid_offset(self):
+        """Test a negative offset is rejected."""
+        dragons_run = DRAGONSRunFactory()
+        request = self.factory.get(
+            reverse("dragonsruns-log", args=[dragons_run.pk]), {"offset": -1}
+        )
+        self.authenticate(request)
+
+        response = self.log_view(request, pk=dragons_run.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
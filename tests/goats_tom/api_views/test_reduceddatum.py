@@ -1,8 +1,21 @@
-from rest_framework.test import APITestCase
+import json
+import struct
+from unittest.mock import patch
+
+import numpy as np
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 from tom_dataproducts.api_views import ReducedDatumViewSet as BaseReducedDatumViewSet
 
 from goats_tom.api_views import ReducedDatumViewSet
 from goats_tom.filters import ReducedDatumFilter
+from goats_tom.tests.factories import (
+    DataProductFactory,
+    ReducedDatumFactory,
+    UserFactory,
+)
 
 
 class TestReducedDatumViewSet(APITestCase):
@@ -13,3 +26,100 @@ class TestReducedDatumViewSet(APITestCase):
     def test_filterset_class_is_correct(self):
         """Test that ReducedDatumViewSet specifies the correct filterset class."""
         self.assertEqual(ReducedDatumViewSet.filterset_class, ReducedDatumFilter)
+
+
+class TestReducedDatumSeries(APITestCase):
+    """Class to test the downsampled series of `ReducedDatumViewSet`."""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = UserFactory()
+        self.view = ReducedDatumViewSet.as_view({"get": "series"})
+        self.data_product = DataProductFactory()
+        wavelength = np.linspace(4000, 9000, 5000)
+        ReducedDatumFactory(
+            target=self.data_product.target,
+            data_product=self.data_product,
+            data_type="spectroscopy",
+            value={
+                "wavelength": wavelength.tolist(),
+                "flux": np.sin(wavelength / 100).tolist(),
+                "wavelength_units": "Angstrom",
+                "flux_units": "erg",
+            },
+        )
+        cache.clear()
+
+    def get(self, **params):
+        request = self.factory.get(
+            reverse("reduceddatums-series"),
+            {"data_product": self.data_product.pk, "data_type": "spectroscopy", **params},
+        )
+        force_authenticate(request, user=self.user)
+        return self.view(request)
+
+    def test_series_json(self):
+        """Test the spectrum is downsampled to the width."""
+        response = self.get(width=100)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        (series,) = data["series"]
+        self.assertEqual(series["total"], 5000)
+        self.assertEqual(series["length"], 100)
+        self.assertEqual(len(series["columns"]["wavelength"]), 100)
+        self.assertEqual(series["columns"]["wavelength"][0], 4000)
+        self.assertEqual(series["units"]["flux"], "erg")
+
+    def test_series_binary(self):
+        """Test the binary encoding holds a header and float arrays."""
+        response = self.get(width=100, method="minmax", encoding="binary")
+
+        self.assertEqual(response["Content-Type"], "application/octet-stream")
+        body = response.content
+        (header_length,) = struct.unpack("<I", body[:4])
+        header = json.loads(body[4 : 4 + header_length])
+        (series,) = header["series"]
+        self.assertEqual(series["columns"], ["wavelength", "flux"])
+        arrays = np.frombuffer(body[4 + header_length :], dtype=header["dtype"])
+        self.assertEqual(len(arrays), 2 * series["length"])
+        self.assertLessEqual(series["length"], 200)
+        self.assertEqual(arrays[0], 4000)
+
+    def test_series_cached(self):
+        """Test the series are cached until the reduced data change."""
+        self.get(width=100)
+        with patch("goats_tom.api_views.reduceddatum.build_series") as mock_build:
+            self.get(width=100)
+            mock_build.assert_not_called()
+
+            mock_build.return_value = []
+            ReducedDatumFactory(
+                target=self.data_product.target,
+                data_product=self.data_product,
+                data_type="spectroscopy",
+                value={"wavelength": [1, 2], "flux": [1, 2]},
+            )
+            self.get(width=100)
+            mock_build.assert_called_once()
+
+    def test_series_photometry(self):
+        """Test photometry is split into detections and non-detections per filter."""
+        data_product = DataProductFactory()
+        for time, value in enumerate([{"magnitude": 15}, {"limit": 19}]):
+            ReducedDatumFactory(
+                target=data_product.target,
+                data_product=data_product,
+                value={"filter": "r", "time": 60000 + time, "error": 0.1, **value},
+            )
+        request = self.factory.get(
+            reverse("reduceddatums-series"),
+            {"data_product": data_product.pk, "data_type": "photometry"},
+        )
+        force_authenticate(request, user=self.user)
+        data = json.loads(self.view(request).content)
+
+        detection, non_detection = data["series"]
+        self.assertEqual(detection["name"], "r detection")
+        self.assertEqual(detection["columns"]["magnitude"], [15])
+        self.assertEqual(non_detection["columns"], {"time": [60001], "limit": [19]})
@@ -1,9 +1,13 @@
+import time
 from collections.abc import Iterator
 
 import pytest
 from django.core.exceptions import ValidationError
+from tom_targets.models import Target, TargetName
+from tom_targets.tests.factories import SiderealTargetFactory
 
 from goats_tom.brokers import ANTARESBroker, ANTARESBrokerForm
+from goats_tom.brokers import antares
 
 
 @pytest.mark.django_db()
@@ -70,3 +74,126 @@ def test_fetch_alerts_query_remote():
     parameters = {"query": query}  # Example parameter
     alerts = broker.fetch_alerts(parameters)
     assert isinstance(alerts, Iterator)
+
+
+class FakeLocus:
+    """Locus whose alerts take some time to fetch."""
+
+    def __init__(self, locus_id, delay=0.0, error=None):
+        self.locus_id = locus_id
+        self.ra = 1.0
+        self.dec = 2.0
+        self.properties = {}
+        self.tags = []
+        self.catalogs = []
+        self.delay = delay
+        self.error = error
+
+    @property
+    def alerts(self):
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return []
+
+
+def test_fetch_alerts_query_concurrent(monkeypatch):
+    """Test the alerts of loci are fetched concurrently and in search order."""
+    loci = [FakeLocus(f"ANT{i}", delay=0.2) for i in range(8)]
+    monkeypatch.setattr(antares, "search", lambda query, **kwargs: iter(loci))
+
+    start = time.monotonic()
+    alerts = list(ANTARESBroker().fetch_alerts({"query": {"query": {}}}))
+
+    assert time.monotonic() - start < 1
+    assert [alert["locus_id"] for alert in alerts] == [
+        locus.locus_id for locus in loci
+    ]
+
+
+def test_fetch_alerts_query_max_alerts(monkeypatch):
+    """Test no more than the maximum number of loci are fetched."""
+    loci = (FakeLocus(f"ANT{i}") for i in range(100))
+    monkeypatch.setattr(antares, "search", lambda query, **kwargs: loci)
+
+    alerts = list(ANTARESBroker().fetch_alerts({"query": {"query": {}}}))
+
+    assert len(alerts) == antares.MAX_ALERTS
+
+
+def test_fetch_alerts_query_time_budget(monkeypatch, caplog):
+    """Test loci exceeding the time budget or failing are skipped."""
+    loci = [
+        FakeLocus("ANT1"),
+        FakeLocus("ANT2", delay=2),
+        FakeLocus("ANT3", error=ValueError("Failed")),
+        FakeLocus("ANT4"),
+    ]
+    monkeypatch.setattr(antares, "search", lambda query, **kwargs: iter(loci))
+    monkeypatch.setattr(antares, "FETCH_TIME_BUDGET", 0.5)
+
+    start = time.monotonic()
+    alerts = list(ANTARESBroker().fetch_alerts({"query": {"query": {}}}))
+
+    assert time.monotonic() - start < 1.5
+    assert [alert["locus_id"] for alert in alerts] == ["ANT1", "ANT4"]
+    # Fractional budgets are logged as is.
+    assert "exceeded 0.5 seconds" in caplog.text
+
+
+def make_alert(locus_id, ztf_object_id):
+    return {
+        "locus_id": locus_id,
+        "ra": 1.0,
+        "dec": 2.0,
+        "properties": {
+            "ztf_object_id": ztf_object_id,
+            "newest_alert_observation_time": 60000.0,
+        },
+        "alerts": [{"alert_id": "a", "mjd": 60000.0, "properties": {}}],
+    }
+
+
+@pytest.mark.django_db()
+def test_create_targets():
+    """Test targets are created with their aliases, skipping duplicates."""
+    alerts = [
+        make_alert("ANT1", "ZTF1"),
+        make_alert("ANT2", "ZTF2"),
+        make_alert("ANT3", "ZTF1"),
+    ]
+
+    targets, num_duplicates = ANTARESBroker().create_targets(alerts)
+
+    assert [target.name for target in targets] == ["ZTF1", "ZTF2"]
+    assert all(target.pk for target in targets)
+    assert TargetName.objects.get(name="ANT2").target == targets[1]
+    assert num_duplicates == 1
+
+
+@pytest.mark.django_db()
+def test_create_targets_similar_alias():
+    """Test alerts whose aliases are similar to another target's name are skipped."""
+    SiderealTargetFactory(name="ant-2")
+    alerts = [make_alert("ANT1", "ZTF1"), make_alert("ANT2", "ZTF2")]
+
+    targets, num_duplicates = ANTARESBroker().create_targets(alerts)
+
+    assert [target.name for target in targets] == ["ZTF1"]
+    assert num_duplicates == 1
+    assert not TargetName.objects.filter(name="ANT2").exists()
+
+
+@pytest.mark.django_db()
+def test_create_targets_conflict(monkeypatch):
+    """Test a conflicting batch falls back to creating targets one at a time."""
+    SiderealTargetFactory(name="ZTF2")
+    alerts = [make_alert("ANT1", "ZTF1"), make_alert("ANT2", "ZTF2")]
+    broker = ANTARESBroker()
+    # Pretend the target was created after checking for duplicates.
+    monkeypatch.setattr(ANTARESBroker, "_get_known_names", staticmethod(set))
+
+    targets, num_duplicates = broker.create_targets(alerts)
+    assert [target.name for target in targets] == ["ZTF1"]
+    assert num_duplicates == 1
+    assert Target.objects.filter(name="ZTF1").count() == 1
@@ -0,0 +1,66 @@
+"""Tests for `BufferedWebsocketConsumer`."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from goats_tom.consumers.base import BufferedWebsocketConsumer
+
+
+async def start_consumer(max_buffer_size=1000):
+    """Starts a consumer whose sends only complete once the returned event is set."""
+    consumer = BufferedWebsocketConsumer()
+    consumer.max_buffer_size = max_buffer_size
+    consumer.accept = AsyncMock()
+    consumer.sent = []
+    release = asyncio.Event()
+
+    async def send(text_data):
+        await release.wait()
+        consumer.sent.append(json.loads(text_data))
+
+    consumer.send = send
+    await consumer.start_sending()
+    return consumer, release
+
+
+async def drain(consumer, count):
+    """Waits until the consumer sent the given number of messages."""
+    for _ in range(100):
+        if len(consumer.sent) >= count:
+            return
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio()
+async def test_stale_messages_replaced():
+    """Tests pending messages with the same key are replaced by the newest one."""
+    consumer, release = await start_consumer()
+
+    consumer.queue_json({"progress": 1}, key="reduce")
+    consumer.queue_json({"log": "line"})
+    consumer.queue_json({"progress": 2}, key="reduce")
+    release.set()
+    await drain(consumer, 2)
+
+    assert consumer.sent == [{"log": "line"}, {"progress": 2}]
+    assert consumer.coalesced_messages == 1
+    await consumer.stop_sending()
+
+
+@pytest.mark.asyncio()
+async def test_full_buffer_drops_oldest_unkeyed():
+    """Tests a full buffer drops the oldest message without a key."""
+    consumer, release = await start_consumer(max_buffer_size=2)
+
+    consumer.queue_json({"progress": 1}, key="reduce")
+    consumer.queue_json({"log": 1})
+    consumer.queue_json({"log": 2})
+    release.set()
+    await drain(consumer, 2)
+
+    assert consumer.sent == [{"progress": 1}, {"log": 2}]
+    assert consumer.dropped_messages == 1
+    await consumer.stop_sending()
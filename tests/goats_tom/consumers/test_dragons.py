@@ -1,23 +1,65 @@
 """Tests the `DRAGONSConsumer.`"""
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 from channels.layers import get_channel_layer
+from channels.routing import URLRouter
 from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import AnonymousUser
+from guardian.shortcuts import assign_perm
+from tom_targets.models import Target
+from tom_targets.tests.factories import SiderealTargetFactory
 
 from goats_tom.consumers import DRAGONSConsumer
+from goats_tom.realtime import DRAGONSLogBuffer
+from goats_tom.routing import websocket_urlpatterns
+from goats_tom.tests.factories import (
+    DRAGONSReduceFactory,
+    DRAGONSRunFactory,
+    UserFactory,
+)
+
+USER = SimpleNamespace(pk=1, is_authenticated=True)
+# Kept before the permission check is patched out for the connection tests.
+can_view_run = DRAGONSConsumer.can_view_run
+
+
+@pytest.fixture(autouse=True)
+def mock_can_view_run():
+    """Skips checking the permissions of the user, which requires the database."""
+    with patch.object(DRAGONSConsumer, "can_view_run", return_value=True) as mock:
+        yield mock
+
+
+@pytest.fixture()
+def no_replay_events():
+    """Skips looking up the logs to replay, which requires the database."""
+    with patch.object(DRAGONSConsumer, "get_replay_events", return_value=[]) as mock:
+        yield mock
+
+
+def get_communicator(run_id=1, user=USER):
+    communicator = WebsocketCommunicator(
+        URLRouter(websocket_urlpatterns), f"/ws/dragons/{run_id}/"
+    )
+    communicator.scope["user"] = user
+    return communicator
 
 
 @pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_replay_events")
 async def test_log_message_handling():
     """Tests sending log messages."""
-    communicator = WebsocketCommunicator(DRAGONSConsumer.as_asgi(), "/ws/dragons/")
+    communicator = get_communicator()
     connected, _ = await communicator.connect()
     assert connected, "Connection to WebSocket failed"
 
     # Send a message to the group which the consumer should receive and handle.
     channel_layer = get_channel_layer()
     await channel_layer.group_send(
-        "dragons_group",
+        "dragons_run_1",
         {
             "type": "log.message",
             "message": "Test log message",
@@ -42,16 +84,17 @@ async def test_log_message_handling():
 
 
 @pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_replay_events")
 async def test_recipe_progress_handling():
     """Tests sending recipe progress."""
-    communicator = WebsocketCommunicator(DRAGONSConsumer.as_asgi(), "/ws/dragons/")
+    communicator = get_communicator()
     connected, _ = await communicator.connect()
     assert connected, "Connection to WebSocket failed"
 
     # Send a message to the group which the consumer should receive and handle.
     channel_layer = get_channel_layer()
     await channel_layer.group_send(
-        "dragons_group",
+        "dragons_run_1",
         {
             "type": "recipe.progress.message",
             "status": "done",
@@ -76,12 +119,177 @@ async def test_recipe_progress_handling():
 
 
 @pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_replay_events")
+async def test_publish_progress_handling():
+    """Tests sending the status of a published file."""
+    communicator = get_communicator()
+    connected, _ = await communicator.connect()
+    assert connected, "Connection to WebSocket failed"
+
+    channel_layer = get_channel_layer()
+    await channel_layer.group_send(
+        "dragons_run_1",
+        {
+            "type": "publish.progress.message",
+            "run_id": 1,
+            "product_id": "run/outputs/a.fits",
+            "status": "done",
+            "message": "",
+            "dataproduct_id": 4,
+        },
+    )
+
+    response = await communicator.receive_json_from()
+    assert response == {
+        "update": "publish",
+        "run_id": 1,
+        "product_id": "run/outputs/a.fits",
+        "status": "done",
+        "message": "",
+        "dataproduct_id": 4,
+    }, "Incorrect response received"
+
+    await communicator.disconnect()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_replay_events")
 async def test_no_pending_messages():
     """Tests for pending messages."""
-    communicator = WebsocketCommunicator(DRAGONSConsumer.as_asgi(), "/ws/dragons/")
+    communicator = get_communicator()
     await communicator.connect()
 
     # No messages should be pending
     assert await communicator.receive_nothing() is True, "Unexpected message pending"
 
     await communicator.disconnect()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_replay_events")
+async def test_other_run_messages_not_received():
+    """Tests messages of other runs are not received."""
+    communicator = get_communicator(run_id=1)
+    await communicator.connect()
+
+    channel_layer = get_channel_layer()
+    await channel_layer.group_send(
+        "dragons_run_2",
+        {
+            "type": "recipe.progress.message",
+            "status": "done",
+            "run_id": 2,
+            "recipe_id": 2,
+            "reduce_id": 3,
+        },
+    )
+    assert await communicator.receive_nothing() is True, "Received other run message"
+
+    await communicator.disconnect()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_replay_events")
+async def test_anonymous_user_rejected():
+    """Tests connections without an authenticated user are closed."""
+    communicator = get_communicator(user=AnonymousUser())
+    connected, _ = await communicator.connect()
+    assert not connected, "Anonymous connection should be rejected"
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_replay_events")
+async def test_user_without_permission_rejected(mock_can_view_run):
+    """Tests connections of users that may not view the run are closed."""
+    mock_can_view_run.return_value = False
+    communicator = get_communicator(run_id=1)
+    connected, _ = await communicator.connect()
+    assert not connected, "Connection without permission should be rejected"
+    mock_can_view_run.assert_called_once_with(USER, 1)
+
+
+@pytest.mark.asyncio()
+async def test_replay_buffered_logs(no_replay_events):
+    """Tests buffered logs are replayed on connection."""
+    event = {
+        "type": "log.message",
+        "message": "Earlier log message",
+        "run_id": 1,
+        "recipe_id": 2,
+        "reduce_id": 3,
+    }
+    no_replay_events.return_value = [event]
+
+    communicator = get_communicator(run_id=1)
+    connected, _ = await communicator.connect()
+    assert connected, "Connection to WebSocket failed"
+
+    response = await communicator.receive_json_from()
+    assert response == {
+        "update": "log",
+        "message": "Earlier log message",
+        "run_id": 1,
+        "recipe_id": 2,
+        "reduce_id": 3,
+    }, "Incorrect log replayed"
+    no_replay_events.assert_called_once_with(1)
+
+    await communicator.disconnect()
+
+
+@pytest.mark.asyncio()
+async def test_replayed_logs_not_repeated(no_replay_events):
+    """Tests live logs already replayed are skipped."""
+
+    def make_event(seq):
+        return {
+            "type": "log.message",
+            "message": f"Log {seq}",
+            "run_id": 1,
+            "recipe_id": 2,
+            "reduce_id": 3,
+            "seq": seq,
+        }
+
+    no_replay_events.return_value = [make_event(1), make_event(2)]
+    communicator = get_communicator(run_id=1)
+    await communicator.connect()
+
+    channel_layer = get_channel_layer()
+    for seq in [2, 3]:
+        await channel_layer.group_send("dragons_run_1", make_event(seq))
+
+    messages = [
+        (await communicator.receive_json_from())["message"] for _ in range(3)
+    ]
+    assert messages == ["Log 1", "Log 2", "Log 3"], "Incorrect logs order"
+    assert await communicator.receive_nothing() is True, "Log sent twice"
+
+    await communicator.disconnect()
+
+
+@pytest.mark.django_db()
+def test_get_replay_events():
+    """Tests only the logs of unfinished reductions of the run are replayed."""
+    running = DRAGONSReduceFactory(status="running")
+    done = DRAGONSReduceFactory(recipe=running.recipe, status="done")
+    other_run = DRAGONSReduceFactory(status="running")
+    for reduce in [running, done, other_run]:
+        DRAGONSLogBuffer(reduce.id).append({"message": f"Log of {reduce.id}"})
+
+    events = DRAGONSConsumer.get_replay_events(running.recipe.dragons_run.id)
+
+    assert events == [{"message": f"Log of {running.id}"}], "Incorrect logs replayed"
+
+
+@pytest.mark.django_db()
+def test_can_view_run():
+    """Tests only users that may view the target of the run can view it."""
+    target = SiderealTargetFactory(permissions=Target.Permissions.PRIVATE)
+    dragons_run = DRAGONSRunFactory(observation_record__target_id=target.id)
+    user = UserFactory()
+
+    assert not can_view_run(user, dragons_run.id)
+    assign_perm("tom_targets.view_target", user, target)
+    assert can_view_run(user, dragons_run.id)
+    assert not can_view_run(user, dragons_run.id + 1)
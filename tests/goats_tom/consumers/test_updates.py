@@ -1,16 +1,27 @@
 """Tests for `UpdatesConsumer.`"""
 
+from types import SimpleNamespace
+
 import pytest
 from channels.layers import get_channel_layer
 from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import AnonymousUser
 
 from goats_tom.consumers import UpdatesConsumer
 
+USER = SimpleNamespace(pk=1, is_authenticated=True)
+
+
+def get_communicator(user=USER):
+    communicator = WebsocketCommunicator(UpdatesConsumer.as_asgi(), "/ws/updates/")
+    communicator.scope["user"] = user
+    return communicator
+
 
 @pytest.mark.asyncio()
 async def test_notification_message_handling():
     """Tests sending and receiving notification messages."""
-    communicator = WebsocketCommunicator(UpdatesConsumer.as_asgi(), "/ws/updates/")
+    communicator = get_communicator()
     connected, _ = await communicator.connect()
     assert connected, "Connection to WebSocket failed"
 
@@ -18,7 +29,7 @@ async def test_notification_message_handling():
     # handle.
     channel_layer = get_channel_layer()
     await channel_layer.group_send(
-        "updates_group",
+        "updates_user_1",
         {
             "type": "notification.message",
             "unique_id": "1234",
@@ -45,14 +56,14 @@ async def test_notification_message_handling():
 @pytest.mark.asyncio()
 async def test_download_message_handling():
     """Tests sending and receiving download messages."""
-    communicator = WebsocketCommunicator(UpdatesConsumer.as_asgi(), "/ws/updates/")
+    communicator = get_communicator()
     connected, _ = await communicator.connect()
     assert connected, "Connection to WebSocket failed"
 
     # Send a download message to the group which the consumer should receive and handle.
     channel_layer = get_channel_layer()
     await channel_layer.group_send(
-        "updates_group",
+        "updates_user_1",
         {
             "type": "download.message",
             "unique_id": "5678",
@@ -85,10 +96,42 @@ async def test_download_message_handling():
 @pytest.mark.asyncio()
 async def test_no_pending_messages():
     """Tests for no pending messages."""
-    communicator = WebsocketCommunicator(UpdatesConsumer.as_asgi(), "/ws/updates/")
+    communicator = get_communicator()
     await communicator.connect()
 
     # No messages should be pending.
     assert await communicator.receive_nothing() is True, "Unexpected message pending"
 
     await communicator.disconnect()
+
+
+@pytest.mark.asyncio()
+async def test_broadcast_and_other_user_messages():
+    """Tests broadcast messages are received and other users' messages are not."""
+    communicator = get_communicator()
+    await communicator.connect()
+
+    channel_layer = get_channel_layer()
+    message = {
+        "type": "notification.message",
+        "unique_id": "1234",
+        "color": "red",
+        "label": "Alert",
+        "message": "Test notification message",
+    }
+    await channel_layer.group_send("updates_user_2", message)
+    assert await communicator.receive_nothing() is True, "Received other user message"
+
+    await channel_layer.group_send("updates_group", message)
+    response = await communicator.receive_json_from()
+    assert response["unique_id"] == "1234", "Broadcast message not received"
+
+    await communicator.disconnect()
+
+
+@pytest.mark.asyncio()
+async def test_anonymous_user_rejected():
+    """Tests connections without an authenticated user are closed."""
+    communicator = get_communicator(user=AnonymousUser())
+    connected, _ = await communicator.connect()
+    assert not connected, "Anonymous connection should be rejected"
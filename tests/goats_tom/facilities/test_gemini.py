@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
 import pytest
+from tom_observations.tests.factories import ObservingRecordFactory
+from tom_targets.tests.factories import SiderealTargetFactory
 
 from goats_tom.facilities import GEMObservationForm, GOATSGEMFacility
 
@@ -83,3 +85,47 @@ class TestGOATSGEMFacility:
         ]
         errors = self.facility.validate_observation(invalid_payload)
         assert "exptimes" in errors
+
+    def test_update_all_observation_statuses(self):
+        target = SiderealTargetFactory.create()
+        pending = ObservingRecordFactory.create(
+            target_id=target.id,
+            facility="GEM",
+            observation_id="GS-2023B-Q-102-3",
+            status="READY",
+        )
+        missing = ObservingRecordFactory.create(
+            target_id=target.id,
+            facility="GEM",
+            observation_id="GS-2023B-Q-102-4",
+            status="READY",
+        )
+        terminal = ObservingRecordFactory.create(
+            target_id=target.id,
+            facility="GEM",
+            observation_id="GS-2023B-Q-102-5",
+            status="ON_HOLD",
+        )
+        summaries = {
+            pending.observation_id: {"success": True, "data": {"status": "Observed"}},
+            missing.observation_id: {"success": False, "error": "Missing"},
+        }
+
+        with patch(
+            "goats_tom.facilities.gemini.ocs_client.get_observation_summaries",
+            return_value=summaries,
+        ) as mock_summaries:
+            failed_records = self.facility.update_all_observation_statuses(target)
+
+        mock_summaries.assert_called_once()
+        assert sorted(mock_summaries.call_args.args[0]) == [
+            pending.observation_id,
+            missing.observation_id,
+        ]
+        assert failed_records == []
+        pending.refresh_from_db()
+        missing.refresh_from_db()
+        terminal.refresh_from_db()
+        assert pending.status == "Observed"
+        assert missing.status == "Error"
+        assert terminal.status == "ON_HOLD"
@@ -151,3 +151,22 @@ class TestQExpressionTransformer(TestCase):
                 # Verify the key and the exact value
                 self.assertEqual(condition_key, expected_key)
                 self.assertEqual(condition_value, value, f"Expected {expected_key} with value {value} not found in Q object")
+
+    def test_indexed_descriptors_use_columns(self):
+        transformer = _QExpressionTransformer(
+            strict=False, indexed_descriptors=["exposure_time", "filter_name"]
+        )
+
+        node = ast.parse("exposure_time == 10 and filter_name == 'g'", mode='eval').body
+        q_object = transformer.visit(node)
+
+        self.assertEqual(
+            q_object,
+            Q(exposure_time__gte=9.9, exposure_time__lte=10.1)
+            & Q(filter_name__icontains="g"),
+        )
+
+        node = ast.parse("airmass > 1.2", mode='eval').body
+        self.assertEqual(
+            transformer.visit(node), Q(astrodata_descriptors__airmass__gt=1.2)
+        )
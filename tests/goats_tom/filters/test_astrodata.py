@@ -2,10 +2,15 @@ from django.db.models import Q
 from django.test import TestCase
 
 from goats_tom.filters.astrodata import AstrodataFilter
+from goats_tom.models import DRAGONSFile, DRAGONSRun
+from goats_tom.tests.factories import DRAGONSFileFactory
 
 
 class TestAstrodataFilter(TestCase):
 
+    def setUp(self):
+        AstrodataFilter.clear_cache()
+
     def test_empty_expression(self):
         """Test that an empty expression returns a Q object that matches everything."""
         q_object = AstrodataFilter.parse('')
@@ -63,9 +68,10 @@ class TestAstrodataFilter(TestCase):
         expression = "central_wavelength == 500.7"
         q_object = AstrodataFilter.parse(expression, strict=False)
         self.assertIsInstance(q_object, Q)
-        # Check for greater than or equal and less than or equal conditions
-        self.assertIn("astrodata_descriptors__central_wavelength__gte", str(q_object))
-        self.assertIn("astrodata_descriptors__central_wavelength__lte", str(q_object))
+        # Check for greater than or equal and less than or equal conditions on the
+        # indexed column.
+        self.assertIn("'central_wavelength__gte'", str(q_object))
+        self.assertIn("'central_wavelength__lte'", str(q_object))
 
     def test_partial_string_matching(self):
         """Test that __icontains is used for string comparison when strict mode is false."""
@@ -73,4 +79,60 @@ class TestAstrodataFilter(TestCase):
         q_object = AstrodataFilter.parse(expression, strict=False)
         self.assertIsInstance(q_object, Q)
         # Check for icontains used in the Q object, which allows partial matching
-        self.assertIn("astrodata_descriptors__filter_name__icontains", str(q_object))
+        self.assertIn("'filter_name__icontains'", str(q_object))
+
+    def test_non_indexed_descriptor_uses_json_lookup(self):
+        """Test that descriptors without a column are looked up in the JSON field."""
+        q_object = AstrodataFilter.parse("airmass < 1.5")
+        self.assertEqual(q_object, Q(astrodata_descriptors__airmass__lt=1.5))
+
+    def test_indexed_descriptor_uses_column(self):
+        """Test that indexed descriptors are looked up in their columns."""
+        q_object = AstrodataFilter.parse("exposure_time < 1.5")
+        self.assertEqual(q_object, Q(exposure_time__lt=1.5))
+
+    def test_compiled_expression_cached(self):
+        """Test that the same expression and strictness reuse the compiled Q object."""
+        expression = "exposure_time == 10 and filter_name == 'g'"
+        q_object = AstrodataFilter.parse(expression)
+        self.assertIs(AstrodataFilter.parse(f"  {expression} "), q_object)
+        self.assertIsNot(AstrodataFilter.parse(expression, strict=True), q_object)
+
+    def test_explain(self):
+        """Test explaining an expression reports the SQL and timing."""
+        DRAGONSFileFactory(astrodata_descriptors={"exposure_time": 10.0})
+        DRAGONSFileFactory(astrodata_descriptors={"exposure_time": 30.0})
+
+        result = AstrodataFilter.explain(
+            "exposure_time > 15", DRAGONSFile.objects.all()
+        )
+
+        self.assertTrue(result["valid"])
+        self.assertFalse(result["cached"])
+        self.assertEqual(result["count"], 1)
+        self.assertIn("exposure_time", result["sql"])
+        self.assertIn("plan", result)
+        self.assertGreaterEqual(result["query_time_ms"], 0)
+
+        result = AstrodataFilter.explain(
+            "exposure_time > 15", DRAGONSFile.objects.all()
+        )
+        self.assertTrue(result["cached"])
+
+    def test_explain_invalid_expression(self):
+        """Test explaining an invalid expression reports an error."""
+        result = AstrodataFilter.explain("name = 'Hubble'", DRAGONSFile.objects.all())
+
+        self.assertFalse(result["valid"])
+        self.assertIn("error", result)
+        self.assertNotIn("sql", result)
+
+    def test_explain_lookup_not_applicable(self):
+        """Test explaining an expression that fails to apply reports an error."""
+        result = AstrodataFilter.explain(
+            "exposure_time > 15", DRAGONSRun.objects.all()
+        )
+
+        self.assertFalse(result["valid"])
+        self.assertIn("error", result)
+        self.assertNotIn("sql", result)
@@ -4,20 +4,20 @@ import logging
 from unittest import TestCase, mock
 
 from goats_tom.logging_extensions.handlers import DRAGONSHandler
+from goats_tom.realtime import DRAGONSLogBuffer
 
 
 class TestDRAGONSHandler(TestCase):
     """Test DRAGONS logging handler."""
 
     def setUp(self):
-        # Patch the get_channel_layer to return a mock.
+        # Patch the get_publisher to return a mock.
         self.patcher = mock.patch(
-            "goats_tom.logging_extensions.handlers.dragons.get_channel_layer",
+            "goats_tom.logging_extensions.handlers.dragons.get_publisher",
         )
-        self.mock_get_channel_layer = self.patcher.start()
-        self.mock_channel_layer = mock.Mock()
-        self.mock_get_channel_layer.return_value = self.mock_channel_layer
-        self.mock_channel_layer.group_send = mock.AsyncMock()
+        self.mock_get_publisher = self.patcher.start()
+        self.mock_publisher = mock.Mock()
+        self.mock_get_publisher.return_value = self.mock_publisher
 
         # Create an instance of the handler.
         self.handler = DRAGONSHandler(recipe_id=123, reduce_id=456, run_id=789)
@@ -27,11 +27,11 @@ class TestDRAGONSHandler(TestCase):
 
     def test_initialization(self):
         """Test that the handler initializes with correct recipe and reduce IDs and a
-        channel layer.
+        publisher.
         """
         self.assertEqual(self.handler.recipe_id, 123)
         self.assertEqual(self.handler.reduce_id, 456)
-        self.assertIsNotNone(self.handler.channel_layer)
+        self.assertIsNotNone(self.handler.publisher)
 
     def test_emit(self):
         """Test that the emit method sends the correct message format and data."""
@@ -54,15 +54,23 @@ class TestDRAGONSHandler(TestCase):
             "recipe_id": 123,
             "reduce_id": 456,
             "run_id": 789,
+            "seq": 1,
         }
-        self.mock_channel_layer.group_send.assert_called_once_with(
-            "dragons_group", expected_message,
+        self.mock_publisher.publish.assert_called_once_with(
+            "dragons_run_789", expected_message,
         )
+        self.assertEqual(DRAGONSLogBuffer.get_many([456]), [expected_message])
+
+        # Later messages are numbered and written to the buffer when closing.
+        self.handler.emit(log_record)
+        self.assertEqual(self.mock_publisher.publish.call_args.args[1]["seq"], 2)
+        self.handler.close()
+        self.assertEqual(len(DRAGONSLogBuffer.get_many([456])), 2)
 
     def test_emit_with_failure(self):
-        """Test behavior when channel layer fails to send a message."""
-        self.mock_channel_layer.group_send.side_effect = Exception(
-            "Channel layer error",
+        """Test behavior when the publisher fails to queue a message."""
+        self.mock_publisher.publish.side_effect = Exception(
+            "Publisher error",
         )
         log_record = logging.LogRecord(
             name="test_failure",
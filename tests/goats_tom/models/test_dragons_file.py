@@ -45,3 +45,28 @@ class TestDRAGONSFile:
         assert help_return, "The dictionary should not be empty."
         assert "ADUToElectrons" in help_return, "The dictionary should contain the 'ADUToElectrons' key."
         assert "docstring" in help_return["ADUToElectrons"], "The 'ADUToElectrons' entry should contain a 'docstring' key."
+
+    def test_indexed_descriptors_synced_on_save(self):
+        """Test the indexed descriptor columns are copied from the descriptors."""
+        dragons_file = DRAGONSFileFactory(
+            astrodata_descriptors={
+                "exposure_time": 30,
+                "filter_name": "g_G0301",
+                "ut_date": "2024-01-02",
+                "central_wavelength": "not a number",
+            }
+        )
+        dragons_file.refresh_from_db()
+
+        assert dragons_file.exposure_time == 30.0
+        assert dragons_file.filter_name == "g_G0301"
+        assert dragons_file.ut_date == "2024-01-02"
+        assert dragons_file.central_wavelength is None
+        assert dragons_file.binning is None
+
+        dragons_file.astrodata_descriptors = {"exposure_time": 5.5}
+        dragons_file.save()
+        dragons_file.refresh_from_db()
+
+        assert dragons_file.exposure_time == 5.5
+        assert dragons_file.filter_name is None
@@ -1,12 +1,24 @@
+from unittest.mock import patch
+
 import pytest
 from django.core.exceptions import ValidationError
 from tom_observations.tests.factories import ObservingRecordFactory
 
+from goats_tom.models import DRAGONSRun
 from goats_tom.tests.factories import (
+    DRAGONSFileFactory,
+    DRAGONSRecipeFactory,
+    DRAGONSReduceFactory,
     DRAGONSRunFactory,
 )
 
 
+def _get_data_version(dragons_run):
+    return DRAGONSRun.objects.values_list("data_version", flat=True).get(
+        pk=dragons_run.pk
+    )
+
+
 @pytest.mark.django_db()
 class TestDRAGONSRun:
     def test_automatic_run_id_generation(self):
@@ -36,3 +48,90 @@ class TestDRAGONSRun:
                 observation_record=observation_record, run_id=run_id,
             )
             duplicate_run.full_clean()
+
+    def test_data_etag(self):
+        """Test the entity tag is built from the primary key and data version."""
+        dragons_run = DRAGONSRunFactory()
+        assert dragons_run.get_data_etag() == (
+            f'"{dragons_run.pk}-{dragons_run.data_version}"'
+        )
+
+    def test_data_version_bumped_on_file_changes(self):
+        """Test creating, updating and deleting files bumps the data version."""
+        dragons_run = DRAGONSRunFactory()
+        version = _get_data_version(dragons_run)
+
+        dragons_file = DRAGONSFileFactory(dragons_run=dragons_run)
+        assert _get_data_version(dragons_run) != version
+        version = _get_data_version(dragons_run)
+
+        dragons_file.delete()
+        assert _get_data_version(dragons_run) != version
+
+    def test_data_version_bumped_on_recipe_and_reduce_changes(self):
+        """Test changing recipes and reductions bumps the data version."""
+        dragons_run = DRAGONSRunFactory()
+        recipe = DRAGONSRecipeFactory(dragons_run=dragons_run)
+        version = _get_data_version(dragons_run)
+
+        recipe.save()
+        assert _get_data_version(dragons_run) != version
+        version = _get_data_version(dragons_run)
+
+        DRAGONSReduceFactory(recipe=recipe)
+        assert _get_data_version(dragons_run) != version
+
+    def test_data_version_not_shared_between_runs(self):
+        """Test changes to one run leave the data version of others untouched."""
+        dragons_run = DRAGONSRunFactory()
+        other_run = DRAGONSRunFactory()
+        version = _get_data_version(other_run)
+
+        DRAGONSFileFactory(dragons_run=dragons_run)
+
+        assert _get_data_version(other_run) == version
+
+    def test_read_log(self, tmp_path):
+        """Test reading the log from an offset and from the end."""
+        log_file = tmp_path / "log.log"
+        log_file.write_bytes(b"first\nsecond\nthird\n")
+        dragons_run = DRAGONSRunFactory()
+
+        with patch.object(DRAGONSRun, "get_log_file", return_value=log_file):
+            head = dragons_run.read_log(offset=0, max_bytes=6)
+            rest = dragons_run.read_log(offset=head["next_offset"])
+            tail = dragons_run.read_log(max_bytes=8)
+
+        assert head == {"offset": 0, "next_offset": 6, "size": 19, "content": "first\n"}
+        assert rest["content"] == "second\nthird\n"
+        assert rest["next_offset"] == 19
+        # The tail starts at the first full line.
+        assert tail == {"offset": 13, "next_offset": 19, "size": 19, "content": "third\n"}
+
+    def test_read_log_full_lines(self, tmp_path):
+        """Test reads stop at the last full line, not within a character."""
+        log_file = tmp_path / "log.log"
+        log_file.write_bytes("ab\nc\u00e9d\n".encode())
+        dragons_run = DRAGONSRunFactory()
+
+        with patch.object(DRAGONSRun, "get_log_file", return_value=log_file):
+            head = dragons_run.read_log(offset=0, max_bytes=5)
+            rest = dragons_run.read_log(offset=head["next_offset"], max_bytes=5)
+
+        assert head["content"] == "ab\n"
+        assert head["next_offset"] == 3
+        assert rest["content"] == "c\u00e9d\n"
+
+    def test_read_missing_log(self, tmp_path):
+        """Test reading a log that was not written yet."""
+        dragons_run = DRAGONSRunFactory()
+
+        with patch.object(
+            DRAGONSRun, "get_log_file", return_value=tmp_path / "missing.log"
+        ):
+            assert dragons_run.read_log(offset=10) == {
+                "offset": 0,
+                "next_offset": 0,
+                "size": 0,
+                "content": "",
+            }
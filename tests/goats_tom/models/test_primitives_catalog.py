@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+import pytest
+
+from goats_tom.models import PrimitivesCatalog
+from goats_tom.tests.factories import (
+    DRAGONSFileFactory,
+    DRAGONSRecipeFactory,
+    PrimitivesCatalogFactory,
+)
+
+TAGS = {"GMOS", "BIAS", "RAW"}
+PRIMITIVES = {"biasCorrect": {"params": {}, "docstring": {}}}
+
+
+@pytest.mark.django_db()
+class TestPrimitivesCatalog:
+    """Class to test `PrimitivesCatalog` model."""
+
+    def test_hash_tags_order_independent(self):
+        """Test the hash does not depend on the order of the tags."""
+        assert PrimitivesCatalog.hash_tags(["A", "B"]) == PrimitivesCatalog.hash_tags(
+            {"B", "A"}
+        )
+        assert PrimitivesCatalog.hash_tags(["A"]) != PrimitivesCatalog.hash_tags(["B"])
+
+    def test_lookup(self):
+        """Test finding a catalog by instrument, version and tags."""
+        catalog = PrimitivesCatalogFactory(version="3.2.0")
+
+        assert PrimitivesCatalog.lookup("GMOS", "3.2.0", catalog.tags) == catalog
+        assert PrimitivesCatalog.lookup("GMOS", "3.1.0", catalog.tags) is None
+        assert PrimitivesCatalog.lookup("GMOS", "3.2.0", ["OTHER"]) is None
+
+    @patch(
+        "goats_tom.models.primitives_catalog.build_primitives_help",
+        return_value=(PRIMITIVES, TAGS),
+    )
+    def test_build_reuses_existing(self, mock_build):
+        """Test building a catalog for known tags returns the stored one."""
+        first = PrimitivesCatalog.build("file.fits", "GMOS", "3.2.0")
+        second = PrimitivesCatalog.build("other.fits", "GMOS", "3.2.0")
+
+        assert first == second
+        assert first.tags == sorted(TAGS)
+        assert first.primitives == PRIMITIVES
+        assert PrimitivesCatalog.objects.count() == 1
+
+    def test_file_uses_linked_catalog(self):
+        """Test a file with a catalog serves it without building one."""
+        catalog = PrimitivesCatalogFactory()
+        dragons_file = DRAGONSFileFactory(primitives_catalog=catalog)
+
+        with patch(
+            "goats_tom.models.primitives_catalog.build_primitives_help"
+        ) as mock_build:
+            assert dragons_file.list_primitives_and_docstrings() == catalog.primitives
+        mock_build.assert_not_called()
+
+    @patch(
+        "goats_tom.models.primitives_catalog.build_primitives_help",
+        return_value=(PRIMITIVES, TAGS),
+    )
+    def test_file_builds_and_links_catalog(self, mock_build):
+        """Test a file without a catalog builds it once and links it."""
+        dragons_file = DRAGONSFileFactory()
+
+        assert dragons_file.list_primitives_and_docstrings() == PRIMITIVES
+        dragons_file.refresh_from_db()
+        assert dragons_file.primitives_catalog.version == dragons_file.dragons_run.version
+        assert (
+            dragons_file.primitives_catalog.instrument
+            == dragons_file.recipes_module.instrument
+        )
+
+        assert dragons_file.list_primitives_and_docstrings() == PRIMITIVES
+        mock_build.assert_called_once()
+
+    def test_recipe_prefers_file_with_catalog(self):
+        """Test a recipe serves the catalog of a matching file."""
+        catalog = PrimitivesCatalogFactory()
+        recipe = DRAGONSRecipeFactory(observation_type="BIAS")
+        DRAGONSFileFactory(
+            recipes_module=recipe.recipe.recipes_module, observation_type="BIAS"
+        )
+        DRAGONSFileFactory(
+            recipes_module=recipe.recipe.recipes_module,
+            observation_type="BIAS",
+            primitives_catalog=catalog,
+        )
+
+        with patch(
+            "goats_tom.models.primitives_catalog.build_primitives_help"
+        ) as mock_build:
+            assert recipe.list_primitives_and_docstrings() == catalog.primitives
+        mock_build.assert_not_called()
@@ -0,0 +1,83 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from tom_dataproducts.models import ReducedDatum
+
+from goats_tom.models import ReducedDatumHash
+from goats_tom.tests.factories import ReducedDatumFactory
+
+VALUE = {"magnitude": 15.582, "filter": "r", "error": 0.005}
+
+
+@pytest.mark.django_db()
+class TestReducedDatumHash:
+    """Class to test `ReducedDatumHash` model."""
+
+    def test_hash_value_key_order_independent(self):
+        """Test the hash does not depend on the order of the keys."""
+        assert ReducedDatumHash.hash_value(
+            {"a": 1, "b": 2}
+        ) == ReducedDatumHash.hash_value({"b": 2, "a": 1})
+        assert ReducedDatumHash.hash_value({"a": 1}) != ReducedDatumHash.hash_value(
+            {"a": 2}
+        )
+
+    def test_hash_stored_on_save(self):
+        """Test saving a reduced datum stores its hash."""
+        reduced_datum = ReducedDatumFactory(value=VALUE)
+
+        content_hash = ReducedDatumHash.objects.get(reduced_datum=reduced_datum)
+        assert content_hash.target_id == reduced_datum.target_id
+        assert content_hash.data_type == "photometry"
+        assert content_hash.value_hash == ReducedDatumHash.hash_value(VALUE)
+
+    def test_find_existing(self):
+        """Test finding stored hashes for a target and data type."""
+        reduced_datum = ReducedDatumFactory(value=VALUE)
+        value_hash = ReducedDatumHash.hash_value(VALUE)
+        other_hash = ReducedDatumHash.hash_value({"magnitude": 16})
+
+        assert ReducedDatumHash.find_existing(
+            reduced_datum.target, "photometry", [value_hash, other_hash]
+        ) == {value_hash}
+        assert not ReducedDatumHash.find_existing(
+            reduced_datum.target, "spectroscopy", [value_hash]
+        )
+
+    def test_hash_not_rebuilt_on_update(self):
+        """Test saving an existing reduced datum does not hash it again."""
+        reduced_datum = ReducedDatumFactory(value=VALUE)
+
+        with patch.object(ReducedDatumHash, "from_reduced_datum") as mock_hash:
+            reduced_datum.save()
+
+        mock_hash.assert_not_called()
+
+    def test_create_missing(self):
+        """Test data bulk created without a hash are hashed by the command."""
+        reduced_datum = ReducedDatumFactory(value=VALUE)
+        ReducedDatum.objects.bulk_create(
+            [
+                ReducedDatum(
+                    target=reduced_datum.target,
+                    data_type="photometry",
+                    value={"magnitude": 16},
+                )
+            ]
+        )
+        value_hashes = [
+            ReducedDatumHash.hash_value(VALUE),
+            ReducedDatumHash.hash_value({"magnitude": 16}),
+        ]
+        assert ReducedDatumHash.find_existing(
+            reduced_datum.target, "photometry", value_hashes
+        ) == {value_hashes[0]}
+
+        call_command("hash_reduced_data", stdout=StringIO())
+
+        assert ReducedDatumHash.find_existing(
+            reduced_datum.target, "photometry", value_hashes
+        ) == set(value_hashes)
+        assert ReducedDatumHash.objects.count() == 2
@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -69,6 +71,68 @@ def test_get_observation_summary(client, odb_xml, observation_id, mocker):
     assert isinstance(result, dict)
     assert result["success"]
 
+
+def test_get_observation_summaries(client, odb_xml, mocker):
+    mock_send = mocker.patch.object(client, "_send_request", side_effect=lambda _: {"success": True, "raw_data": odb_xml})
+
+    result = client.get_observation_summaries(
+        ["GS-2023B-Q-102-3", "GS-2023B-Q-102-6", "GS-2023B-Q-102-99", "invalid"]
+    )
+
+    # Observations of the same program share a single fetch.
+    mock_send.assert_called_once_with("GS-2023B-Q-102")
+    assert result["GS-2023B-Q-102-3"]["data"]["status"] == "Observed"
+    assert result["GS-2023B-Q-102-6"]["data"]["status"] == "Inactive"
+    assert not result["GS-2023B-Q-102-99"]["success"]
+    assert not result["invalid"]["success"]
+
+    # The program summary is reused until it expires.
+    client.get_observation_summaries(["GS-2023B-Q-102-3"])
+    assert mock_send.call_count == 1
+    client.program_cache_timeout = 0
+    client.get_observation_summaries(["GS-2023B-Q-102-3"])
+    assert mock_send.call_count == 2
+
+
+def test_get_observation_summaries_failure(client, mocker):
+    mock_send = mocker.patch.object(client, "_send_request", return_value={"success": False, "error": "Timeout"})
+
+    result = client.get_observation_summaries(["GS-2023B-Q-102-3", "GN-2024A-Q-1-1"])
+
+    assert mock_send.call_count == 2
+    assert result["GS-2023B-Q-102-3"] == {"success": False, "error": "Timeout"}
+    # Failed fetches aren't cached.
+    client.get_observation_summaries(["GS-2023B-Q-102-3"])
+    assert mock_send.call_count == 3
+
+
+def test_get_cached_program_concurrent(client, odb_xml, mocker):
+    release = threading.Event()
+
+    def send_request(program_id):
+        release.wait(5)
+        return {"success": True, "raw_data": odb_xml}
+
+    mock_send = mocker.patch.object(client, "_send_request", side_effect=send_request)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(client._get_cached_program, "GS-2023B-Q-102")
+            for _ in range(2)
+        ]
+        release.set()
+        results = [future.result() for future in futures]
+
+    # Concurrent calls wait for a single fetch, and the lock is dropped afterwards.
+    mock_send.assert_called_once_with("GS-2023B-Q-102")
+    assert all(result["success"] for result in results)
+    assert client._program_locks == {}
+
+
+def test_get_session_reused(client):
+    assert client._get_session("GS") is client._get_session("GS")
+    assert client._get_session("GS") is not client._get_session("GN")
+
 @pytest.mark.remote_data()
 def test_get_coordinates_remote(client, observation_id):
     coordinates_response = client.get_coordinates(observation_id)
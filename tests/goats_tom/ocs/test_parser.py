@@ -47,3 +47,44 @@ def test_parse_sequence_response(ocs_parser, sequence_xml):
     result = ocs_parser.parse_sequence_response(sequence_xml)
     assert isinstance(result, dict)
     assert result
+
+
+def test_parse_odb_response_observation_ids(ocs_parser, odb_xml):
+    result = ocs_parser.parse_odb_response(
+        odb_xml, observation_ids=["GS-2023B-Q-102-6"], fields=["observations"]
+    )
+    assert list(result) == ["observations"]
+    observation = result["observations"]["observation"]
+    assert observation["id"] == "GS-2023B-Q-102-6"
+    assert observation["status"] == "Inactive"
+
+
+def test_parse_odb_response_fields(ocs_parser, odb_xml):
+    result = ocs_parser.parse_odb_response(odb_xml, fields=["reference", "partners"])
+    assert result == {
+        "reference": "GS-2023B-Q-102",
+        "partners": {
+            "partner": {"name": "Brazil", "hoursAllocated": "3.7222222222222223"}
+        },
+    }
+
+
+def test_parse_odb_response_all_observations(ocs_parser, odb_xml):
+    result = ocs_parser.parse_odb_response(odb_xml)
+    observations = result["observations"]["observation"]
+    assert [observation["id"] for observation in observations][:2] == [
+        "GS-2023B-Q-102-3",
+        "GS-2023B-Q-102-4",
+    ]
+    assert result["reference"] == "GS-2023B-Q-102"
+
+
+def test_parse_odb_response_without_program(ocs_parser):
+    assert ocs_parser.parse_odb_response("<queryResult><programs/></queryResult>") == {}
+
+
+def test_parse_sequence_response_systems(ocs_parser, sequence_xml):
+    result = ocs_parser.parse_sequence_response(sequence_xml, systems=["observe"])
+    assert result["version"] == "0.1"
+    assert list(result["steps"]["step 1"]) == ["observe"]
+    assert result["steps"]["step 1"]["observe"]["dataLabel"] == "GS-2023B-Q-102-3-001"
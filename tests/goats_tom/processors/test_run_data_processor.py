@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from tom_dataproducts.models import ReducedDatum
+
+from goats_tom.models import ReducedDatumHash
+from goats_tom.processors import run_data_processor
+from goats_tom.tests.factories import DataProductFactory, ReducedDatumFactory
+
+TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeProcessor:
+    """Processor that returns the data it was created with."""
+
+    data = []
+
+    def process_data(self, dp):
+        return self.data
+
+    def data_type_override(self):
+        return None
+
+
+@pytest.fixture()
+def processor():
+    """Patches the processor imported by `run_data_processor`."""
+    with patch(
+        "goats_tom.processors.run_data_processor.import_module",
+        return_value=SimpleNamespace(PhotometryProcessor=FakeProcessor),
+    ):
+        yield FakeProcessor
+
+
+@pytest.mark.django_db()
+def test_run_data_processor_skips_duplicates(processor):
+    """Test values already stored for the target are skipped and new ones hashed."""
+    dp = DataProductFactory(data_product_type="photometry")
+    ReducedDatumFactory(target=dp.target, value={"magnitude": 15, "filter": "r"})
+    processor.data = [
+        (TIMESTAMP, {"filter": "r", "magnitude": 15}, "source"),
+        (TIMESTAMP, {"filter": "r", "magnitude": 16}, "source"),
+    ]
+
+    reduced_data = run_data_processor(dp)
+
+    assert [rd.value for rd in reduced_data] == [{"filter": "r", "magnitude": 16}]
+    assert ReducedDatum.objects.filter(target=dp.target).count() == 2
+    assert ReducedDatumHash.objects.filter(target=dp.target).count() == 2
+
+    # Running again adds nothing.
+    run_data_processor(dp)
+    assert ReducedDatum.objects.filter(target=dp.target).count() == 2
@@ -1,13 +1,16 @@
 import shutil
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from astropy.io import fits
 from django.conf import settings
 from django.test import TestCase
 from specutils import Spectrum1D
+from tom_observations.facility import get_service_classes
 
 from goats_tom.processors import SpectroscopyProcessor
+from goats_tom.processors.spectroscopy_processor import get_fits_facilities
 from goats_tom.tests.factories import DataProductFactory
 
 
@@ -48,3 +51,33 @@ class TestSpectroscopyProcessor(TestCase):
         # Validate the flux unit.
         if expected_flux_unit:
             self.assertEqual(spectrum.flux.unit.to_string(), expected_flux_unit, "Flux unit mismatch.")
+
+    def test_process_data_multiple_spectra(self):
+        """Test `process_data` returns one spectrum per science extension."""
+        with fits.open(self.test_fits_path) as hdul:
+            second_sci = hdul["SCI"].copy()
+            second_sci.data = second_sci.data * 2
+            second_sci.ver = 2
+            hdul.append(second_sci)
+            mef_path = Path(settings.MEDIA_ROOT) / "S20210219S0075_2_1D.fits"
+            hdul.writeto(mef_path, overwrite=True)
+        data_product = DataProductFactory(data=str(mef_path))
+
+        data = self.processor.process_data(data_product)
+
+        self.assertEqual(len(data), 2)
+        first, second = (datum[1] for datum in data)
+        self.assertEqual(data[0][0], data[1][0])
+        self.assertEqual(second["flux"][10], first["flux"][10] * 2)
+
+    def test_fits_facilities_instantiated_once(self):
+        """Test the facilities used for detection are only instantiated once."""
+        get_fits_facilities.cache_clear()
+        with patch(
+            "goats_tom.processors.spectroscopy_processor.get_service_classes",
+            wraps=get_service_classes,
+        ) as mock_get_service_classes:
+            self.processor._process_spectrum_from_fits(self.data_product)
+            self.processor._process_spectrum_from_fits(self.data_product)
+
+        mock_get_service_classes.assert_called_once()
@@ -0,0 +1,41 @@
+"""Tests for `CoalescingBuffer`."""
+
+import pytest
+
+from goats_tom.realtime import CoalescingBuffer
+
+
+def test_keyed_messages_coalesced():
+    """Tests a message replaces the pending message with the same key."""
+    buffer = CoalescingBuffer(max_size=10)
+    buffer.put("progress 1", key="download")
+    buffer.put("log")
+    buffer.put("progress 2", key="download")
+
+    assert len(buffer) == 2
+    assert buffer.pop() == "log"
+    assert buffer.pop() == "progress 2"
+    assert buffer.coalesced == 1
+
+
+def test_full_buffer_drops_oldest_unkeyed():
+    """Tests the oldest message without a key is dropped when full."""
+    buffer = CoalescingBuffer(max_size=2)
+    buffer.put("progress", key="download")
+    buffer.put("log 1")
+    buffer.put("log 2")
+
+    assert [buffer.pop(), buffer.pop()] == ["progress", "log 2"]
+    assert buffer.dropped == 1
+
+
+def test_full_buffer_of_keyed_messages():
+    """Tests the oldest message is dropped when all messages have keys."""
+    buffer = CoalescingBuffer(max_size=1)
+    buffer.put("first", key=1)
+    buffer.put("second", key=2)
+
+    assert buffer.pop() == "second"
+    assert buffer.dropped == 1
+    with pytest.raises(KeyError):
+        buffer.pop()
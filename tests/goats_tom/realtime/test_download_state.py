@@ -97,3 +97,9 @@ def test_download_state_complete():
         ), "Message not updated correctly during completion"
         assert download_state.done, "Done flag should be True during completion"
         assert not download_state.error, "Error flag should be False during completion"
+
+
+def test_download_state_group_name():
+    """Tests downloads are sent to the group of the user."""
+    assert DownloadState().group_name == "updates_group"
+    assert DownloadState(user_id=3).group_name == "updates_user_3"
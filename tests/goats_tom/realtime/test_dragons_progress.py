@@ -28,3 +28,13 @@ def test_dragons_progress():
         assert run_id == reduce.recipe.dragons_run.id, "Run ID mismatch"
         assert recipe_id == reduce.recipe.id, "Recipe ID mismatch"
         assert reduce_id == reduce.id, "Reduce ID mismatch"
+
+
+def test_dragons_progress_run_group():
+    """Tests progress updates are sent to the group of the run."""
+    with patch("goats_tom.realtime.dragons_progress.get_publisher") as mock_publisher:
+        DRAGONSProgress._send("done", 7, 2, 3)
+
+    args, kwargs = mock_publisher.return_value.publish.call_args
+    assert args[0] == "dragons_run_7", "Group name mismatch"
+    assert kwargs["key"] == ("recipe", 3), "Progress should be coalesced per reduce"
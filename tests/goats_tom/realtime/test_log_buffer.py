@@ -0,0 +1,73 @@
+"""Tests for `DRAGONSLogBuffer`."""
+
+import time
+from unittest.mock import patch
+
+from goats_tom.realtime import DRAGONSLogBuffer
+from goats_tom.realtime import log_buffer as log_buffer_module
+
+
+def test_log_buffer_keeps_latest():
+    """Tests the buffer keeps only the latest messages."""
+    log_buffer = DRAGONSLogBuffer(1, size=2)
+    for i in range(3):
+        log_buffer.append({"message": f"line {i}"})
+    log_buffer.flush()
+
+    assert DRAGONSLogBuffer.get_many([1]) == [
+        {"message": "line 1"},
+        {"message": "line 2"},
+    ], "Incorrect buffered messages"
+
+
+def test_log_buffer_get_many():
+    """Tests reading the buffers of several reductions."""
+    DRAGONSLogBuffer(2).append({"message": "first"})
+    DRAGONSLogBuffer(3).append({"message": "second"})
+
+    messages = DRAGONSLogBuffer.get_many([3, 2, 4])
+
+    assert messages == [{"message": "second"}, {"message": "first"}]
+
+
+def test_log_buffer_reset():
+    """Tests a new buffer for a reduction discards previous messages."""
+    DRAGONSLogBuffer(5).append({"message": "old"})
+    DRAGONSLogBuffer(5)
+
+    assert DRAGONSLogBuffer.get_many([5]) == []
+
+
+def test_log_buffer_flush_interval():
+    """Tests messages appended within the flush interval are written once it ends."""
+    log_buffer = DRAGONSLogBuffer(1006)
+    with patch.object(log_buffer_module, "LOG_FLUSH_INTERVAL", 0.2):
+        log_buffer.append({"message": "first"})
+        log_buffer.append({"message": "second"})
+
+        # The first message is written at once, the second waits for the interval.
+        assert DRAGONSLogBuffer.get_many([1006]) == [{"message": "first"}]
+
+        # The second message is written without another append or a flush.
+        deadline = time.monotonic() + 5
+        while len(DRAGONSLogBuffer.get_many([1006])) < 2:
+            assert time.monotonic() < deadline, "Pending message was not written"
+            time.sleep(0.01)
+
+    assert DRAGONSLogBuffer.get_many([1006]) == [
+        {"message": "first"},
+        {"message": "second"},
+    ]
+
+
+def test_log_buffer_flush_pending():
+    """Tests flushing writes pending messages at once and cancels the timer."""
+    log_buffer = DRAGONSLogBuffer(1007)
+    log_buffer.append({"message": "first"})
+    log_buffer.append({"message": "second"})
+    assert log_buffer._timer is not None
+
+    log_buffer.flush()
+
+    assert log_buffer._timer is None
+    assert len(DRAGONSLogBuffer.get_many([1007])) == 2
@@ -15,10 +15,20 @@ def test_notification_instance():
 
         # Verify that _send was called with the correct parameters.
         mock_send.assert_called_once()
-        args, _ = mock_send.call_args
+        args, kwargs = mock_send.call_args
         unique_id, label, message, color = args
 
         assert label == "Alert", "Label not set correctly"
         assert message == "Test notification", "Message not set correctly"
         assert color == "warning", "Color not set correctly"
         assert isinstance(unique_id, str), "Unique ID not set correctly"
+        assert kwargs["group_name"] == "updates_group", "Group not set correctly"
+
+
+def test_notification_instance_user():
+    """Tests sending a notification to a single user."""
+    with patch.object(NotificationInstance, "_send") as mock_send:
+        NotificationInstance.create_and_send(label="Alert", user_id=5)
+
+        _, kwargs = mock_send.call_args
+        assert kwargs["group_name"] == "updates_user_5", "Group not set correctly"
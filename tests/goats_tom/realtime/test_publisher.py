@@ -0,0 +1,102 @@
+"""Tests for `RealtimePublisher`."""
+
+import threading
+from unittest.mock import patch
+
+from goats_tom.realtime import RealtimePublisher, get_publisher
+
+
+class FakeChannelLayer:
+    """Channel layer that records messages and can hold up sending."""
+
+    def __init__(self):
+        self.messages = []
+        self.release = threading.Event()
+        self.release.set()
+
+    async def group_send(self, group_name, message):
+        while not self.release.is_set():
+            # Poll so the publisher loop is blocked like a slow connection.
+            threading.Event().wait(0.001)
+        self.messages.append((group_name, message))
+
+
+def make_publisher(channel_layer, **kwargs):
+    with patch(
+        "goats_tom.realtime.publisher.get_channel_layer", return_value=channel_layer
+    ):
+        publisher = RealtimePublisher(**kwargs)
+        # Wait for the loop to get the channel layer.
+        publisher.publish("warmup", {"type": "warmup"})
+        assert publisher.flush(5)
+    channel_layer.messages.clear()
+    publisher.sent = 0
+    return publisher
+
+
+def test_publish_sends_messages():
+    """Tests published messages are sent in order."""
+    channel_layer = FakeChannelLayer()
+    publisher = make_publisher(channel_layer)
+
+    publisher.publish("group", {"type": "notification.message", "id": 1})
+    publisher.publish("group", {"type": "notification.message", "id": 2})
+
+    assert publisher.flush(5), "Messages were not sent in time"
+    assert [m["id"] for _, m in channel_layer.messages] == [1, 2]
+    assert publisher.sent == 2
+
+
+def test_publish_coalesces_progress():
+    """Tests pending messages with the same key and group are coalesced."""
+    channel_layer = FakeChannelLayer()
+    publisher = make_publisher(channel_layer)
+    channel_layer.release.clear()
+
+    # The first message is picked up and held, the rest wait in the buffer.
+    publisher.publish("group", {"type": "download.message", "bytes": 0}, key="a")
+    for _ in range(100):
+        if not len(publisher._buffer):
+            break
+        threading.Event().wait(0.01)
+    for downloaded_bytes in range(1, 4):
+        publisher.publish(
+            "group", {"type": "download.message", "bytes": downloaded_bytes}, key="a"
+        )
+    publisher.publish("other", {"type": "download.message", "bytes": 9}, key="a")
+    channel_layer.release.set()
+
+    assert publisher.flush(5), "Messages were not sent in time"
+    assert [(g, m["bytes"]) for g, m in channel_layer.messages] == [
+        ("group", 0),
+        ("group", 3),
+        ("other", 9),
+    ]
+    assert publisher.coalesced == 2
+
+
+def test_get_publisher_shared():
+    """Tests the publisher is shared within a process."""
+    assert get_publisher() is get_publisher()
+
+
+def test_publisher_logs_stats(caplog):
+    """Tests the message counters are logged once the interval has passed."""
+    channel_layer = FakeChannelLayer()
+    publisher = make_publisher(channel_layer)
+
+    with (
+        caplog.at_level("INFO", logger="goats_tom.realtime.publisher"),
+        patch("goats_tom.realtime.publisher.STATS_LOG_INTERVAL", 0),
+    ):
+        publisher.publish("group", {"type": "notification.message", "id": 1})
+        assert publisher.flush(5), "Messages were not sent in time"
+
+    assert "Realtime publisher: 1 sent, 0 failed, 0 dropped, 0 coalesced." in (
+        caplog.text
+    )
+    caplog.clear()
+
+    with caplog.at_level("INFO", logger="goats_tom.realtime.publisher"):
+        publisher.log_stats()
+    assert "1 sent, 0 failed" in caplog.text
@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+import pytest
+from tom_targets.models import Target, TargetName
+from tom_targets.tests.factories import SiderealTargetFactory
+
+from goats_tom.brokers import ANTARESBroker
+from goats_tom.tasks import import_antares_loci
+from goats_tom.tasks.import_antares_loci import import_loci
+
+
+def make_alert(locus_id):
+    return {
+        "locus_id": locus_id,
+        "ra": 1.0,
+        "dec": 2.0,
+        "properties": {
+            "ztf_object_id": f"ZTF_{locus_id}",
+            "newest_alert_observation_time": 60000.0,
+        },
+        "tags": [],
+        "catalogs": [],
+        "alerts": [{"alert_id": "a", "mjd": 60000.0, "properties": {}}],
+    }
+
+
+def fake_fetch_alerts(parameters):
+    """Fetches every locus but "ANT_missing"."""
+    if parameters["locusid"] == "ANT_missing":
+        return iter([])
+    if parameters["locusid"] == "ANT_error":
+        raise ValueError("Failed")
+    return iter([make_alert(parameters["locusid"])])
+
+
+@pytest.fixture()
+def broker():
+    broker = ANTARESBroker()
+    with patch.object(broker, "fetch_alerts", side_effect=fake_fetch_alerts):
+        yield broker
+
+
+@pytest.mark.django_db()
+def test_import_loci(broker):
+    """Test new loci become targets with aliases, known ones are not fetched."""
+    known = SiderealTargetFactory(name="known")
+    TargetName.objects.create(target=known, name="ANT_known")
+    progress = []
+
+    counts = import_loci(
+        ["ANT1", "ANT2", "ANT_known", "ANT_missing", "ANT_error", "ANT1"],
+        broker=broker,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert counts == {"created": 2, "duplicates": 1, "failed": 2}
+    assert Target.objects.get(name="ZTF_ANT1").aliases.filter(name="ANT1").exists()
+    assert Target.objects.filter(name="ZTF_ANT2").exists()
+    fetched = {call.args[0]["locusid"] for call in broker.fetch_alerts.call_args_list}
+    assert "ANT_known" not in fetched
+    assert progress[-1] == (5, 5)
+
+
+@pytest.mark.django_db()
+def test_import_loci_batches(broker):
+    with patch("goats_tom.tasks.import_antares_loci.BATCH_SIZE", 2):
+        progress = []
+        counts = import_loci(
+            [f"ANT{i}" for i in range(5)],
+            broker=broker,
+            on_progress=lambda done, total: progress.append(done),
+        )
+
+    assert counts["created"] == 5
+    assert progress == [2, 4, 5]
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.import_antares_loci.NotificationInstance")
+@patch("goats_tom.tasks.import_antares_loci.DownloadState")
+@patch("goats_tom.tasks.import_antares_loci.import_loci")
+def test_import_antares_loci(mock_import, mock_progress, mock_notification):
+    mock_import.return_value = {"created": 2, "duplicates": 0, "failed": 0}
+
+    import_antares_loci.fn(["ANT1", "ANT2"], user_id=1)
+
+    assert mock_import.call_args.args[0] == ["ANT1", "ANT2"]
+    mock_progress.assert_called_once_with(1)
+    assert mock_progress.return_value.update_and_send.call_args.kwargs["done"]
+    assert (
+        mock_notification.create_and_send.call_args.kwargs["color"] == "success"
+    )
@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import override_settings
+
+from goats_tom.models import PeriodicActorSchedule
+from goats_tom.tasks import periodic_actors as periodic_module
+from goats_tom.tasks.periodic_actors import (
+    PeriodicActors,
+    run_periodic,
+    schedule_periodic_actors,
+)
+
+
+@pytest.fixture()
+def cache():
+    """Isolates the cache from tests running in parallel."""
+    cache = LocMemCache("periodic_actors", {})
+    with patch.object(periodic_module, "cache", cache):
+        yield cache
+
+
+@pytest.fixture()
+def actors(cache):
+    """Registers a periodic actor."""
+    with patch.dict(
+        periodic_module.PERIODIC_ACTORS, {"task": ("TASK_INTERVAL", 60)}, clear=True
+    ):
+        yield
+
+
+@pytest.fixture()
+def mock_run_periodic():
+    with patch.object(periodic_module, "run_periodic") as mock:
+        yield mock
+
+
+@pytest.fixture()
+def mock_actor():
+    actor = MagicMock()
+    with patch.object(periodic_module.dramatiq, "get_broker") as mock_broker:
+        mock_broker.return_value.get_actor.return_value = actor
+        yield actor
+
+
+@pytest.mark.django_db()
+def test_schedule_periodic_actors(actors, mock_run_periodic):
+    PeriodicActorSchedule.objects.create(actor_name="task", token="old")
+
+    schedule_periodic_actors()
+
+    actor_name, token = mock_run_periodic.send.call_args.args
+    assert actor_name == "task"
+    assert token != "old"
+    assert PeriodicActorSchedule.objects.get(actor_name="task").token == token
+
+
+@pytest.mark.django_db()
+@override_settings(TASK_INTERVAL=5)
+def test_run_periodic(actors, mock_run_periodic, mock_actor):
+    """Test the actor is sent and the next run scheduled with the interval."""
+    PeriodicActorSchedule.objects.create(actor_name="task", token="token")
+
+    run_periodic.fn("task", "token")
+
+    mock_actor.send.assert_called_once_with()
+    mock_run_periodic.send_with_options.assert_called_once_with(
+        args=("task", "token"), delay=5000
+    )
+
+
+@pytest.mark.django_db()
+def test_run_periodic_superseded(actors, mock_run_periodic, mock_actor):
+    """Test a superseded schedule stops."""
+    PeriodicActorSchedule.objects.create(actor_name="task", token="new")
+
+    run_periodic.fn("task", "old")
+
+    mock_actor.send.assert_not_called()
+    mock_run_periodic.send_with_options.assert_not_called()
+
+
+@pytest.mark.django_db()
+def test_run_periodic_survives_cache_clear(actors, mock_run_periodic, mock_actor):
+    """Test the schedule does not depend on the cache."""
+    PeriodicActorSchedule.objects.create(actor_name="task", token="token")
+    periodic_module.cache.clear()
+
+    run_periodic.fn("task", "token")
+
+    mock_actor.send.assert_called_once_with()
+    mock_run_periodic.send_with_options.assert_called_once()
+
+
+def test_periodic_actors_middleware_schedules_once(actors):
+    with patch.object(periodic_module, "schedule_periodic_actors") as mock_schedule:
+        middleware = PeriodicActors()
+        middleware.after_worker_boot(MagicMock(), MagicMock())
+        middleware.after_worker_boot(MagicMock(), MagicMock())
+
+    mock_schedule.assert_called_once_with()
@@ -0,0 +1,208 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from astropy.time import Time
+from tom_alerts.models import BrokerQuery
+from tom_targets.models import Target, TargetName
+from tom_targets.tests.factories import SiderealTargetFactory
+
+from goats_tom.brokers import ANTARESBroker
+from goats_tom.models import BrokerQueryPoll
+from goats_tom.tasks import poll_broker_queries
+from goats_tom.tasks.poll_broker_queries import (
+    advance_watermark,
+    build_incremental_query,
+    poll_broker_query,
+)
+
+
+def make_alert(locus_id, ztf_object_id, newest):
+    return {
+        "locus_id": locus_id,
+        "ra": 1.0,
+        "dec": 2.0,
+        "properties": {
+            "ztf_object_id": ztf_object_id,
+            "newest_alert_observation_time": newest,
+        },
+        "tags": [],
+        "catalogs": [],
+        "alerts": [{"alert_id": "a", "mjd": newest, "properties": {}}],
+    }
+
+
+def make_locus(alert):
+    return SimpleNamespace(locus_id=alert["locus_id"], properties=alert["properties"])
+
+
+@pytest.fixture()
+def broker_query():
+    name = "esquery_ANTARES_20240101000000"
+    return BrokerQuery.objects.create(
+        name=name,
+        broker="ANTARES",
+        parameters={"query": {"query": {"term": {"tags": "x"}}}, "query_name": name},
+    )
+
+
+def test_build_incremental_query():
+    query = build_incremental_query({"query": {"term": {"tags": "x"}}}, 60000.5)
+    assert query == {
+        "query": {
+            "bool": {
+                "must": [{"term": {"tags": "x"}}],
+                "filter": [
+                    {
+                        "range": {
+                            "properties.newest_alert_observation_time": {
+                                "gt": 60000.5
+                            }
+                        }
+                    }
+                ],
+            }
+        }
+    }
+    assert build_incremental_query({}, 1.0)["query"]["bool"]["must"] == [
+        {"match_all": {}}
+    ]
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.poll_broker_queries.NotificationInstance")
+def test_poll_broker_query(mock_notification, broker_query):
+    """Test new loci become targets, known ones are skipped and counts are stored."""
+    SiderealTargetFactory(name="ZTF_known")
+    aliased = SiderealTargetFactory(name="other")
+    TargetName.objects.create(target=aliased, name="ANT_aliased")
+    # The first poll starts from when the query was saved.
+    watermark = Time(broker_query.created).mjd
+    alerts = [
+        make_alert("ANT_new", "ZTF_new", watermark + 1),
+        make_alert("ANT_known", "ZTF_known", watermark + 2),
+        make_alert("ANT_aliased", "ZTF_aliased", watermark + 3),
+    ]
+    broker = ANTARESBroker()
+
+    with (
+        patch(
+            "goats_tom.tasks.poll_broker_queries.search",
+            return_value=iter([make_locus(alert) for alert in alerts]),
+        ) as mock_search,
+        patch.object(broker, "hydrate_loci", return_value=alerts),
+    ):
+        poll = poll_broker_query(broker, broker_query)
+
+    assert mock_search.call_args.kwargs["sort"] == (
+        "properties.newest_alert_observation_time"
+    )
+    assert mock_search.call_args.args[0] == build_incremental_query(
+        broker_query.parameters["query"], watermark
+    )
+
+    target = Target.objects.get(name="ZTF_new")
+    assert target.aliases.filter(name="ANT_new").exists()
+    assert not Target.objects.filter(name="ZTF_aliased").exists()
+    assert poll.watermark == pytest.approx(watermark + 3)
+    assert poll.last_num_results == 3
+    assert poll.last_num_created == 1
+    assert poll.last_num_duplicates == 2
+    assert poll.last_num_dropped == 0
+    assert poll.last_latency is not None
+    assert poll.last_error == ""
+    broker_query.refresh_from_db()
+    assert broker_query.last_run == poll.last_polled
+    mock_notification.create_and_send.assert_called_once()
+
+
+@pytest.mark.django_db()
+def test_poll_broker_query_uses_watermark(broker_query):
+    """Test the stored watermark bounds the next poll and is kept without results."""
+    BrokerQueryPoll.objects.create(broker_query=broker_query, watermark=60010.0)
+    broker = ANTARESBroker()
+
+    with patch(
+        "goats_tom.tasks.poll_broker_queries.search", return_value=iter([])
+    ) as mock_search:
+        poll = poll_broker_query(broker, broker_query)
+
+    query = mock_search.call_args.args[0]
+    assert query["query"]["bool"]["filter"][0]["range"][
+        "properties.newest_alert_observation_time"
+    ] == {"gt": 60010.0}
+    assert poll.watermark == 60010.0
+    assert poll.last_num_results == 0
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.poll_broker_queries.NotificationInstance")
+def test_poll_broker_query_dropped_loci(mock_notification, broker_query):
+    """Test the watermark stops before loci whose alerts could not be fetched."""
+    BrokerQueryPoll.objects.create(broker_query=broker_query, watermark=60000.0)
+    alerts = [
+        make_alert("ANT_1", "ZTF_1", 60001.0),
+        make_alert("ANT_2", "ZTF_2", 60002.0),
+        make_alert("ANT_dropped", "ZTF_dropped", 60003.0),
+        make_alert("ANT_4", "ZTF_4", 60004.0),
+    ]
+    broker = ANTARESBroker()
+
+    with (
+        patch(
+            "goats_tom.tasks.poll_broker_queries.search",
+            return_value=iter([make_locus(alert) for alert in alerts]),
+        ),
+        patch.object(
+            broker, "hydrate_loci", return_value=[alerts[0], alerts[1], alerts[3]]
+        ),
+    ):
+        poll = poll_broker_query(broker, broker_query)
+
+    assert poll.watermark == 60002.0
+    assert poll.last_num_results == 4
+    assert poll.last_num_created == 3
+    assert poll.last_num_dropped == 1
+
+
+def test_advance_watermark():
+    loci = [
+        make_locus(make_alert("ANT_1", "ZTF_1", 60001.0)),
+        make_locus(make_alert("ANT_2", "ZTF_2", 60002.0)),
+        make_locus(make_alert("ANT_3", "ZTF_3", 60002.0)),
+    ]
+    assert advance_watermark(60000.0, loci, {"ANT_1", "ANT_2", "ANT_3"}) == 60002.0
+    # Loci as new as a dropped locus are polled again with it.
+    assert advance_watermark(60000.0, loci, {"ANT_1", "ANT_2"}) == 60001.0
+    assert advance_watermark(60000.0, loci, set()) == 60000.0
+
+
+@pytest.mark.django_db()
+def test_poll_broker_query_records_error(broker_query):
+    broker = ANTARESBroker()
+
+    with patch(
+        "goats_tom.tasks.poll_broker_queries.search", side_effect=ValueError("Failed")
+    ):
+        with pytest.raises(ValueError):
+            poll_broker_query(broker, broker_query)
+
+    poll = BrokerQueryPoll.objects.get(broker_query=broker_query)
+    assert poll.last_error == "Failed"
+    assert poll.watermark is None
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.poll_broker_queries.poll_broker_query")
+def test_poll_broker_queries(mock_poll, broker_query):
+    """Test only queries saved from the extension are polled, despite failures."""
+    BrokerQuery.objects.create(name="manual", broker="ANTARES", parameters={})
+    second = BrokerQuery.objects.create(
+        name="esquery_ANTARES_20240102000000", broker="ANTARES", parameters={}
+    )
+    mock_poll.side_effect = [ValueError("Failed"), None]
+
+    poll_broker_queries.fn()
+
+    polled = [call.args[1] for call in mock_poll.call_args_list]
+    assert sorted(query.pk for query in polled) == [broker_query.pk, second.pk]
@@ -0,0 +1,135 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from tom_dataproducts.models import DataProduct, ReducedDatum
+from tom_observations.tests.factories import ObservingRecordFactory
+from tom_targets.tests.factories import SiderealTargetFactory
+
+from goats_tom.tasks import publish_dataproducts
+from goats_tom.tests.factories import DataProductFactory, DRAGONSRunFactory
+
+TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def run():
+    """Creates a run with a target."""
+    target = SiderealTargetFactory()
+    return DRAGONSRunFactory(
+        observation_record=ObservingRecordFactory(target_id=target.id)
+    )
+
+
+def fake_process_data_product(dp):
+    """Processes every file but "bad.fits" into a single datum."""
+    if dp.product_id.endswith("bad.fits"):
+        raise ValueError("Bad file.")
+    return [(TIMESTAMP, {"product_id": dp.product_id}, "")], "spectroscopy"
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.publish_dataproducts.NotificationInstance")
+@patch("goats_tom.tasks.publish_dataproducts.PublishProgress")
+@patch(
+    "goats_tom.tasks.publish_dataproducts.process_data_product",
+    side_effect=fake_process_data_product,
+)
+def test_publish_dataproducts(_, mock_progress, mock_notification, run):
+    """Test files are published, skipped or removed on failure with their status."""
+    DataProductFactory(product_id="run/outputs/old.fits")
+    files = [
+        {"filepath": "run/outputs", "filename": filename}
+        for filename in ["a.fits", "b.fits", "old.fits", "bad.fits"]
+    ]
+
+    publish_dataproducts.fn(run.pk, files, user_id=1)
+
+    published = DataProduct.objects.filter(observation_record=run.observation_record)
+    assert sorted(dp.product_id for dp in published) == [
+        "run/outputs/a.fits",
+        "run/outputs/b.fits",
+    ]
+    assert all(dp.metadata.processed for dp in published)
+    assert ReducedDatum.objects.filter(data_product__in=published).count() == 2
+    assert not DataProduct.objects.filter(product_id="run/outputs/bad.fits").exists()
+
+    statuses = {
+        call.args[1]: call.args[2] for call in mock_progress.send.call_args_list
+    }
+    assert statuses == {
+        "run/outputs/a.fits": "done",
+        "run/outputs/b.fits": "done",
+        "run/outputs/old.fits": "skipped",
+        "run/outputs/bad.fits": "error",
+    }
+    summary = mock_notification.create_and_send.call_args.kwargs
+    assert summary["message"] == (
+        "Published 2 files, skipped 1 already published and failed 1."
+    )
+    assert summary["user_id"] == 1
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.publish_dataproducts.NotificationInstance")
+@patch("goats_tom.tasks.publish_dataproducts.PublishProgress")
+@patch(
+    "goats_tom.tasks.publish_dataproducts.process_data_product",
+    side_effect=fake_process_data_product,
+)
+def test_publish_dataproducts_failing_hook(_, mock_progress, mock_notification, run):
+    """Test a failing hook only fails its file."""
+    files = [
+        {"filepath": "run/outputs", "filename": filename}
+        for filename in ["a.fits", "hook.fits"]
+    ]
+
+    def fake_run_hook(name, dp):
+        if dp.product_id.endswith("hook.fits"):
+            raise ValueError("Hook failed.")
+
+    with patch(
+        "goats_tom.tasks.publish_dataproducts.run_hook", side_effect=fake_run_hook
+    ):
+        publish_dataproducts.fn(run.pk, files)
+
+    assert list(DataProduct.objects.values_list("product_id", flat=True)) == [
+        "run/outputs/a.fits"
+    ]
+    summary = mock_notification.create_and_send.call_args.kwargs
+    assert summary["message"] == (
+        "Published 1 files, skipped 0 already published and failed 1."
+    )
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.publish_dataproducts.NotificationInstance")
+@patch("goats_tom.tasks.publish_dataproducts.PublishProgress")
+@patch(
+    "goats_tom.tasks.publish_dataproducts.process_data_product",
+    side_effect=fake_process_data_product,
+)
+def test_publish_dataproducts_conflicting_batch(
+    _, mock_progress, mock_notification, run
+):
+    """Test a batch conflicting with another publish is retried one file at a time."""
+    files = [
+        {"filepath": "run/outputs", "filename": filename}
+        for filename in ["a.fits", "b.fits"]
+    ]
+    # Another request publishes a file after the check for published files.
+    DataProductFactory(product_id="run/outputs/a.fits")
+
+    with patch.object(
+        DataProduct.objects, "filter", return_value=DataProduct.objects.none()
+    ):
+        publish_dataproducts.fn(run.pk, files)
+
+    statuses = {
+        call.args[1]: call.args[2] for call in mock_progress.send.call_args_list
+    }
+    assert statuses == {
+        "run/outputs/a.fits": "skipped",
+        "run/outputs/b.fits": "done",
+    }
+    assert DataProduct.objects.get(product_id="run/outputs/b.fits").metadata.processed
@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import User
+from tom_observations.models import ObservationRecord
+from tom_observations.tests.factories import ObservingRecordFactory
+from tom_targets.tests.factories import SiderealTargetFactory
+
+from goats_tom.models import ObservationRecordStatus
+from goats_tom.tasks import (
+    refresh_observation_statuses,
+    refresh_target_observation_statuses,
+)
+from goats_tom.tasks.refresh_observation_statuses import refresh_statuses
+
+
+def make_status(state):
+    return {"state": state, "scheduled_start": None, "scheduled_end": None}
+
+
+def fake_get_observation_statuses(observation_ids):
+    return {
+        observation_id: make_status("Observed")
+        for observation_id in observation_ids
+        if not observation_id.endswith("-9")
+    }
+
+
+@pytest.fixture()
+def target():
+    return SiderealTargetFactory.create()
+
+
+def create_record(target, observation_id, status="READY", user=None):
+    return ObservingRecordFactory.create(
+        target_id=target.id,
+        facility="GEM",
+        observation_id=observation_id,
+        status=status,
+        user=user,
+    )
+
+
+@pytest.mark.django_db()
+@patch(
+    "goats_tom.facilities.GOATSGEMFacility.get_observation_statuses",
+    side_effect=fake_get_observation_statuses,
+)
+def test_refresh_statuses(mock_statuses, target):
+    pending = create_record(target, "GS-2023B-Q-102-3")
+    terminal = create_record(target, "GS-2023B-Q-102-4", status="ON_HOLD")
+    failing = create_record(target, "GS-2023B-Q-102-9")
+
+    with patch(
+        "goats_tom.facilities.GOATSGEMFacility.get_observation_status",
+        side_effect=ValueError("Failed"),
+    ):
+        failed = refresh_statuses(ObservationRecord.objects.all())
+
+    # The records are sent as a single batch, skipping terminal ones.
+    mock_statuses.assert_called_once()
+    assert sorted(mock_statuses.call_args.args[0]) == [
+        pending.observation_id,
+        failing.observation_id,
+    ]
+    assert failed == [(failing.observation_id, "Failed")]
+
+    pending.refresh_from_db()
+    terminal.refresh_from_db()
+    assert pending.status == "Observed"
+    assert terminal.status == "ON_HOLD"
+    assert pending.status_refresh.last_refreshed is not None
+    assert pending.status_refresh.last_error == ""
+    failing_status = ObservationRecordStatus.objects.get(observation_record=failing)
+    assert failing_status.last_refreshed is None
+    assert failing_status.last_error == "Failed"
+    assert not ObservationRecordStatus.objects.filter(
+        observation_record=terminal
+    ).exists()
+
+
+@pytest.mark.django_db()
+@patch(
+    "goats_tom.facilities.GOATSGEMFacility.get_observation_statuses",
+    side_effect=fake_get_observation_statuses,
+)
+def test_refresh_statuses_batches(mock_statuses, target):
+    for i in range(5):
+        create_record(target, f"GS-2023B-Q-102-{i}")
+    progress = []
+
+    with patch("goats_tom.tasks.refresh_observation_statuses.BATCH_SIZE", 2):
+        failed = refresh_statuses(
+            ObservationRecord.objects.all(),
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+    assert failed == []
+    assert mock_statuses.call_count == 3
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+
+
+@pytest.mark.django_db()
+def test_refresh_statuses_per_user(target):
+    """Test each record is refreshed with the credentials of its user."""
+    alice = User.objects.create(username="alice")
+    bob = User.objects.create(username="bob")
+    create_record(target, "GS-2023B-Q-102-1", user=alice)
+    create_record(target, "GS-2023B-Q-102-2", user=bob)
+    create_record(target, "GS-2023B-Q-102-3", user=alice)
+    users_by_ids = {}
+
+    def get_observation_statuses(self, observation_ids):
+        users_by_ids[tuple(sorted(observation_ids))] = self.user
+        return fake_get_observation_statuses(observation_ids)
+
+    with patch(
+        "goats_tom.facilities.GOATSGEMFacility.get_observation_statuses",
+        autospec=True,
+        side_effect=get_observation_statuses,
+    ):
+        assert refresh_statuses(ObservationRecord.objects.all()) == []
+        assert users_by_ids == {
+            ("GS-2023B-Q-102-1", "GS-2023B-Q-102-3"): alice,
+            ("GS-2023B-Q-102-2",): bob,
+        }
+
+        # A requesting user overrides the users of the records.
+        users_by_ids.clear()
+        ObservationRecord.objects.update(status="READY")
+        refresh_statuses(ObservationRecord.objects.all(), user=bob)
+        assert list(users_by_ids.values()) == [bob]
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.refresh_observation_statuses.refresh_statuses", return_value=[])
+def test_refresh_observation_statuses(mock_refresh):
+    refresh_observation_statuses.fn()
+    mock_refresh.assert_called_once()
+
+
+@pytest.mark.django_db()
+@patch("goats_tom.tasks.refresh_observation_statuses.NotificationInstance")
+@patch("goats_tom.tasks.refresh_observation_statuses.DownloadState")
+@patch("goats_tom.tasks.refresh_observation_statuses.refresh_statuses", return_value=[])
+def test_refresh_target_observation_statuses(
+    mock_refresh, mock_progress, mock_notification, target
+):
+    create_record(target, "GS-2023B-Q-102-3")
+    other = SiderealTargetFactory.create()
+    create_record(other, "GS-2023B-Q-102-4")
+
+    refresh_target_observation_statuses.fn(target.id)
+
+    records = mock_refresh.call_args.args[0]
+    assert [record.target_id for record in records] == [target.id]
+    mock_progress.return_value.update_and_send.assert_called_with(
+        status="Done",
+        message="Observation statuses refreshed, reload the page to see them.",
+        done=True,
+    )
+    assert mock_notification.create_and_send.call_args.kwargs["color"] == "success"
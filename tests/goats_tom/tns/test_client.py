@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from goats_tom.tns import TNSClient
+from goats_tom.tns import client as client_module
 
 
 @pytest.fixture
@@ -13,6 +14,16 @@ def tns_html() -> Path:
     return Path(__file__).parent.parent.parent / "data" / "tns-20250123.html"
 
 
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    """Clears the TNS cache and disables the rate limit between tests."""
+    client_module._get_cache().clear()
+    monkeypatch.setattr(TNSClient, "_rate_limiters", {})
+    monkeypatch.setattr(TNSClient, "MIN_REQUEST_INTERVAL", 0.0)
+    yield
+    client_module._get_cache().clear()
+
+
 @pytest.fixture
 def client() -> TNSClient:
     """Returns a TNSClient instance for tests."""
@@ -106,6 +117,53 @@ def test_get_object_http_error(monkeypatch, client: TNSClient) -> None:
     with pytest.raises(requests.HTTPError):
         client.get_object("non_existent_object")
 
+def test_get_object_cached(monkeypatch, client: TNSClient, tns_html: Path) -> None:
+    """Test that get_object only requests an object once while it is cached."""
+    mock_response = MagicMock()
+    mock_response.text = tns_html.read_text(encoding="utf-8")
+    mock_get = MagicMock(return_value=mock_response)
+    monkeypatch.setattr(client._session, "get", mock_get)
+
+    first = client.get_object("2025zt")
+    second = TNSClient().get_object(" 2025zt ")
+    assert first == second
+    assert mock_get.call_count == 1
+
+    client.get_object("2025zt", use_cache=False)
+    assert mock_get.call_count == 2
+
+
+def test_get_objects(monkeypatch, client: TNSClient, tns_html: Path) -> None:
+    """Test that get_objects returns None for the objects that can't be retrieved."""
+    html = tns_html.read_text(encoding="utf-8")
+
+    def mock_get(url, timeout=5):
+        response = MagicMock()
+        response.text = html
+        if url.endswith("missing"):
+            response.raise_for_status.side_effect = requests.HTTPError("Not Found")
+        return response
+
+    monkeypatch.setattr(client._session, "get", mock_get)
+
+    results = client.get_objects(["2025zt", "missing", "2025zt"])
+    assert list(results) == ["2025zt", "missing"]
+    assert results["2025zt"]["name"] == "AT 2025zt"
+    assert results["missing"] is None
+
+
+def test_rate_limiter_spaces_requests(monkeypatch) -> None:
+    """Test that the rate limiter reserves consecutive slots for waiting threads."""
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+
+    limiter = client_module._RateLimiter(0.5)
+    for _ in range(3):
+        limiter.wait()
+    assert sleeps == [0.5, 1.0]
+
+
 @pytest.mark.remote_data()
 def test_remote_get_object_success(client: TNSClient) -> None:
     result = client.get_object("2025zt")
@@ -0,0 +1,82 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import caches
+
+from goats_tom.utils import (
+    get_astrodata_descriptors,
+    read_astrodata_descriptors,
+    serialize_descriptor_value,
+)
+from goats_tom.utils.astrodata_header import HEADER_CACHE_ALIAS
+
+
+@pytest.fixture(autouse=True)
+def clear_header_cache():
+    caches[HEADER_CACHE_ALIAS].clear()
+    yield
+    caches[HEADER_CACHE_ALIAS].clear()
+
+
+@pytest.fixture
+def mock_ad():
+    ad = MagicMock()
+    ad.descriptors = ("exposure_time", "ut_date", "gain", "broken")
+    ad.exposure_time.return_value = 30.0
+    ad.ut_date.return_value = datetime.date(2024, 1, 2)
+    ad.gain.return_value = [1.0, 2.0]
+    ad.broken.side_effect = ValueError("bad descriptor")
+    return ad
+
+
+@pytest.fixture
+def fits_file(tmp_path):
+    file_path = tmp_path / "test.fits"
+    file_path.write_bytes(b"SIMPLE")
+    return file_path
+
+
+def test_serialize_descriptor_value():
+    assert serialize_descriptor_value(1.5) == 1.5
+    assert serialize_descriptor_value(None) is None
+    assert serialize_descriptor_value(datetime.date(2024, 1, 2)) == "2024-01-02"
+    assert serialize_descriptor_value((1, 2)) == "(1, 2)"
+
+
+def test_read_astrodata_descriptors(mock_ad, fits_file):
+    with patch("goats_tom.utils.astrodata_header.astrodata.open", return_value=mock_ad):
+        descriptors = read_astrodata_descriptors(fits_file)
+
+    assert descriptors == {
+        "exposure_time": 30.0,
+        "ut_date": "2024-01-02",
+        "gain": "[1.0, 2.0]",
+    }
+
+
+def test_get_astrodata_descriptors_uses_cache(mock_ad, fits_file):
+    with patch(
+        "goats_tom.utils.astrodata_header.astrodata.open", return_value=mock_ad
+    ) as mock_open:
+        first = get_astrodata_descriptors(fits_file)
+        second = get_astrodata_descriptors(fits_file)
+
+    assert first == second
+    mock_open.assert_called_once()
+
+
+def test_get_astrodata_descriptors_reads_modified_file(mock_ad, fits_file):
+    with patch(
+        "goats_tom.utils.astrodata_header.astrodata.open", return_value=mock_ad
+    ) as mock_open:
+        get_astrodata_descriptors(fits_file)
+        fits_file.write_bytes(b"SIMPLE = T")
+        get_astrodata_descriptors(fits_file)
+
+    assert mock_open.call_count == 2
+
+
+def test_get_astrodata_descriptors_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        get_astrodata_descriptors(tmp_path / "missing.fits")
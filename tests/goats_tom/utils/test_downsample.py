@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from goats_tom.utils import downsample
+from goats_tom.utils.downsample import downsample_lttb, downsample_min_max
+
+
+def test_downsample_min_max_keeps_extremes():
+    """Tests the minimum and maximum of every bin are kept."""
+    y = np.zeros(1000)
+    y[123] = 10
+    y[789] = -10
+
+    indices = downsample_min_max(y, 10)
+
+    assert len(indices) <= 20
+    assert 123 in indices
+    assert 789 in indices
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_downsample_lttb_keeps_ends_and_peaks():
+    """Tests the first, last and peak points are kept."""
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    y[500] = 100
+
+    indices = downsample_lttb(x, y, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert 500 in indices
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_downsample_small_series_unchanged():
+    """Tests series smaller than the width are not downsampled."""
+    x = np.array([3.0, 1.0, 2.0])
+    y = np.array([1.0, np.nan, 3.0])
+
+    assert downsample(x, y, 100, "lttb").tolist() == [2, 0]
+    assert downsample(x, y, 100, "minmax").tolist() == [2, 0]
+
+
+def test_downsample_unsupported_method():
+    """Tests an unsupported method raises an error."""
+    with pytest.raises(ValueError):
+        downsample(np.arange(3.0), np.arange(3.0), 2, "mean")
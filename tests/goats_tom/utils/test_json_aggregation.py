@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+import pytest
+from django.test import AsyncRequestFactory, RequestFactory
+
+from goats_tom.utils import (
+    RawJSON,
+    evaluate_first,
+    iter_json,
+    iter_json_object,
+    streaming_json_response,
+)
+
+
+def test_iter_json_matches_json_dumps():
+    value = {"a": [1, 2.5, None], "b": {"c": True}, "d": "text"}
+
+    assert json.loads("".join(iter_json(value))) == value
+
+
+def test_iter_json_emits_raw_json_verbatim():
+    value = {"files": RawJSON('[{"id":1}]'), "count": 1}
+
+    assert "".join(iter_json(value)) == '{"files":[{"id":1}],"count":1}'
+
+
+def test_iter_json_object_coerces_keys_like_json_dumps():
+    items = [(None, 1), (10.0, 2), (3, 3), (True, 4), ("x", 5)]
+
+    assert "".join(iter_json_object(items)) == json.dumps(
+        dict(items), separators=(",", ":")
+    )
+
+
+def test_iter_json_object_empty():
+    assert "".join(iter_json_object(iter([]))) == "{}"
+
+
+def test_evaluate_first_raises_eagerly():
+    def items():
+        raise ValueError("Failed")
+        yield
+
+    with pytest.raises(ValueError):
+        evaluate_first(items())
+
+
+def test_evaluate_first_keeps_items():
+    assert list(evaluate_first(iter([1, 2, 3]))) == [1, 2, 3]
+    assert list(evaluate_first(iter([]))) == []
+
+
+def test_streaming_json_response_wsgi():
+    response = streaming_json_response(RequestFactory().get("/"), iter(["{", "}"]))
+
+    assert not response.is_async
+    assert b"".join(response.streaming_content) == b"{}"
+
+
+def test_streaming_json_response_asgi():
+    chunks = iter_json_object((str(i), i) for i in range(1000))
+    response = streaming_json_response(AsyncRequestFactory().get("/"), chunks)
+
+    async def consume():
+        return [chunk async for chunk in response.streaming_content]
+
+    assert response.is_async
+    parts = asyncio.run(consume())
+    assert len(parts) > 1
+    assert json.loads(b"".join(parts)) == {str(i): i for i in range(1000)}
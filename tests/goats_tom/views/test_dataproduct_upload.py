@@ -0,0 +1,51 @@
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from tom_dataproducts.models import DataProduct, ReducedDatum
+from tom_targets.tests.factories import SiderealTargetFactory
+
+from goats_tom.models import ReducedDatumHash
+from goats_tom.tests.factories import UserFactory
+
+PHOTOMETRY = b"time,filter,magnitude,error\n59000.0,r,15.5,0.1\n59001.0,r,15.6,0.1\n"
+
+
+class TestDataProductUploadView(APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_login(self.user)
+        self.target = SiderealTargetFactory.create()
+
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def upload(self, filename):
+        return self.client.post(
+            reverse("upload"),
+            {
+                "target": self.target.pk,
+                "data_product_type": "photometry",
+                "referrer": "/",
+                "files": SimpleUploadedFile(filename, PHOTOMETRY),
+            },
+            format="multipart",
+        )
+
+    def test_upload_twice_skips_duplicates(self):
+        """Test uploading the same photometry twice stores its data once."""
+        self.upload("photometry.csv")
+        # The product ID is the file path, so the copy has another name.
+        self.upload("photometry_copy.csv")
+
+        self.assertEqual(DataProduct.objects.filter(target=self.target).count(), 2)
+        self.assertEqual(ReducedDatum.objects.filter(target=self.target).count(), 2)
+        # Uploaded data are hashed as they are stored.
+        self.assertEqual(
+            ReducedDatumHash.objects.filter(target=self.target).count(), 2
+        )
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from tom_targets.tests.factories import SiderealTargetFactory
+
+from goats_tom.tests.factories import UserFactory
+
+
+class TestTargetDetailView(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.target = SiderealTargetFactory.create()
+        self.url = reverse("targets:detail", kwargs={"pk": self.target.pk})
+
+    @patch("goats_tom.views.target_detail.refresh_target_observation_statuses")
+    def test_update_status_refreshes_in_background(self, mock_refresh):
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url, {"update_status": True})
+
+        mock_refresh.send.assert_called_once_with(self.target.pk, self.user.id)
+        self.assertRedirects(
+            response,
+            reverse("tom_targets:detail", args=(self.target.pk,)) + "?tab=observations",
+            fetch_redirect_response=False,
+        )
+
+    @patch("goats_tom.views.target_detail.refresh_target_observation_statuses")
+    def test_update_status_requires_login(self, mock_refresh):
+        response = self.client.get(self.url, {"update_status": True})
+
+        mock_refresh.send.assert_not_called()
+        self.assertRedirects(response, reverse("login"), fetch_redirect_response=False)